@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Compares the cost of a tick of many falling entities as sprites and in the entity store.
+
+For every entity count, the sprites are moved and culled by ``Group.update()``, collided with
+the hero rect by ``pygame.sprite.spritecollide`` and placed between their previous and current
+positions for a drawn frame, with one Python call per entity. The same entities in an
+EntityStore are moved, culled and collided by vectorized array operations, and their
+interpolated positions are read from the arrays. Culled entities are respawned at the top,
+so the count holds.
+
+Usage: python benchmarks/bench_entitystore.py [--counts 10 100 1000 5000 10000] [--ticks 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.extend([str(PROJECT_ROOT), os.path.join(PROJECT_ROOT, 'src')])
+
+import pygame
+
+from src.entitystore import EntityStore
+
+WIDTH: int = 1024
+HEIGHT: int = 768
+SIZE: int = 64
+
+
+class Entity(pygame.sprite.Sprite):
+    """An entity of the size of the game sprites, falling by its speed and culled below the window."""
+
+    def __init__(self, x: int, y: int, speed: int) -> None:
+        super().__init__()
+        self.rect = pygame.Rect(x, y, SIZE, SIZE)
+        self.speed = speed
+        self.value = speed
+        self.previous_position = None
+
+    def save_position(self) -> None:
+        self.previous_position = self.rect.topleft
+
+    def interpolated_position(self, alpha: float) -> tuple[int, int]:
+        x, y = self.previous_position
+        return round(x + (self.rect.x - x) * alpha), round(y + (self.rect.y - y) * alpha)
+
+    def update(self) -> None:
+        self.rect.y += self.speed
+        if self.rect.top > HEIGHT:
+            self.kill()
+
+
+def spawn(rng: random.Random, top: bool = False) -> Entity:
+    """Returns an entity at a random position of the window, or above it if top."""
+    return Entity(rng.randrange(WIDTH), -SIZE if top else rng.randrange(-SIZE, HEIGHT), rng.randint(3, 7))
+
+
+def tick_sprites(group: pygame.sprite.Group, count: int, hero: pygame.sprite.Sprite, rng: random.Random) -> None:
+    """Runs a tick of the entities as sprites."""
+    for sprite in group:
+        sprite.save_position()
+    group.update()
+    pygame.sprite.spritecollide(hero, group, False)
+    while len(group.spritedict) < count:
+        entity = spawn(rng, True)
+        entity.save_position()
+        group.add(entity)
+    [(sprite, sprite.interpolated_position(0.5)) for sprite in group]
+
+
+def tick_store(group: pygame.sprite.Group, count: int, hero: pygame.sprite.Sprite, rng: random.Random) -> None:
+    """Runs a tick of the entities in the store."""
+    store: EntityStore = group.store
+    for sprite in store.step():
+        sprite.kill()
+    group.collide(hero.rect)
+    while len(group.spritedict) < count:
+        group.add(spawn(rng, True))
+    store.positions(0.5)
+
+
+def per_tick_ms(tick, group: pygame.sprite.Group, count: int, ticks: int) -> float:
+    """Returns the average time of a tick in milliseconds."""
+    hero = pygame.sprite.Sprite()
+    hero.rect = pygame.Rect(WIDTH // 2, HEIGHT - 2 * SIZE, SIZE, SIZE)
+    rng = random.Random(count)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        tick(group, count, hero, rng)
+    return (time.perf_counter() - start) / ticks * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 5000, 10000])
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'entities':>9} | {'sprites (ms)':>12} | {'store (ms)':>12} | {'speedup':>8}")
+    for count in args.counts:
+        rng = random.Random(count)
+        entities = [spawn(rng) for _ in range(count)]
+        sprites = per_tick_ms(tick_sprites, pygame.sprite.Group(entities), count, args.ticks)
+
+        rng = random.Random(count)
+        store = EntityStore(HEIGHT)
+        arrays = per_tick_ms(tick_store, store.group(*[spawn(rng) for _ in range(count)]), count, args.ticks)
+        print(f"{count:>9} | {sprites:>12.3f} | {arrays:>12.3f} | {sprites / arrays:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
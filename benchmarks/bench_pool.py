@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Counts the garbage collections of a long headless session with and without the entity pools.
+
+The game world is stepped headless with random input for the given number of simulated minutes,
+restarted whenever it is over, once with the monster, coin and jewel pools disabled and once
+with them enabled. Every collection run by the garbage collector is counted per generation,
+along with the time spent in them.
+
+Usage: python benchmarks/bench_pool.py [--minutes 10] [--seed 1]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.extend([str(PROJECT_ROOT), os.path.join(PROJECT_ROOT, 'src')])
+
+from src.headless import use_dummy_drivers
+
+use_dummy_drivers()
+
+from src.constants import POOL_HIGH_WATER, SIM_RATE
+from src.world import World
+from src.inputs import COMMAND_RESTART, RandomInput
+
+
+class CollectionCounter:
+    """Counts the collections of every generation and the time spent in them, through gc.callbacks."""
+
+    def __init__(self) -> None:
+        self.counts = [0, 0, 0]
+        self.pause_ms = 0.0
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.counts[info["generation"]] += 1
+            self.pause_ms += (time.perf_counter() - self._start) * 1000
+
+
+def session(ticks: int, seed: int, high_water: int) -> tuple[CollectionCounter, dict[str, dict[str, int]]]:
+    """Plays a session of ticks and returns its collections and the pool stats."""
+    world = World(seed=seed)
+    for pool in (world.monster_pool, world.coin_pool, world.jewel_pool):
+        pool.high_water = high_water
+    keys = RandomInput(seed)
+    gc.collect()
+    counter = CollectionCounter()
+    gc.callbacks.append(counter)
+    try:
+        for tick in range(ticks):
+            world.step(world.timestep.time, keys(tick), COMMAND_RESTART if world.game_over else 0)
+            world.timestep.tick()
+    finally:
+        gc.callbacks.remove(counter)
+    return counter, world.pool_stats()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minutes", type=float, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    ticks: int = int(args.minutes * 60 * SIM_RATE)
+
+    print(f"{ticks} ticks, {args.minutes:g} simulated minutes")
+    print(f"{'pools':>8} | {'gen 0':>7} {'gen 1':>7} {'gen 2':>7} | {'pause (ms)':>10} | {'created':>8} {'reused':>8}")
+    for label, high_water in (("off", 0), ("on", POOL_HIGH_WATER)):
+        counter, stats = session(ticks, args.seed, high_water)
+        created: int = sum(pool["created"] for pool in stats.values())
+        reused: int = sum(pool["reused"] for pool in stats.values())
+        print(f"{label:>8} | {counter.counts[0]:>7} {counter.counts[1]:>7} {counter.counts[2]:>7}"
+              f" | {counter.pause_ms:>10.1f} | {created:>8} {reused:>8}")
+
+
+if __name__ == "__main__":
+    main()
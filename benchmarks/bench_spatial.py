@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Compares the cost of the collision queries of the game with a linear scan and with the spatial grid.
+
+For every entity count, the entities are spread over an area growing with their number, so the
+density, like in a scrolling level with more on-screen content, stays the same. The spawn check
+(``is_positionable``) and the hero collision query are timed against ``pygame.sprite``'s linear
+scans and against a SpatialGroup, along with the cost of moving every entity by one tick.
+
+Usage: python benchmarks/bench_spatial.py [--counts 10 100 1000 5000] [--queries 2000]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.extend([str(PROJECT_ROOT), os.path.join(PROJECT_ROOT, 'src')])
+
+import pygame
+
+from src.spatial import SpatialGroup
+
+# the spacing of the entities, about the density of a crowded screen
+SPACING: int = 120
+SIZE: int = 64
+
+
+class Entity(pygame.sprite.Sprite):
+    """An entity of the size of the game sprites, falling by its speed on every update."""
+
+    def __init__(self, x: int, y: int, speed: int) -> None:
+        super().__init__()
+        self.rect = pygame.Rect(x, y, SIZE, SIZE)
+        self.speed = speed
+
+    def update(self) -> None:
+        self.rect.y += self.speed
+
+
+def populate(group: pygame.sprite.Group, count: int, side: int, rng: random.Random) -> None:
+    """Adds count entities at random positions of a square area."""
+    for _ in range(count):
+        group.add(Entity(rng.randrange(side), rng.randrange(side), rng.randint(3, 7)))
+
+
+def per_query_us(query, rects: list[pygame.Rect]) -> float:
+    """Returns the average time of a query in microseconds."""
+    start = time.perf_counter()
+    for rect in rects:
+        query(rect)
+    return (time.perf_counter() - start) / len(rects) * 1e6
+
+
+def per_update_us(group: pygame.sprite.Group, count: int, repeats: int = 5) -> float:
+    """Returns the average time of a group update per entity in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        group.update()
+    return (time.perf_counter() - start) / repeats / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 5000, 10000])
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'entities':>9} | {'spawn check (us)':>21} | {'hero query (us)':>21} | {'update/entity (us)':>21}")
+    print(f"{'':>9} | {'linear':>10} {'grid':>10} | {'linear':>10} {'grid':>10} | {'linear':>10} {'grid':>10}")
+    for count in args.counts:
+        side: int = int(math.sqrt(count) * SPACING)
+        rng = random.Random(count)
+        linear = pygame.sprite.Group()
+        populate(linear, count, side, rng)
+        grid = SpatialGroup()
+        grid.add(*linear.sprites())
+
+        rects = [pygame.Rect(rng.randrange(side), rng.randrange(side), SIZE, SIZE) for _ in range(args.queries)]
+        probe = pygame.sprite.Sprite()
+
+        def linear_any(rect: pygame.Rect) -> bool:
+            probe.rect = rect
+            return pygame.sprite.spritecollideany(probe, linear) is not None
+
+        def linear_all(rect: pygame.Rect) -> list:
+            probe.rect = rect
+            return pygame.sprite.spritecollide(probe, linear, False)
+
+        print(f"{count:>9} | {per_query_us(linear_any, rects):>10.2f} {per_query_us(grid.collideany, rects):>10.2f}"
+              f" | {per_query_us(linear_all, rects):>10.2f} {per_query_us(grid.collide, rects):>10.2f}"
+              f" | {per_update_us(pygame.sprite.Group(linear.sprites()), count):>10.2f}"
+              f" {per_update_us(grid, count):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
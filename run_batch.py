@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+import argparse
+import csv
+import sys
+import os
+import time
+from pathlib import Path
+
+# Obtain the root directory of the project
+PROJECT_ROOT = Path(__file__).parent.absolute()
+SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+
+# Add the project root and src directory to the sys.path
+sys.path.extend([str(PROJECT_ROOT), SRC_PATH])
+
+# The dummy drivers must be selected before pygame opens the window and the mixer
+from src.headless import use_dummy_drivers
+use_dummy_drivers()
+
+from src.batch import RESULT_FIELDS, TUNABLES, parameter_sets, parse_overrides, sweep
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hero vs Monsters, many seeded headless games played on every core to compare gameplay constants")
+    parser.add_argument("--runs", type=int, default=100,
+                        help="the number of games played with every combination of the swept constants")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="the seed of the first game of every combination, the others using the following seeds")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=V1,V2,...",
+                        help=f"the values swept for a constant, one of {', '.join(TUNABLES)}; repeat to sweep several")
+    parser.add_argument("--input", default="random",
+                        help="the input of every game: idle, random, script:FILE or replay:FILE")
+    parser.add_argument("--max-ticks", type=int, default=30000,
+                        help="the maximum number of ticks of a game, which stops earlier when it is over")
+    parser.add_argument("--workers", type=int,
+                        help="the number of worker processes, one per CPU by default")
+    parser.add_argument("--csv", type=argparse.FileType("w", encoding="utf-8"),
+                        help="write the result of every game to a CSV file")
+    args = parser.parse_args()
+
+    try:
+        grid = parse_overrides(args.set)
+    except ValueError as error:
+        parser.error(str(error))
+
+    total: int = args.runs * len(parameter_sets(grid))
+    writer = csv.writer(args.csv) if args.csv else None
+    if writer is not None:
+        writer.writerow(RESULT_FIELDS)
+    done: int = 0
+
+    def on_result(result: tuple) -> None:
+        global done
+        done += 1
+        if writer is not None:
+            writer.writerow(result)
+        if done % 100 == 0 or done == total:
+            print(f"\r{done}/{total} games", end="", file=sys.stderr, flush=True)
+
+    start: float = time.perf_counter()
+    results = sweep(grid, args.runs, args.seed, args.input, args.max_ticks, args.workers, on_result)
+    elapsed: float = time.perf_counter() - start
+    print(file=sys.stderr)
+    if args.csv:
+        args.csv.close()
+
+    print(f"{total} games in {elapsed:.1f} s, {total / elapsed:.1f} games/s")
+    for stats in results:
+        summary = stats.summary()
+        overrides = " ".join(f"{name}={value}" for name, value in stats.overrides.items()) or "defaults"
+        print(f"{overrides}: survival {summary['survival_s']:.1f} s  game over {summary['game_over_rate']:.0%}"
+              f"  hits/min {summary['hits_per_minute']:.2f}  score mean {summary['score_mean']:.1f}"
+              f"  p10 {summary['score_p10']:.0f}  median {summary['score_median']:.0f}"
+              f"  p90 {summary['score_p90']:.0f}  max {summary['score_max']}")
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -12,7 +13,38 @@ sys.path.extend([str(PROJECT_ROOT), SRC_PATH])
 
 # Now we can import the Game class from the src package
 from src import Game
+from src.constants import PIXEL_CACHE_PATH, SOUND_CACHE_PATH
+from src.helpers import PixelCache, SoundCache
+from src.replay import SEED_MAX, SEED_MIN, Replay
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Hero vs Monsters")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="present only the changed areas of the window instead of flipping it every frame")
+    parser.add_argument("--profile", action="store_true",
+                        help="print the frame profiler report when the game ends")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="decode every image and sound on startup instead of reading the ones cached by previous runs")
+    parser.add_argument("--seed", type=int,
+                        help="the seed of the random spawns and effects, so the same seed and moves play the same game")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the input and state of every tick to a replay file, played back with run_headless.py --replay")
+    parser.add_argument("--entity-store", action="store_true",
+                        help="move and collide the falling sprites as NumPy arrays")
+    args = parser.parse_args()
+    if args.seed is not None and not SEED_MIN <= args.seed <= SEED_MAX:
+        parser.error(f"--seed must be between {SEED_MIN} and {SEED_MAX}")
+
+    if not args.no_cache:
+        PixelCache.enable(PIXEL_CACHE_PATH)
+        SoundCache.enable(SOUND_CACHE_PATH)
+    game = Game(dirty_rects=args.dirty_rects, seed=args.seed, entity_store=args.entity_store)
+    if args.record:
+        game.recorder = Replay(game.world.seed)
+    game.run()
+    if game.recorder is not None:
+        game.recorder.save(args.record)
+    if args.profile:
+        print(game.profiler.report())
+        for kind, stats in game.world.pool_stats().items():
+            print(f"{kind} pool: " + "  ".join(f"{name}: {value}" for name, value in stats.items()))
@@ -5,7 +5,13 @@ a = Analysis(
     ['run_game.py'],
     pathex=['src'],
     binaries=[],
-    datas=[('assets', 'assets')],
+    # the sprites are bundled packed in the texture atlas built by tools/build_atlas.py
+    datas=[
+        ('assets/atlas', 'assets/atlas'),
+        ('assets/images/bg.png', 'assets/images'),
+        ('assets/fonts', 'assets/fonts'),
+        ('assets/music', 'assets/music'),
+    ],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+import os
+from pathlib import Path
+
+# Obtain the root directory of the project
+PROJECT_ROOT = Path(__file__).parent.absolute()
+SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+
+# Add the project root and src directory to the sys.path
+sys.path.extend([str(PROJECT_ROOT), SRC_PATH])
+
+# The dummy drivers must be selected before pygame opens the window and the mixer
+from src.headless import simulate, use_dummy_drivers
+use_dummy_drivers()
+
+import pygame
+from src.world import World
+from src.inputs import IdleInput, RandomInput, ScriptedInput, InputProvider
+from src.replay import SEED_MAX, SEED_MIN, Replay, play
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hero vs Monsters, simulated as fast as possible without a display or sound device")
+    parser.add_argument("--frames", type=int, default=10000,
+                        help="the maximum number of frames to simulate, the run stops early when the game is over")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="the seed of the random spawns and of the random input")
+    input_group = parser.add_mutually_exclusive_group()
+    input_group.add_argument("--input", choices=["idle", "random"], default="idle",
+                             help="move the hero randomly, or never")
+    input_group.add_argument("--script", type=argparse.FileType("r"),
+                             help="a file of lines like '30 left', '15 none' or '40 right', replayed in a loop")
+    input_group.add_argument("--replay", metavar="FILE",
+                             help="replay a file recorded with --record, checking the state of every tick against the recording")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the input and state of every simulated tick to a replay file")
+    parser.add_argument("--entity-store", action="store_true",
+                        help="move and collide the falling sprites as NumPy arrays")
+    args = parser.parse_args()
+    if args.seed is not None and not SEED_MIN <= args.seed <= SEED_MAX:
+        parser.error(f"--seed must be between {SEED_MIN} and {SEED_MAX}")
+
+    if args.replay:
+        replay = Replay.load(args.replay)
+        world = World(seed=replay.seed, entity_store=args.entity_store)
+        stats = play(world, replay)
+        pygame.quit()
+
+        print(f"frames: {stats['frames']}/{len(replay)}  fps: {stats['fps']:.0f}")
+        print(f"score: {stats['score']}  coins: {stats['coins']}  jewels: {stats['jewels']}  hits: {stats['hits']}")
+        if stats["diverged_at"] >= 0:
+            sys.exit(f"replay diverged from the recording at tick {stats['diverged_at']}")
+        sys.exit(0)
+
+    keys: InputProvider
+    if args.script:
+        keys = ScriptedInput.parse(args.script.read())
+    elif args.input == "random":
+        keys = RandomInput(args.seed)
+    else:
+        keys = IdleInput()
+
+    world = World(seed=args.seed, entity_store=args.entity_store)
+    recorder = Replay(world.seed) if args.record else None
+    stats = simulate(world, args.frames, keys, recorder)
+    if recorder is not None:
+        recorder.save(args.record)
+    pygame.quit()
+
+    print(f"frames: {stats['frames']}  fps: {stats['fps']:.0f}")
+    print(f"score: {stats['score']}  coins: {stats['coins']}  jewels: {stats['jewels']}  hits: {stats['hits']}"
+          f"{'  (game over)' if stats['game_over'] else ''}")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from .game import Game
+from .world import World
 from .constants import *
 
-__all__: list[str] = ["Game"]
+__all__: list[str] = ["Game", "World"]
@@ -1,11 +1,119 @@
 #!/usr/bin/env python3
+import io
 import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
 import pygame
 from pygame.font import Font
 from pygame.mixer import Sound
-from constants import SOUNDS_PATH, SPRITES_PATH, FONTS_PATH
+from constants import SOUNDS_PATH, SPRITES_PATH, FONTS_PATH, MONSTERS_PATH, JEWELS_PATH, POTIONS_PATH, ATLAS_MANIFEST
+from src.helpers import ImageHelper, SoundCache, SurfaceCache, TextureAtlas
+from src.entities import MonsterTypeRegistry
+
+
+class AssetLoader:
+    """
+    Loads assets on a thread pool while the main thread keeps the window responsive.
+
+    Every task is identified by a name. The main thread waits only for the tasks it needs, and
+    can check whether the other ones are done at any time without blocking.
+
+    Attributes:
+        total (int): The number of tasks submitted.
+    """
+
+    total: int
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        Initialize an AssetLoader without tasks.
+
+        Args:
+            max_workers (int | None): The number of loading threads, up to 4 by default.
+        """
+        self._executor = ThreadPoolExecutor(max_workers or min(4, os.cpu_count() or 1), "asset-loader")
+        self._tasks: dict[str, Future] = {}
+        self.total = 0
+
+    def submit(self, name: str, function: Callable[..., Any], *args: Any) -> None:
+        """
+        Runs a loading function on the thread pool.
+
+        Args:
+            name (str): The name of the task.
+            function (Callable[..., Any]): The loading function.
+            *args (Any): The arguments of the loading function.
+        """
+        self._tasks[name] = self._executor.submit(function, *args)
+        self.total += 1
+
+    @property
+    def progress(self) -> float:
+        """
+        The fraction of the submitted tasks that are done, from 0 to 1.
+        """
+        return sum(task.done() for task in self._tasks.values()) / self.total if self.total else 1.0
+
+    def done(self, name: str) -> bool:
+        """
+        Returns whether a task is done, without blocking.
+
+        Args:
+            name (str): The name of the task.
+
+        Returns:
+            bool: True if the task finished or failed.
+        """
+        return self._tasks[name].done()
 
-def load_fonts() -> tuple[Font, Font, Font]:
+    def wait(self, names: list[str], on_progress: Callable[[float], None] | None = None, interval: float = 1 / 60) -> None:
+        """
+        Blocks until the given tasks are done, reporting the progress at regular intervals.
+
+        Args:
+            names (list[str]): The names of the tasks to wait for.
+            on_progress (Callable[[float], None] | None): Called with the progress while waiting.
+            interval (float): The time between two progress reports, in seconds.
+        """
+        pending = {self._tasks[name] for name in names}
+        while pending:
+            _, pending = wait(pending, timeout=interval)
+            if on_progress is not None:
+                on_progress(self.progress)
+
+    def result(self, name: str) -> Any:
+        """
+        Returns the result of a task, waiting for it if needed.
+
+        Args:
+            name (str): The name of the task.
+
+        Returns:
+            Any: The value returned by the loading function.
+
+        Raises:
+            Exception: The exception raised by the loading function, if any.
+        """
+        return self._tasks[name].result()
+
+    def shutdown(self) -> None:
+        """
+        Stops the thread pool once the running tasks are done.
+        """
+        self._executor.shutdown(wait=False)
+
+
+def read_font_data() -> bytes:
+    """Reads the Symbola font file.
+
+    Returns:
+        bytes: The contents of the font file.
+    """
+    with open(os.path.join(FONTS_PATH, "Symbola.ttf"), "rb") as font_file:
+        return font_file.read()
+
+def load_fonts(font_data: bytes | None = None) -> tuple[Font, Font, Font]:
     """Loads the fonts used in the game.
 
     The fonts are:
@@ -14,25 +122,135 @@ def load_fonts() -> tuple[Font, Font, Font]:
     - A 24-point font with default system font family for rendering text.
     - A 48-point font from the Symbola font family with bold style for rendering headings.
 
+    The Symbola font file is read only once and both sizes are built from its contents.
+
+    Args:
+        font_data (bytes | None): The contents of the Symbola font file, read from disk if None.
+
     Returns:
         A tuple of the three loaded fonts.
     """
-    emoji_font = pygame.font.Font(os.path.join(FONTS_PATH, "Symbola.ttf"), 24)
+    if font_data is None:
+        font_data = read_font_data()
+    emoji_font = pygame.font.Font(io.BytesIO(font_data), 24)
     font = pygame.font.Font(None, 24)
-    font_XL = pygame.font.Font(os.path.join(FONTS_PATH, "Symbola.ttf"), 48)
+    font_XL = pygame.font.Font(io.BytesIO(font_data), 48)
     font_XL.set_bold(True)
     return emoji_font, font, font_XL
 
+def submit_images(loader: AssetLoader) -> list[str]:
+    """Schedules the decoding of every game image on the loader.
+
+    The texture atlas built by ``tools/build_atlas.py`` is loaded when it is available, and every
+    loose sprite, monster, jewel and potion image otherwise. The background is always a loose file.
+
+    Args:
+        loader (AssetLoader): The loader running the tasks.
+
+    Returns:
+        list[str]: The names of the scheduled tasks, to be passed to ``install_images``.
+    """
+    image_paths: list[str] = [os.path.join(SPRITES_PATH, "bg.png")]
+    if os.path.exists(ATLAS_MANIFEST):
+        loader.submit("atlas", TextureAtlas.load, ATLAS_MANIFEST)
+        names: list[str] = ["atlas"]
+    else:
+        names = []
+        for image_folder in (SPRITES_PATH, MONSTERS_PATH, JEWELS_PATH, POTIONS_PATH):
+            image_paths += [
+                os.path.join(image_folder, file_name) for file_name in sorted(os.listdir(image_folder))
+                if file_name.lower().endswith(ImageHelper.IMAGE_EXTENSIONS) and file_name != "bg.png"
+            ]
+
+    for image_path in image_paths:
+        loader.submit(f"image:{image_path}", SurfaceCache.load, image_path)
+        names.append(f"image:{image_path}")
+    return names
+
+def install_images(loader: AssetLoader, names: list[str]) -> tuple[pygame.Surface, pygame.Surface, pygame.Surface]:
+    """Stores the images decoded by the loader in the SurfaceCache.
+
+    Every image is kept in the SurfaceCache so entities can be spawned without any file I/O. The
+    monster types are registered too, so the monster images are scaled only once.
+
+    Args:
+        loader (AssetLoader): The loader running the tasks.
+        names (list[str]): The names of the tasks returned by ``submit_images``.
+
+    Returns:
+        tuple[Surface, Surface, Surface]: A tuple containing the background image, the hero image, and the coin image.
+
+    Raises:
+        pygame.error: If an image cannot be loaded.
+    """
+    for name in names:
+        if name == "atlas":
+            loader.result(name).install(SPRITES_PATH)
+        else:
+            SurfaceCache.add(name.removeprefix("image:"), loader.result(name))
+
+    MonsterTypeRegistry.preload(MONSTERS_PATH)
+    bg_image: pygame.Surface = SurfaceCache.get(os.path.join(SPRITES_PATH, "bg.png"))
+    hero_image: pygame.Surface = SurfaceCache.get(os.path.join(SPRITES_PATH, "hero.png"))
+    coin_image: pygame.Surface = SurfaceCache.get(os.path.join(SPRITES_PATH, "coin.png"))
+    return bg_image, hero_image, coin_image
+
 def load_images() -> tuple[pygame.Surface, pygame.Surface, pygame.Surface]:
     """Loads game images from the assets folder.
 
+    Every sprite, monster, jewel and potion image is loaded and converted to the display format
+    once, and kept in the SurfaceCache so entities can be spawned without any file I/O. The monster
+    types are registered too, so the monster images are scaled only once.
+
+    When the texture atlas built by ``tools/build_atlas.py`` is available, the images are handed
+    out as subsurfaces of the atlas, which is the only image file loaded besides the background.
+    Otherwise every image is loaded from its own file.
+
     Returns:
         tuple[Surface, Surface, Surface]: A tuple containing the background image, the hero image, and the coin image.
     """
-    bg_image: pygame.Surface = pygame.image.load(os.path.join(SPRITES_PATH, "bg.png")).convert()
-    hero_image: pygame.Surface = pygame.image.load(os.path.join(SPRITES_PATH, "hero.png")).convert_alpha()
-    coin_image: pygame.Surface = pygame.image.load(os.path.join(SPRITES_PATH, "coin.png")).convert_alpha()
-    return bg_image, hero_image, coin_image
+    loader: AssetLoader = AssetLoader()
+    try:
+        return install_images(loader, submit_images(loader))
+    finally:
+        loader.shutdown()
+
+# sound attribute of the game -> sound file
+SOUND_FILES: dict[str, str] = {
+    "COIN_SOUND": "ping01.mp3",
+    "JEWEL_SOUND": "ping02.mp3",
+    "HIT": "hit01.mp3",
+}
+
+def submit_sounds(loader: AssetLoader) -> dict[str, str]:
+    """Schedules the decoding of the sound effects on the loader.
+
+    The sounds are read from the SoundCache when it is enabled, so they are decoded only once.
+
+    Args:
+        loader (AssetLoader): The loader running the tasks.
+
+    Returns:
+        dict[str, str]: The name of the task of every sound attribute of the game.
+    """
+    names: dict[str, str] = {}
+    for attribute, file_name in SOUND_FILES.items():
+        loader.submit(f"sound:{file_name}", SoundCache.load, os.path.join(SOUNDS_PATH, file_name), pygame.mixer.Sound)
+        names[attribute] = f"sound:{file_name}"
+    return names
+
+def play_music() -> bool:
+    """Plays the background music from the "sound.mp3" file in a loop.
+
+    Returns:
+        bool: True if the music is playing, False if it could not be loaded.
+    """
+    try:
+        pygame.mixer.music.load(os.path.join(SOUNDS_PATH, "sound.mp3"))
+        pygame.mixer.music.play(-1)
+    except pygame.error:
+        return False
+    return True
 
 def load_sounds() -> tuple[Sound, Sound, Sound]:
     """Loads the sound effects and background music used in the game.
@@ -43,9 +261,8 @@ def load_sounds() -> tuple[Sound, Sound, Sound]:
     Returns:
         tuple[Sound, Sound, Sound]: A tuple containing the sound effects for collecting coins, collecting jewels, and hitting monsters.
     """
-    pygame.mixer.music.load(os.path.join(SOUNDS_PATH, "sound.mp3"))
-    pygame.mixer.music.play(-1)
-    COIN_SOUND = pygame.mixer.Sound(os.path.join(SOUNDS_PATH, "ping01.mp3"))
-    JEWEL_SOUND = pygame.mixer.Sound(os.path.join(SOUNDS_PATH, "ping02.mp3"))
-    HIT = pygame.mixer.Sound(os.path.join(SOUNDS_PATH, "hit01.mp3"))
-    return COIN_SOUND, JEWEL_SOUND, HIT
\ No newline at end of file
+    play_music()
+    COIN_SOUND = SoundCache.load(os.path.join(SOUNDS_PATH, SOUND_FILES["COIN_SOUND"]), pygame.mixer.Sound)
+    JEWEL_SOUND = SoundCache.load(os.path.join(SOUNDS_PATH, SOUND_FILES["JEWEL_SOUND"]), pygame.mixer.Sound)
+    HIT = SoundCache.load(os.path.join(SOUNDS_PATH, SOUND_FILES["HIT"]), pygame.mixer.Sound)
+    return COIN_SOUND, JEWEL_SOUND, HIT
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+import pygame
+
+
+class ScrollingBackground:
+    """
+    A vertically scrolling background tiled from a single image.
+
+    The tiles are composed once into a strip that covers the window plus one tile height, so
+    drawing a frame is a single blit of the visible part of the strip, whatever the tile size.
+    The strip is composed again when the window is resized.
+
+    Every frame reports the bands of rows whose pixels differ from the previous frame, found by
+    comparing the rows of the tile shown on every window row before and after the scroll, so
+    only those bands are presented in dirty-rect mode.
+
+    Attributes:
+        tile (pygame.Surface): The background tile.
+        size (tuple[int, int]): The size of the area covered by the background.
+        speed (float): The scrolling speed in pixels per simulation tick.
+        y (float): The vertical position of the strip, always in [-tile height, 0).
+        previous_y (float): The vertical position of the strip before the last tick.
+        strip (pygame.Surface): The composed strip of tiles.
+        drawn_row (int | None): The row of the strip drawn at the top of the last frame, None
+            if nothing was drawn since the strip was composed.
+    """
+
+    tile: pygame.Surface
+    size: tuple[int, int]
+    speed: float
+    y: float
+    previous_y: float
+    strip: pygame.Surface
+    drawn_row: int | None
+
+    def __init__(self, tile: pygame.Surface, size: tuple[int, int], speed: float = 2) -> None:
+        """
+        Initialize a ScrollingBackground and compose its strip.
+
+        Args:
+            tile (pygame.Surface): The background tile.
+            size (tuple[int, int]): The size of the area covered by the background.
+            speed (float): The scrolling speed in pixels per simulation tick.
+
+        Raises:
+            ValueError: If the tile is empty.
+        """
+        if tile.get_width() <= 0 or tile.get_height() <= 0:
+            raise ValueError("Background tile must not be empty.")
+
+        self.tile = tile
+        tile_width, tile_height = tile.get_size()
+        pixels: bytes = pygame.image.tobytes(tile, "RGBA")
+        row_size: int = tile_width * 4
+        self._tile_rows: list[bytes] = [pixels[row * row_size:(row + 1) * row_size] for row in range(tile_height)]
+        self.speed = speed
+        self.y = -tile.get_height()
+        self.previous_y = self.y
+        self.resize(size)
+
+    def resize(self, size: tuple[int, int]) -> None:
+        """
+        Composes the strip of tiles again for a new window size.
+
+        Args:
+            size (tuple[int, int]): The size of the area covered by the background.
+        """
+        self.size = (size[0], size[1])
+        tile_width, tile_height = self.tile.get_size()
+        self.strip = pygame.Surface((self.size[0], self.size[1] + tile_height), 0, self.tile)
+        for x in range(0, self.strip.get_width(), tile_width):
+            for y in range(0, self.strip.get_height(), tile_height):
+                self.strip.blit(self.tile, (x, y))
+        self.drawn_row = None
+        self._bands: dict[tuple[int, int], list[pygame.Rect]] = {}
+
+    def scroll(self, distance: float | None = None) -> None:
+        """
+        Scrolls the background down, wrapping around every tile height.
+
+        Args:
+            distance (float | None): The distance to scroll in pixels, the speed if None.
+        """
+        self.y += self.speed if distance is None else distance
+        tile_height: int = self.tile.get_height()
+        while self.y >= 0:
+            self.y -= tile_height
+        while self.y < -tile_height:
+            self.y += tile_height
+
+    def save_position(self) -> None:
+        """
+        Saves the current position of the strip, before a simulation tick scrolls it.
+        """
+        self.previous_y = self.y
+
+    def changed_bands(self, previous_row: int, row: int) -> list[pygame.Rect]:
+        """
+        Returns the bands of the window that differ when the strip is drawn from another row.
+
+        A window row changes when the tile row it shows differs from the one it showed, so
+        the bands only depend on both rows modulo the tile height, and are cached.
+
+        Args:
+            previous_row (int): The row of the strip drawn at the top of the previous frame.
+            row (int): The row of the strip drawn at the top of the frame.
+
+        Returns:
+            list[pygame.Rect]: The full-width bands of changed rows, from top to bottom.
+        """
+        tile_height: int = len(self._tile_rows)
+        key: tuple[int, int] = (previous_row % tile_height, row % tile_height)
+        bands: list[pygame.Rect] | None = self._bands.get(key)
+        if bands is None:
+            bands = []
+            start: int | None = None
+            for y in range(self.size[1] + 1):
+                changed: bool = y < self.size[1] and (
+                    self._tile_rows[(key[0] + y) % tile_height] != self._tile_rows[(key[1] + y) % tile_height]
+                )
+                if changed and start is None:
+                    start = y
+                elif not changed and start is not None:
+                    bands.append(pygame.Rect(0, start, self.size[0], y - start))
+                    start = None
+            self._bands[key] = bands
+        return [band.copy() for band in bands]
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> list[pygame.Rect]:
+        """
+        Draws the visible part of the strip with a single blit.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            alpha (float): How far from the previous position of the strip to its current
+                one, from 0 to 1.
+
+        Returns:
+            list[pygame.Rect]: The bands of the surface that differ from the last frame drawn,
+                the whole area covered by the background on the first frame.
+        """
+        tile_height: int = self.tile.get_height()
+        # the strip scrolls down, so a smaller position means it wrapped around
+        distance: float = (self.y - self.previous_y) % tile_height
+        y: float = self.previous_y + distance * alpha
+        if y >= 0:
+            y -= tile_height
+        row: int = -int(y)
+        drawn: pygame.Rect = surface.blit(self.strip, (0, 0), pygame.Rect(0, row, self.size[0], self.size[1]))
+        previous_row, self.drawn_row = self.drawn_row, row
+        if previous_row is None:
+            return [drawn]
+        return self.changed_bands(previous_row, row)
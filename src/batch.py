@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+
+import itertools
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator
+
+import constants
+import replay
+import world
+from headless import simulate, use_dummy_drivers
+from inputs import IdleInput, InputProvider, RandomInput, RecordedInput, ScriptedInput
+from replay import Replay
+
+# the constants a sweep can override, read by the game on every tick or spawn
+TUNABLES: tuple[str, ...] = (
+    "HERO_SPEED", "MONSTER_SPEED", "COIN_SPEED", "JEWEL_SPEED", "MAX_MONSTERS", "MAX_COINS", "MAX_JEWELS",
+    "MONSTER_SPAWN_PROBABILITY", "COIN_SPAWN_PROBABILITY", "JEWEL_SPAWN_PROBABILITY",
+)
+
+# the fields of the compact result of every run
+RESULT_FIELDS: tuple[str, ...] = ("params", "seed", "ticks", "score", "coins", "jewels", "hits", "game_over")
+
+
+def parse_overrides(values: Iterable[str]) -> dict[str, list]:
+    """
+    Parses the values swept for every tunable constant.
+
+    :param values: Strings like ``"MAX_MONSTERS=3,5,8"``, one per constant.
+    :return: The values of every constant, converted to the type of its default value.
+    :raises ValueError: If a constant is not tunable, or a value is not a non-negative number.
+    """
+    grid: dict[str, list] = {}
+    for value in values:
+        name, _, options = value.partition("=")
+        name = name.strip().upper()
+        if name not in TUNABLES:
+            raise ValueError(f"{name} is not a tunable constant, expected one of {', '.join(TUNABLES)}.")
+        kind: type = type(getattr(constants, name))
+        try:
+            grid[name] = [kind(option) for option in options.split(",")]
+        except ValueError as error:
+            raise ValueError(f"{name} must be a list of {kind.__name__} values.") from error
+        if any(option < 0 for option in grid[name]):
+            raise ValueError(f"{name} must be a non-negative value.")
+    return grid
+
+
+def parameter_sets(grid: dict[str, list]) -> list[dict]:
+    """
+    Returns every combination of the swept values.
+
+    :param grid: The values of every swept constant.
+    :return: One override set per combination, a single empty set if nothing is swept.
+    """
+    names: list[str] = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+@contextmanager
+def overridden(overrides: dict) -> Iterator[None]:
+    """
+    Overrides gameplay constants for the worlds created and stepped in the block.
+
+    The constants are copied into the modules that read them by ``from constants import *``,
+    so they are replaced in every one of them, and restored when the block exits.
+
+    :param overrides: The value of every overridden constant.
+    :raises ValueError: If a constant is not tunable.
+    """
+    unknown: set[str] = set(overrides) - set(TUNABLES)
+    if unknown:
+        raise ValueError(f"{', '.join(sorted(unknown))} cannot be overridden.")
+
+    modules = (constants, replay, world)
+    saved: dict[str, object] = {name: getattr(constants, name) for name in overrides}
+    for module in modules:
+        for name, value in overrides.items():
+            setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for module in modules:
+            for name, value in saved.items():
+                setattr(module, name, value)
+
+
+@lru_cache(maxsize=None)
+def _read_input(spec: str) -> object:
+    """
+    Reads the script or replay of an input spec once per process.
+    """
+    kind, _, path = spec.partition(":")
+    if kind == "script":
+        with open(path) as script_file:
+            return ScriptedInput.parse(script_file.read())
+    return Replay.load(path).inputs
+
+
+def make_input(spec: str, seed: int) -> InputProvider:
+    """
+    Returns the input of a run.
+
+    :param spec: ``"idle"``, ``"random"``, ``"script:FILE"`` for an input script, or ``"replay:FILE"``
+        for the moves recorded in a replay file.
+    :param seed: The seed of the run, which also seeds the random input.
+    :return: The input provider.
+    :raises ValueError: If the spec is not one of the above.
+    """
+    kind, _, path = spec.partition(":")
+    if spec == "idle":
+        return IdleInput()
+    if spec == "random":
+        return RandomInput(seed)
+    if kind == "script" and path:
+        return _read_input(spec)
+    if kind == "replay" and path:
+        return RecordedInput(_read_input(spec))
+    raise ValueError(f"Unknown input {spec!r}, expected idle, random, script:FILE or replay:FILE.")
+
+
+def run_one(task: tuple[int, dict, int, str, int]) -> tuple:
+    """
+    Plays one headless game with a set of overridden constants.
+
+    The game is a bare World, stepped without a window, assets loader or sound, so a run only
+    pays for its own ticks. The sprite images are read once per process.
+
+    :param task: The index and overrides of the parameter set, the seed of the game, its
+        input spec and the maximum number of ticks.
+    :return: The compact result of the run, with the fields of RESULT_FIELDS.
+    """
+    index, overrides, seed, spec, max_ticks = task
+    with overridden(overrides):
+        stats = simulate(world.World(seed=seed), max_ticks, make_input(spec, seed))
+    return (index, seed, stats["frames"], stats["score"], stats["coins"], stats["jewels"], stats["hits"],
+            stats["game_over"])
+
+
+def _init_worker() -> None:
+    """
+    Selects the dummy drivers in a worker process, so nothing it runs opens a window or a sound device.
+    """
+    use_dummy_drivers()
+
+
+class SweepStats:
+    """
+    The aggregated results of the runs of one parameter set, updated as the results stream in.
+
+    The survival time of a run is its number of ticks: the runs that reach the maximum
+    number of ticks alive count with that time, so the mean survival time is a lower bound
+    when some runs survive.
+
+    Attributes:
+        overrides (dict): The overridden constants of the parameter set.
+        runs (int): The number of runs aggregated.
+        ticks (int): The ticks played by all the runs.
+        hits (int): The monster hits of all the runs.
+        game_overs (int): The number of runs that ended with a game over.
+        scores (list[int]): The final score of every run.
+    """
+
+    overrides: dict
+    runs: int
+    ticks: int
+    hits: int
+    game_overs: int
+    scores: list[int]
+
+    def __init__(self, overrides: dict) -> None:
+        """
+        Initialize an empty SweepStats.
+
+        :param overrides: The overridden constants of the parameter set.
+        """
+        self.overrides = overrides
+        self.runs = 0
+        self.ticks = 0
+        self.hits = 0
+        self.game_overs = 0
+        self.scores = []
+
+    def add(self, result: tuple) -> None:
+        """
+        Aggregates the result of a run.
+
+        :param result: The compact result of the run, with the fields of RESULT_FIELDS.
+        """
+        _, _, ticks, score, _, _, hits, game_over = result
+        self.runs += 1
+        self.ticks += ticks
+        self.hits += hits
+        self.game_overs += bool(game_over)
+        self.scores.append(score)
+
+    def summary(self) -> dict[str, float]:
+        """
+        Returns the aggregates of the runs.
+
+        :return: The runs, the mean survival time in seconds, the share of runs that ended with a
+            game over, the hits per minute, and the mean, minimum, 10th percentile, median,
+            90th percentile and maximum score.
+        """
+        if not self.runs:
+            return {"runs": 0}
+        minutes: float = self.ticks / constants.SIM_RATE / 60
+        deciles: list[float] = (
+            statistics.quantiles(self.scores, n=10) if self.runs > 1 else [float(self.scores[0])] * 9
+        )
+        return {
+            "runs": self.runs,
+            "survival_s": self.ticks / self.runs / constants.SIM_RATE,
+            "game_over_rate": self.game_overs / self.runs,
+            "hits_per_minute": self.hits / minutes if minutes > 0 else 0.0,
+            "score_mean": statistics.fmean(self.scores),
+            "score_min": min(self.scores),
+            "score_p10": deciles[0],
+            "score_median": statistics.median(self.scores),
+            "score_p90": deciles[-1],
+            "score_max": max(self.scores),
+        }
+
+
+def sweep(
+    grid: dict[str, list],
+    runs: int,
+    base_seed: int = 0,
+    spec: str = "random",
+    max_ticks: int = 30000,
+    workers: int | None = None,
+    on_result: Callable[[tuple], None] | None = None,
+) -> list[SweepStats]:
+    """
+    Plays runs seeded headless games for every combination of the swept constants, spread
+    over a pool of processes.
+
+    Every parameter set plays the same seeds, so the sets are compared on the same spawns and
+    moves. The tasks are sent to the workers in chunks, and their compact results are
+    aggregated as they come back.
+
+    :param grid: The values of every swept constant, as returned by parse_overrides().
+    :param runs: The number of games played with every parameter set.
+    :param base_seed: The seed of the first game, the others using the following seeds.
+    :param spec: The input of every game, as taken by make_input().
+    :param max_ticks: The maximum number of ticks of a game, which stops earlier if it is over.
+    :param workers: The number of worker processes, one per CPU if None.
+    :param on_result: Called with the result of every run as it comes back, if given.
+    :return: The aggregated results of every parameter set.
+    :raises ValueError: If runs or max_ticks is not a positive value.
+    """
+    if runs <= 0:
+        raise ValueError("Runs must be a positive value.")
+    if max_ticks <= 0:
+        raise ValueError("Max ticks must be a positive value.")
+    make_input(spec, base_seed)
+
+    sets: list[dict] = parameter_sets(grid)
+    results: list[SweepStats] = [SweepStats(overrides) for overrides in sets]
+    tasks = [
+        (index, overrides, base_seed + run, spec, max_ticks)
+        for index, overrides in enumerate(sets)
+        for run in range(runs)
+    ]
+    workers = workers or os.cpu_count() or 1
+    chunk_size: int = max(1, len(tasks) // (workers * 16))
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker) as executor:
+        for result in executor.map(run_one, tasks, chunksize=chunk_size):
+            results[result[0]].add(result)
+            if on_result is not None:
+                on_result(result)
+    return results
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+from enum import IntEnum
+from typing import Callable
+
+import pygame
+
+from profiler import FrameProfiler
+
+# A draw call receives the surface to draw on and returns the areas it drew, if known
+DrawCall = Callable[[pygame.Surface], pygame.Rect | list[pygame.Rect] | None]
+
+
+class Layer(IntEnum):
+    """
+    The layers of a frame, drawn from the lowest to the highest value.
+    """
+    BACKGROUND = 0
+    SPRITES = 1
+    LABELS = 2
+    HALOS = 3
+    HUD = 4
+    OVERLAY = 5
+
+
+class FrameCompositor:
+    """
+    Collects the draw calls of a frame in layers and presents the frame exactly once.
+
+    Draw calls submitted during a frame are run in layer order when the frame is presented, then
+    forgotten. Overlays, like the game over screen, are draw calls that stay until they are
+    removed, so they can be shown or hidden without touching the game loop.
+
+    The frame is presented with a single ``pygame.display.flip()``, or with a single
+    ``pygame.display.update()`` of the areas returned by the draw calls in dirty-rect mode.
+
+    Attributes:
+        screen (pygame.Surface): The surface the frame is drawn on.
+        dirty_rects (bool): A flag indicating if only the changed areas are presented.
+        profiler (FrameProfiler | None): The profiler recording the presented area per frame.
+        presents (int): The number of frames presented so far.
+        presents_per_second (int): The number of frames presented during the last full second.
+    """
+
+    screen: pygame.Surface
+    dirty_rects: bool
+    profiler: FrameProfiler | None
+    presents: int
+    presents_per_second: int
+
+    def __init__(self, screen: pygame.Surface, dirty_rects: bool = False, profiler: FrameProfiler | None = None) -> None:
+        """
+        Initialize a FrameCompositor without draw calls.
+
+        Args:
+            screen (pygame.Surface): The surface the frame is drawn on.
+            dirty_rects (bool): If True, only the changed areas are presented.
+            profiler (FrameProfiler | None): The profiler recording the presented area per frame.
+        """
+        self.screen = screen
+        self.dirty_rects = dirty_rects
+        self.profiler = profiler
+        self.presents = 0
+        self.presents_per_second = 0
+        self._calls: list[tuple[Layer, int, DrawCall]] = []
+        self._overlays: dict[str, tuple[Layer, DrawCall]] = {}
+        self._full_present = True
+        self._second_start: int = pygame.time.get_ticks()
+        self._second_presents = 0
+
+    def submit(self, layer: Layer, draw: DrawCall) -> None:
+        """
+        Adds a draw call to the current frame.
+
+        Args:
+            layer (Layer): The layer the call draws on.
+            draw (DrawCall): The draw call.
+        """
+        self._calls.append((layer, len(self._calls), draw))
+
+    def add_overlay(self, name: str, draw: DrawCall, layer: Layer = Layer.OVERLAY) -> None:
+        """
+        Adds a draw call run on every frame until it is removed.
+
+        Adding an overlay with the name of an existing one replaces it.
+
+        Args:
+            name (str): The name of the overlay.
+            draw (DrawCall): The draw call.
+            layer (Layer): The layer the overlay draws on.
+        """
+        self._overlays[name] = (layer, draw)
+        self._full_present = True
+
+    def remove_overlay(self, name: str) -> None:
+        """
+        Removes an overlay, doing nothing if there is no overlay with that name.
+
+        Args:
+            name (str): The name of the overlay.
+        """
+        if self._overlays.pop(name, None) is not None:
+            self._full_present = True
+
+    def has_overlay(self, name: str) -> bool:
+        """
+        Returns whether an overlay is shown.
+
+        Args:
+            name (str): The name of the overlay.
+
+        Returns:
+            bool: True if there is an overlay with that name.
+        """
+        return name in self._overlays
+
+    def invalidate(self) -> None:
+        """
+        Forces the next frame to be presented as a whole.
+        """
+        self._full_present = True
+
+    def compose(self) -> list[pygame.Rect]:
+        """
+        Runs the draw calls of the frame and the overlays in layer order.
+
+        Returns:
+            list[pygame.Rect]: The areas returned by the draw calls.
+        """
+        calls: list[tuple[Layer, int, DrawCall]] = self._calls + [
+            (layer, len(self._calls) + index, draw)
+            for index, (layer, draw) in enumerate(self._overlays.values())
+        ]
+        self._calls = []
+
+        dirty: list[pygame.Rect] = []
+        for _, _, draw in sorted(calls, key=lambda call: (call[0], call[1])):
+            drawn = draw(self.screen)
+            if isinstance(drawn, pygame.Rect):
+                dirty.append(drawn)
+            elif drawn:
+                dirty.extend(drawn)
+        return dirty
+
+    def present(self, full: bool = False) -> int:
+        """
+        Composes the frame and presents it once.
+
+        Args:
+            full (bool): A flag indicating if the whole window changed in this frame.
+
+        Returns:
+            int: The presented area in pixels.
+        """
+        dirty: list[pygame.Rect] = self.compose()
+
+        screen_rect: pygame.Rect = self.screen.get_rect()
+        if not self.dirty_rects or full or self._full_present:
+            pygame.display.flip()
+            self._full_present = False
+            area: int = screen_rect.width * screen_rect.height
+        else:
+            rects: list[pygame.Rect] = [rect.clip(screen_rect) for rect in dirty]
+            if rects:
+                pygame.display.update(rects)
+            area = sum(rect.width * rect.height for rect in rects)
+
+        self.presents += 1
+        self._second_presents += 1
+        now: int = pygame.time.get_ticks()
+        if now - self._second_start >= 1000:
+            self.presents_per_second = self._second_presents
+            self._second_presents = 0
+            self._second_start = now
+
+        if self.profiler is not None:
+            self.profiler.record("dirty_area", area)
+            self.profiler.record("presents_per_second", self.presents_per_second)
+        return area
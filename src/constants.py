@@ -5,18 +5,29 @@ import sys
 # --- Screen Dimensions ---
 WINDOW_WIDTH: int = 1024
 WINDOW_HEIGHT: int = 768
-FPS: int = 50
+# frames drawn per second at most, and game logic ticks per second whatever the frame rate
+FPS: int = 120
+SIM_RATE: int = 50
+MAX_SIM_STEPS: int = 5
+DIRTY_RECTS: bool = False
 
-# --- Speeds ---
+# --- Speeds, in pixels per simulation tick ---
 HERO_SPEED: int = 5
 MONSTER_SPEED: int = 3
 COIN_SPEED: int = 5
 JEWEL_SPEED: int = 7
+BACKGROUND_SPEED: int = 2
 
 # --- Limits ---
 MAX_MONSTERS: int = 5
 MAX_COINS: int = 3
 MAX_JEWELS: int = 1
+# the side of the grid cells indexing the sprites for collisions, about the size of a sprite
+SPATIAL_CELL_SIZE: int = 64
+# keep the falling sprites in NumPy arrays moved and collided as a whole, when NumPy is installed
+ENTITY_STORE: bool = False
+# the most killed monsters, coins and jewels kept for reuse by the next spawns, per kind
+POOL_HIGH_WATER: int = 16
 
 # --- Font ---
 FONT_SIZE: int = 24
@@ -38,6 +49,17 @@ FONTS_PATH: str = os.path.join(BASE_PATH, "assets/fonts")
 MONSTERS_PATH: str = os.path.join(SPRITES_PATH, "monsters")
 POTIONS_PATH: str = os.path.join(SPRITES_PATH, "potions")
 JEWELS_PATH: str = os.path.join(SPRITES_PATH, "jewels")
+ATLAS_PATH: str = os.path.join(BASE_PATH, "assets/atlas")
+ATLAS_MANIFEST: str = os.path.join(ATLAS_PATH, "atlas.json")
+# Images left out of the atlas: the opaque background tile is blitted faster as its own surface
+ATLAS_EXCLUDE: tuple[str, ...] = ("bg.png",)
+# Per-user folder for files rebuilt from the assets, like the decoded images
+CACHE_PATH: str = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "hero-monsters",
+)
+PIXEL_CACHE_PATH: str = os.path.join(CACHE_PATH, "pixels")
+SOUND_CACHE_PATH: str = os.path.join(CACHE_PATH, "sounds")
 
 # --- Probabilities ---
 MONSTER_SPAWN_PROBABILITY: float = 0.06
@@ -46,4 +68,13 @@ JEWEL_SPAWN_PROBABILITY: float = 0.005
 POTION_SPAWN_PROBABILITY: float = 0.002
 
 # --- Miscellaneous ---
-HIT_SOUND_TIMES: int = 3
\ No newline at end of file
+HIT_SOUND_TIMES: int = 3
+
+# --- Sound voices ---
+# mixer channels reserved for every sound category
+VOICE_POOLS: dict[str, int] = {"coin": 4, "jewel": 2, "hit": 2}
+# maximum number of sound effects playing at the same time
+MAX_VOICES: int = 6
+# the item value, plus one, played at full volume
+COIN_VOLUME_BASE: int = 26
+JEWEL_VOLUME_BASE: int = 100
\ No newline at end of file
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+import random
+
+import pygame
+
+from constants import GOLDENTRANS, REDFIRETRANS
+from utils import apply_flame_ripple
+
+
+class HaloAnimation:
+    """
+    A precomputed golden and red flame halo drawn around the hero while it blinks.
+
+    The hero silhouette and a fixed ring of rippled halo frames are baked once per hero image
+    and size, so drawing a blinking frame only costs a few blits. The frames are baked again
+    automatically when the hero image or size changes.
+
+    Attributes:
+        frame_count (int): The number of rippled frames in the animation ring.
+        frame_duration (int): How long every frame is shown, in milliseconds.
+        image (pygame.Surface | None): The hero image the frames were baked for.
+        size (tuple[int, int] | None): The hero size the frames were baked for.
+        silhouette (pygame.Surface | None): The golden silhouette of the hero image.
+        frames (list[tuple[pygame.Surface, pygame.Surface]]): The red and golden halos of every frame.
+        rng (random.Random | None): The random generator of the ripples, the random module if None.
+    """
+
+    RIPPLE_AMPLITUDE: int = 20
+    RIPPLE_FREQUENCY: int = 30
+    RIPPLE_SPEED: float = 0.6
+
+    frame_count: int
+    frame_duration: int
+    image: pygame.Surface | None
+    size: tuple[int, int] | None
+    silhouette: pygame.Surface | None
+    frames: list[tuple[pygame.Surface, pygame.Surface]]
+    rng: random.Random | None
+
+    def __init__(self, frame_count: int = 12, frame_duration: int = 40, rng: random.Random | None = None) -> None:
+        """
+        Initialize an empty HaloAnimation.
+
+        Args:
+            frame_count (int): The number of rippled frames in the animation ring.
+            frame_duration (int): How long every frame is shown, in milliseconds.
+            rng (random.Random | None): The random generator of the ripples, the random module if None.
+
+        Raises:
+            ValueError: If frame_count or frame_duration is not positive.
+        """
+        if frame_count <= 0:
+            raise ValueError("Frame count must be a positive value.")
+        if frame_duration <= 0:
+            raise ValueError("Frame duration must be a positive value.")
+
+        self.frame_count = frame_count
+        self.frame_duration = frame_duration
+        self.image = None
+        self.size = None
+        self.silhouette = None
+        self.frames = []
+        self.rng = rng
+
+    def prepare(self, image: pygame.Surface, size: tuple[int, int]) -> bool:
+        """
+        Bakes the silhouette and the halo frames for the given hero image and size.
+
+        Nothing is done when the frames were already baked for the same image and size.
+
+        Args:
+            image (pygame.Surface): The hero image.
+            size (tuple[int, int]): The size of the hero rect.
+
+        Returns:
+            bool: True if the frames were baked, False if the cached ones were reused.
+        """
+        size = (size[0], size[1])
+        if image is self.image and size == self.size:
+            return False
+
+        mask: pygame.Mask = pygame.mask.from_surface(image)
+        self.silhouette = mask.to_surface(setcolor=GOLDENTRANS, unsetcolor=(0, 0, 0, 0))
+
+        halo_golden = pygame.Surface((size[0] + 15, size[1] + 25), pygame.SRCALPHA)
+        pygame.draw.ellipse(halo_golden, GOLDENTRANS, halo_golden.get_rect())
+        halo_red = pygame.Surface((size[0] + 25, size[1] + 35), pygame.SRCALPHA)
+        pygame.draw.ellipse(halo_red, REDFIRETRANS, halo_red.get_rect())
+
+        self.frames = []
+        for frame in range(self.frame_count):
+            offset: float = frame * self.frame_duration * self.RIPPLE_SPEED
+            self.frames.append((
+                apply_flame_ripple(halo_red, self.RIPPLE_AMPLITUDE, self.RIPPLE_FREQUENCY, self.RIPPLE_SPEED, offset, self.rng),
+                apply_flame_ripple(halo_golden, self.RIPPLE_AMPLITUDE, self.RIPPLE_FREQUENCY, self.RIPPLE_SPEED, offset, self.rng),
+            ))
+
+        self.image = image
+        self.size = size
+        return True
+
+    def frame(self, ticks: int) -> tuple[pygame.Surface, pygame.Surface]:
+        """
+        Returns the red and golden halos to show at the given time.
+
+        Args:
+            ticks (int): The current time in milliseconds.
+
+        Returns:
+            tuple[pygame.Surface, pygame.Surface]: The red and the golden halo surfaces.
+        """
+        return self.frames[(ticks // self.frame_duration) % self.frame_count]
+
+    def draw(self, surface: pygame.Surface, image: pygame.Surface, rect: pygame.Rect, ticks: int) -> pygame.Rect:
+        """
+        Draws the blinking hero silhouette, with the flame halo every other half second.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            image (pygame.Surface): The hero image.
+            rect (pygame.Rect): The hero rect.
+            ticks (int): The current time in milliseconds.
+
+        Returns:
+            pygame.Rect: The area covered by the silhouette and the halo, whether the halo is
+                shown or not, so the frames hiding it are presented too.
+        """
+        self.prepare(image, rect.size)
+
+        halo_red, halo_golden = self.frame(ticks)
+        if ticks % 1000 >= 500:
+            surface.blit(halo_red, halo_red.get_rect(center=rect.center))
+            surface.blit(halo_golden, halo_golden.get_rect(center=rect.center))
+        surface.blit(self.silhouette, rect.topleft)
+        return halo_red.get_rect(center=rect.center).union(self.silhouette.get_rect(topleft=rect.topleft))
@@ -2,8 +2,9 @@
 
 from .hero import Hero
 from .monster import Monster
+from .monstertype import MonsterType, MonsterTypeRegistry
 from .coin import Coin
 from .jewel import Jewel
 from .base import BaseSprite
 
-__all__: list[str] = ["Hero", "Monster", "Coin", "Jewel", "BaseSprite"]
+__all__: list[str] = ["Hero", "Monster", "MonsterType", "MonsterTypeRegistry", "Coin", "Jewel", "BaseSprite"]
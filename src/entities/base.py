@@ -11,6 +11,9 @@ class BaseSprite(pygame.sprite.Sprite, SpriteProtocol):
 
     image: pygame.Surface
     rect: pygame.Rect
+    previous_position: tuple[int, int] | None
+    # the EntityPool the sprite goes back to when it is killed, if any
+    pool = None
 
     def __init__(self, *groups: pygame.sprite.AbstractGroup) -> None:
         """
@@ -20,9 +23,43 @@ class BaseSprite(pygame.sprite.Sprite, SpriteProtocol):
         which can be used as a base class for other sprite classes.
 
         The image and rect attributes are set to minimal defaults, and can be
-        overridden in subclasses.
+        overridden in subclasses. The previous position is the position of the
+        sprite before the last simulation tick, None until it is first saved.
         """
 
         super().__init__(*groups)
         self.image = pygame.Surface((0, 0))
         self.rect: pygame.Rect = self.image.get_rect()
+        self.previous_position = None
+
+    def kill(self) -> None:
+        """
+        Removes the sprite from all its groups, and gives it back to its pool, if it came from one.
+
+        A pooled sprite is reset and spawned again by a later spawn, so it must not be kept once killed.
+        """
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def save_position(self) -> None:
+        """
+        Saves the current position of the sprite, before a simulation tick moves it.
+        """
+        self.previous_position = self.rect.topleft
+
+    def interpolated_position(self, alpha: float) -> tuple[int, int]:
+        """
+        Returns the position of the sprite between its previous and current positions.
+
+        Args:
+            alpha (float): How far from the previous position, from 0 to 1.
+
+        Returns:
+            tuple[int, int]: The interpolated top left corner, the current one if no
+                previous position was saved.
+        """
+        if self.previous_position is None:
+            return self.rect.topleft
+        x, y = self.previous_position
+        return round(x + (self.rect.x - x) * alpha), round(y + (self.rect.y - y) * alpha)
@@ -2,8 +2,11 @@
 
 import random
 import pygame
+from pygame.font import Font
 
 from .base import BaseSprite
+from src.constants import BLACK, FONT_SIZE_SMALL
+from src.helpers import SurfaceCache
 
 
 class Coin(BaseSprite):
@@ -11,13 +14,18 @@ class Coin(BaseSprite):
     Coin class represents a collectible coin in the game.
     Attributes:
         window_height (int): The height of the game window.
-        value (int): The value of the coin, randomly assigned between 1 and 25.
+        value (int): The value of the coin, randomly assigned between 1 and 5.
+        label_font (Font | None): The small font shared by every coin to render its value.
     Methods:
-        __init__(image_path: str, x: int, y: int, speed: int, window_height: int):
-            Initializes the Coin object with the given parameters, loads the image,
-            optionally applies a random color mask, and assigns a random value.
-        apply_color_mask(color: tuple):
-            Applies a color mask to the coin image using the given RGB color tuple.
+        __init__(image_path: str, x: int, y: int, speed: int, window_height: int, rng: random.Random | None):
+            Initializes the Coin object with the given parameters, assigns a random value
+            and takes the image with the value label from the SurfaceCache.
+        reset(image_path: str, x: int, y: int, speed: int, window_height: int, rng: random.Random | None):
+            Reinitializes the coin for a new spawn, so a pooled coin can be reused.
+        random_value(rng: random.Random | None) -> int:
+            Returns a random value for a new coin.
+        labelled_image(image_path: str, value: int) -> pygame.Surface:
+            Returns the shared image with the value label baked in.
         update():
             Updates the position of the coin. If the coin moves out of the window,
             it is removed from the game.
@@ -33,9 +41,11 @@ class Coin(BaseSprite):
     image_path: str
     x: int
     y: int
-    MONSTER_IMAGE: pygame.Surface
+    value: int
+    label_font: Font | None = None
 
-    def __init__(self, image_path: str, x: int, y: int, speed: int, window_height: int) -> None:
+    def __init__(self, image_path: str, x: int, y: int, speed: int, window_height: int,
+                 rng: random.Random | None = None) -> None:
         """
         Initializes a Coin object.
         Args:
@@ -44,6 +54,7 @@ class Coin(BaseSprite):
             y (int): The initial y-coordinate of the coin.
             speed (int): The speed at which the coin moves.
             window_height (int): The height of the game window.
+            rng (random.Random | None): The random generator of the value, the random module if None.
         Attributes:
             window_height (int): The height of the game window.
         Notes:
@@ -51,12 +62,33 @@ class Coin(BaseSprite):
         """
         # Load the base image
         super(Coin, self).__init__()
+        self.reset(image_path, x, y, speed, window_height, rng)
 
+    def reset(self, image_path: str, x: int, y: int, speed: int, window_height: int,
+              rng: random.Random | None = None) -> None:
+        """
+        Reinitializes the coin for a new spawn, as if it had just been created.
+
+        The random draws are the same as the ones of a new coin, so a game plays the same
+        whether its coins are created or reused from a pool.
+
+        Args:
+            image_path (str): The file path to the image representing the coin.
+            x (int): The initial x-coordinate of the coin.
+            y (int): The initial y-coordinate of the coin.
+            speed (int): The speed at which the coin moves.
+            window_height (int): The height of the game window.
+            rng (random.Random | None): The random generator of the value, the random module if None.
+
+        Raises:
+            ValueError: If a coordinate, the speed or the window height is negative.
+        """
+        self.previous_position = None
         self.image_path = image_path
         self.x = x
         self.y = y
         self.window_height = window_height
-        self.image = pygame.image.load(self.image_path)
+        self.image = SurfaceCache.get(self.image_path)
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
@@ -71,9 +103,65 @@ class Coin(BaseSprite):
         if window_height < 0:
             raise ValueError('window height must be non-negative')
 
-        # Apply a random color mask to the coin image with a 50% chance
-        # Assign a random value to the coin between 1 and 25 taking account inverse weight
-        self.value = random.choices([1, 2, 3, 4, 5], weights=[0.5, 0.2, 0.15, 0.1, 0.05])[0]
+        self.value = self.random_value(rng)
+        self.image = self.labelled_image(self.image_path, self.value)
+
+    @staticmethod
+    def random_value(rng: random.Random | None = None) -> int:
+        """
+        Returns a random value for a new coin.
+
+        Values go from 1 to 5, lower values being more likely.
+
+        Args:
+            rng (random.Random | None): The random generator, the random module if None.
+
+        Returns:
+            int: The value of the coin.
+        """
+        return (random if rng is None else rng).choices([1, 2, 3, 4, 5], weights=[0.5, 0.2, 0.15, 0.1, 0.05])[0]
+
+    @staticmethod
+    def get_label_font() -> Font:
+        """
+        Returns the small font shared by every coin and jewel to render its value.
+
+        Returns:
+            Font: The label font, created the first time it is needed.
+        """
+        if Coin.label_font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            Coin.label_font = pygame.font.Font(None, FONT_SIZE_SMALL)
+        return Coin.label_font
+
+    @staticmethod
+    def labelled_image(image_path: str, value: int) -> pygame.Surface:
+        """
+        Returns the image with the value rendered in its center.
+
+        The label of every value and the labelled image of every (image, value) pair are
+        built once and shared through the SurfaceCache, so spawning a coin and drawing it
+        do not render any text.
+
+        Args:
+            image_path (str): The file path to the image of the coin.
+            value (int): The value to show on the coin.
+
+        Returns:
+            pygame.Surface: The shared image with the label.
+        """
+        def render_label() -> pygame.Surface:
+            return Coin.get_label_font().render(str(value), True, BLACK)
+
+        def compose() -> pygame.Surface:
+            label: pygame.Surface = SurfaceCache.derive(("label", value), render_label)
+            image: pygame.Surface = SurfaceCache.get(image_path).copy()
+            image.blit(label, (image.get_width() // 2 - label.get_width() // 2,
+                               image.get_height() // 2 - label.get_height() // 2))
+            return image
+
+        return SurfaceCache.derive((SurfaceCache.key(image_path), "label", value), compose)
 
 
     def update(self) -> None:
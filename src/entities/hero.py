@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
+from typing import Sequence
+
 import pygame
 
 from .base import BaseSprite
+from src.helpers import SurfaceCache
 
 
 class Hero(BaseSprite):
@@ -41,7 +44,7 @@ class Hero(BaseSprite):
 
         """
         super(Hero, self).__init__()
-        self.image = pygame.image.load(image_path).convert_alpha()
+        self.image = SurfaceCache.get(image_path)
         self.rect = self.image.get_rect()
 
         if hero_speed < 0:
@@ -73,15 +76,20 @@ class Hero(BaseSprite):
 
 
 
-    def update(self) -> None:
+    def update(self, keys: Sequence[bool] | None = None) -> None:
         """
         Update the hero's position based on keyboard input.
 
         This method checks for left and right arrow key presses and updates
         the hero's position accordingly, ensuring the hero stays within the
         window boundaries.
+
+        Args:
+            keys (Sequence[bool] | None): The keys held down, indexed by key code,
+                pygame.key.get_pressed() if None.
         """
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT] and self.rect.left > 0:
             self.rect.x -= self.speed
         if keys[pygame.K_RIGHT] and self.rect.right < self.window_width:
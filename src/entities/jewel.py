@@ -3,6 +3,7 @@
 import random
 import pygame
 import src.helpers
+from .base import BaseSprite
 from .coin import Coin
 
 class Jewel(Coin):
@@ -12,10 +13,12 @@ class Jewel(Coin):
         window_height (int): The height of the game window.
         value (int): The value assigned to the jewel, randomly chosen between 50 and 100.
     Methods:
-        __init__(image_path: str, x: int, y: int, speed: int, window_height: int):
-            Initializes the Jewel object with the given parameters and applies a random color mask with a 50% chance.
-        apply_color_mask(color):
-            Applies a color mask to the jewel image.
+        __init__(image_path: str, x: int, y: int, speed: int, window_height: int, rng: random.Random | None):
+            Initializes the Jewel object with the given parameters and a random value.
+        reset(image_folder: str, x: int, y: int, jewel_speed: int, window_height: int, rng: random.Random | None):
+            Reinitializes the jewel for a new spawn, with a new random image and value.
+        random_value(rng: random.Random | None) -> int:
+            Returns a random value for a new jewel.
         update():
             Updates the position of the jewel and removes it if it goes out of the game window.
     """
@@ -28,7 +31,8 @@ class Jewel(Coin):
     y: int
     speed: int
     image_path: str
-    def __init__(self, image_folder: str, x: int, y: int, jewel_speed: int, window_height: int) -> None:
+    def __init__(self, image_folder: str, x: int, y: int, jewel_speed: int, window_height: int,
+                 rng: random.Random | None = None) -> None:
         """
         Initializes a Jewel object.
         Args:
@@ -37,18 +41,44 @@ class Jewel(Coin):
             y (int): The y-coordinate of the jewel's position.
             jewel_speed (int): The speed at which the jewel moves.
             window_height (int): The height of the game window.
+            rng (random.Random | None): The random generator of the image and the value, the random module if None.
         Attributes:
             window_height (int): The height of the game window.
         """
+        BaseSprite.__init__(self)
+        self.reset(image_folder, x, y, jewel_speed, window_height, rng)
+
+    def reset(self, image_folder: str, x: int, y: int, jewel_speed: int, window_height: int,
+              rng: random.Random | None = None) -> None:
+        """
+        Reinitializes the jewel for a new spawn, as if it had just been created.
+
+        Args:
+            image_folder (str): The file path to the image representing the jewel.
+            x (int): The x-coordinate of the jewel's position.
+            y (int): The y-coordinate of the jewel's position.
+            jewel_speed (int): The speed at which the jewel moves.
+            window_height (int): The height of the game window.
+            rng (random.Random | None): The random generator of the image and the value, the random module if None.
+        """
         # Select a random image from the provided folder
-        _, image_path = src.helpers.ImageHelper.get_random_image(image_folder=image_folder)
+        _, image_path = src.helpers.ImageHelper.get_random_image(image_folder=image_folder, rng=rng)
 
-        # Load the base image
-        super().__init__(image_path, x, y, jewel_speed, window_height)
-        self.window_height = window_height
+        # Load the base image with a random jewel value
+        super().reset(image_path, x, y, jewel_speed, window_height, rng)
+
+    @staticmethod
+    def random_value(rng: random.Random | None = None) -> int:
+        """
+        Returns a random value for a new jewel.
 
-        # Assign a random value to the jewel
-        self.value = random.randint(50, 100)
+        Args:
+            rng (random.Random | None): The random generator, the random module if None.
+
+        Returns:
+            int: The value of the jewel, between 50 and 100.
+        """
+        return (random if rng is None else rng).randint(50, 100)
 
 
     def update(self) -> None:
@@ -1,41 +1,50 @@
 #!/usr/bin/env python3
-import re
+
+import random
 
 import pygame
 
 from .base import BaseSprite
+from .monstertype import MonsterType, MonsterTypeRegistry
 from src.helpers import ImageHelper
 
 class Monster(BaseSprite):
     """
     A class representing a monster in the game.
+
+    The image, damage, collision mask and size are shared by every monster spawned from the
+    same image through its MonsterType, so a monster only holds its position and fade state.
+
     Attributes:
+        monster_type (MonsterType): The shared data of the monster image.
         window_height (int): The height of the game window.
         fade_start_time (int): The time when the fade out started.
         fade_duration (int): The duration of the fade out effect in milliseconds.
         damage (int): The amount of damage the monster can inflict.
     Methods:
-        __init__(image_path: str, x: int, y: int, monster_speed: int, window_height: int):
+        __init__(image_path: str, x: int, y: int, monster_speed: int, window_height: int, rng: random.Random | None):
             Initializes a new instance of the Monster class.
-        fade_out(current_time: int) -> bool:
-            Handles the fade out effect of the monster.
-        update(current_time: int):
+        reset(image_folder: str, x: int, y: int, monster_speed: int, window_height: int, rng: random.Random | None):
+            Reinitializes the monster for a new spawn, so a pooled monster can be reused.
+        fade_out(current_time: int):
+            Starts the fade out effect of the monster.
+        update(current_time: int | None):
             Updates the monster's position and handles its fade out and removal.
     """
+    monster_type: MonsterType
     fade: bool
     window_height: int
     fade_start_time: int
     fade_duration: int
-    damage: int
     image: pygame.Surface
     rect: pygame.Rect
     speed: int
-    image_path: str
     x: int
     y: int
-    MONSTER_IMAGE: pygame.Surface
+    alpha: int
 
-    def __init__(self, image_folder: str, x: int, y: int, monster_speed: int, window_height: int) -> None:
+    def __init__(self, image_folder: str, x: int, y: int, monster_speed: int, window_height: int,
+                 rng: random.Random | None = None) -> None:
         """
         Initialize a Monster entity.
 
@@ -45,80 +54,122 @@ class Monster(BaseSprite):
             y (int): The initial y-coordinate of the monster.
             monster_speed (int): The speed at which the monster moves.
             window_height (int): The height of the game window.
+            rng (random.Random | None): The random generator choosing the image, the random module if None.
 
         Attributes:
             window_height (int): The height of the game window.
         """
         super(Monster, self).__init__()
+        self.reset(image_folder, x, y, monster_speed, window_height, rng)
+
+    def reset(self, image_folder: str, x: int, y: int, monster_speed: int, window_height: int,
+              rng: random.Random | None = None) -> None:
+        """
+        Reinitializes the monster for a new spawn, as if it had just been created.
 
+        The rect of the monster is reused, and its image and fade state are those of a new monster.
 
+        Args:
+            image_folder (str): The folder path to the monster's images.
+            x (int): The initial x-coordinate of the monster.
+            y (int): The initial y-coordinate of the monster.
+            monster_speed (int): The speed at which the monster moves.
+            window_height (int): The height of the game window.
+            rng (random.Random | None): The random generator choosing the image, the random module if None.
+        """
         # Select a random image from the provided folder
-        random_image, image_path = ImageHelper.get_random_image(image_folder)
+        random_image, image_path = ImageHelper.get_random_image(image_folder, rng)
 
-        self.image_path = image_path
+        self.monster_type = MonsterTypeRegistry.get(random_image, image_path)
         self.x = x
         self.y = y
         self.window_height = window_height
-        self.image = pygame.image.load(self.image_path)
-        self.rect = self.image.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
+        self.image = self.monster_type.image
+        self.rect.update((x, y), self.monster_type.size)
         self.speed = monster_speed
-
-        self.MONSTER_IMAGE = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        self.MONSTER_IMAGE.fill(pygame.Color('dodgerblue'))
+        self.previous_position = None
 
         # Initialize fade out attributes
         self.fade_start_time: int = 0
         self.fade_duration = 4000  # Default fade duration in milliseconds
         self.fade = False
         self.alpha = 255
-        self.window_height = window_height
 
-        # the damage value is extracted from the image file name
-        # Extract the first sequence of digits from the filename
-        match: re.Match[str] | None = re.search(r'\d+', random_image)
-        self.damage = int(match.group()) if match else 1
+    @property
+    def image_path(self) -> str:
+        """
+        The file path of the monster image.
+        """
+        return self.monster_type.image_path
 
-        #resize the image based on the monster's damage
-        new_width = int(self.rect.width * (1 + (self.damage / 100)))
-        new_height = int(self.rect.height * (1 + (self.damage / 100)))
+    @property
+    def damage(self) -> int:
+        """
+        The amount of damage the monster can inflict.
+        """
+        return self.monster_type.damage
 
-        self.image = pygame.transform.scale(self.image, (new_width, new_height))
+    @property
+    def mask(self) -> pygame.Mask:
+        """
+        The shared collision mask of the monster image.
+        """
+        return self.monster_type.mask
 
-    def fade_out(self, current_time) -> None:
+    def fade_out(self, current_time: int) -> None:
         """
         Starts the fade-out effect for the monster.
+
+        Calling this method on a monster that is already fading does not restart the fade.
+
         Args:
             current_time (int): The current time in milliseconds.
         """
+        if self.fade:
+            return
         self.fade = True
         self.fade_start_time = current_time
 
-    def update(self) -> None:
-        # Updates the state of the monster, including handling the fade-out effect
+    def update_fade(self, current_time: int | None = None) -> None:
+        """
+        Lowers the alpha of a fading monster for the current time, and removes it once invisible.
+
+        Args:
+            current_time (int | None): The current time in milliseconds, pygame.time.get_ticks() if None.
+
+        Returns:
+            None
+        """
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+        elapsed: int = max(0, current_time - self.fade_start_time)
+        remaining: int = round(255 * (1 - elapsed / self.fade_duration)) if self.fade_duration > 0 else 0
+
+        # alpha only decreases and is always within [0, 255]
+        self.alpha = max(0, min(255, self.alpha, remaining))
+        self.image = self.monster_type.fade_frame(self.alpha)
+        if self.alpha <= 0:  # Kill the sprite when the alpha is <= 0.
+            self.kill()
+
+    def update(self, current_time: int | None = None) -> None:
         """
         Updates the monster's position and handles its fade out and removal.
 
+        While fading, the alpha of the monster goes from 255 to 0 over fade_duration
+        milliseconds since fade_start_time, and the monster is removed once invisible.
+        Only the faded images shared by the MonsterType are used, so no surface is allocated.
+
+        Args:
+            current_time (int | None): The current time in milliseconds, pygame.time.get_ticks() if None.
+
         Returns:
             None
         """
         self.rect.y += self.speed
 
         # Handle fade-out effect if fading
-        if self.fade:  # If the fade effect is activated.
-            # Reduce the alpha each frame, create a new copy of the original
-            # image and fill it with white (with the self.alpha value)
-            # and pass the BLEND_RGBA_MULT special_flag to reduce the alpha.
-            if self.alpha > 255:
-                self.alpha = 255
-
-            self.alpha: int = max(0, self.alpha)  # alpha should never be < 0.
-            self.image = self.MONSTER_IMAGE.copy()
-            self.image.fill((255, 255, 255, self.alpha), special_flags=pygame.BLEND_RGBA_MULT)
-            if self.alpha <= 0:  # Kill the sprite when the alpha is <= 0.
-                self.kill()
-
+        if self.fade:
+            self.update_fade(current_time)
 
         # If the monster moves out of the window, kill it
         if self.rect.top > self.window_height:
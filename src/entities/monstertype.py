@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+import os
+import re
+
+import pygame
+
+from src.helpers import ImageHelper, SurfaceCache
+
+
+class MonsterType:
+    """
+    The data shared by every monster spawned from the same image.
+
+    Attributes:
+        image_name (str): The file name of the monster image.
+        image_path (str): The file path of the monster image.
+        damage (int): The damage inflicted by the monster, taken from the first number in the file name.
+        image (pygame.Surface): The monster image scaled by its damage.
+        mask (pygame.Mask): The collision mask of the scaled image.
+        size (tuple[int, int]): The size of the scaled image.
+        fade_frames (list[pygame.Surface | None]): The faded images, built the first time they are needed.
+    """
+
+    # Number of precomputed alpha levels of every monster image
+    FADE_STEPS: int = 32
+
+    image_name: str
+    image_path: str
+    damage: int
+    image: pygame.Surface
+    mask: pygame.Mask
+    size: tuple[int, int]
+    fade_frames: list[pygame.Surface | None]
+
+    def __init__(self, image_name: str, image_path: str) -> None:
+        """
+        Initialize a MonsterType from its image.
+
+        Args:
+            image_name (str): The file name of the monster image.
+            image_path (str): The file path of the monster image.
+
+        Raises:
+            pygame.error: If the image cannot be loaded.
+        """
+        self.image_name = image_name
+        self.image_path = image_path
+
+        # the damage value is extracted from the image file name
+        # Extract the first sequence of digits from the filename
+        match: re.Match[str] | None = re.search(r'\d+', image_name)
+        self.damage = int(match.group()) if match else 1
+
+        # resize the image based on the monster's damage
+        original: pygame.Surface = SurfaceCache.get(image_path)
+        new_width = int(original.get_width() * (1 + (self.damage / 100)))
+        new_height = int(original.get_height() * (1 + (self.damage / 100)))
+        self.image = pygame.transform.scale(original, (new_width, new_height))
+
+        self.mask = pygame.mask.from_surface(self.image)
+        self.size = (new_width, new_height)
+        self.fade_frames = [self.image] + [None] * (self.FADE_STEPS - 1)
+
+    def fade_frame(self, alpha: int) -> pygame.Surface:
+        """
+        Returns the faded image closest to the given alpha.
+
+        Args:
+            alpha (int): The alpha of the monster, from 0 (invisible) to 255 (opaque).
+
+        Returns:
+            pygame.Surface: The faded image.
+        """
+        step: int = round((255 - alpha) * (self.FADE_STEPS - 1) / 255)
+        image: pygame.Surface | None = self.fade_frames[step]
+        if image is None:
+            image = self.image.copy()
+            if not image.get_flags() & pygame.SRCALPHA:
+                image = pygame.Surface(self.size, pygame.SRCALPHA)
+                image.blit(self.image, (0, 0))
+            level: int = round(255 * (1 - step / (self.FADE_STEPS - 1)))
+            image.fill((255, 255, 255, level), special_flags=pygame.BLEND_RGBA_MULT)
+            self.fade_frames[step] = image
+        return image
+
+
+class MonsterTypeRegistry:
+    """
+    The registry of monster types, one per monster image.
+
+    This class provides static methods to:
+    - Register every monster image of a folder once at startup.
+    - Return the shared MonsterType of an image, creating it the first time.
+    """
+
+    _types: dict[str, MonsterType] = {}
+
+    @staticmethod
+    def get(image_name: str, image_path: str) -> MonsterType:
+        """
+        Returns the monster type of the given image.
+
+        Args:
+            image_name (str): The file name of the monster image.
+            image_path (str): The file path of the monster image.
+
+        Returns:
+            MonsterType: The shared monster type.
+        """
+        key: str = SurfaceCache.key(image_path)
+        monster_type: MonsterType | None = MonsterTypeRegistry._types.get(key)
+        if monster_type is None:
+            monster_type = MonsterType(image_name, image_path)
+            MonsterTypeRegistry._types[key] = monster_type
+        return monster_type
+
+    @staticmethod
+    def preload(image_folder: str) -> list[MonsterType]:
+        """
+        Registers every monster image of a folder.
+
+        Args:
+            image_folder (str): The folder containing the monster images.
+
+        Returns:
+            list[MonsterType]: The monster types of the folder.
+        """
+        image_files, _ = ImageHelper.index_folder(image_folder)
+        return [
+            MonsterTypeRegistry.get(image_file, os.path.join(image_folder, image_file))
+            for image_file in image_files
+        ]
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes every monster type from the registry.
+        """
+        MonsterTypeRegistry._types.clear()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+import pygame
+
+from constants import WINDOW_HEIGHT
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class EntityStore:
+    """
+    The falling entities of a game kept as a struct of NumPy arrays, one slot per entity.
+
+    The position, size, speed, kind, value, damage and liveness of every entity are columns
+    of arrays, so moving every entity by its speed, culling the ones that left the window and
+    testing them against a rect each run as a few vectorized operations per tick, whatever
+    the number of entities. The arrays hold the position of the entities: the sprites only
+    remain as thin views for drawing, placed by positions(), and their rect is only written
+    back from the arrays by sync(), when something reads it.
+
+    Killed entities leave a free slot, reused by the next entity added. The kinds are the
+    ArrayGroups made by group(), so every query can be limited to one group.
+
+    Attributes:
+        window_height (int): The height below which an entity is culled.
+        x, y, w, h (numpy.ndarray): The rect of every slot.
+        previous_y (numpy.ndarray): The vertical position of every slot before the last tick.
+        speed (numpy.ndarray): The pixels every slot falls by on each tick.
+        kind (numpy.ndarray): The group of every slot.
+        value (numpy.ndarray): The value of every slot, 0 for the entities without one.
+        damage (numpy.ndarray): The damage of every slot, 0 for the entities without one.
+        alive (numpy.ndarray): Whether every slot holds an entity.
+        sprites (list[pygame.sprite.Sprite | None]): The sprite of every slot.
+        count (int): The number of slots in use or freed, the length of the columns queried.
+    """
+
+    COLUMNS: tuple[str, ...] = (
+        "x", "y", "w", "h", "previous_y", "speed", "kind", "value", "damage", "alive", "serial",
+    )
+
+    window_height: int
+    sprites: list[pygame.sprite.Sprite | None]
+    count: int
+
+    def __init__(self, window_height: int = WINDOW_HEIGHT, capacity: int = 64) -> None:
+        """
+        Initialize an empty EntityStore.
+
+        Args:
+            window_height (int): The height below which an entity is culled.
+            capacity (int): The number of slots allocated up front, doubled whenever they are all used.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+            ValueError: If capacity is not positive.
+        """
+        if numpy is None:
+            raise RuntimeError("The entity store requires NumPy.")
+        if capacity <= 0:
+            raise ValueError("Capacity must be a positive value.")
+
+        self.window_height = window_height
+        self.x = numpy.zeros(capacity, numpy.int64)
+        self.y = numpy.zeros(capacity, numpy.int64)
+        self.w = numpy.zeros(capacity, numpy.int64)
+        self.h = numpy.zeros(capacity, numpy.int64)
+        self.previous_y = numpy.zeros(capacity, numpy.int64)
+        self.speed = numpy.zeros(capacity, numpy.int64)
+        self.kind = numpy.zeros(capacity, numpy.int16)
+        self.value = numpy.zeros(capacity, numpy.int64)
+        self.damage = numpy.zeros(capacity, numpy.int64)
+        self.alive = numpy.zeros(capacity, bool)
+        # the insertion order of every slot, so the queries list the sprites in the order they were added
+        self.serial = numpy.zeros(capacity, numpy.int64)
+        self.sprites = [None] * capacity
+        self.count = 0
+        self._slots: dict[pygame.sprite.Sprite, int] = {}
+        self._free: list[int] = []
+        self._serial = 0
+        self._kinds = 0
+        # whether the rects of the sprites are behind the arrays
+        self._stale = False
+
+    @staticmethod
+    def available() -> bool:
+        """
+        Returns whether NumPy is installed, so an EntityStore can be created.
+
+        Returns:
+            bool: True if NumPy is installed.
+        """
+        return numpy is not None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, sprite: pygame.sprite.Sprite) -> bool:
+        return sprite in self._slots
+
+    @property
+    def capacity(self) -> int:
+        return len(self.sprites)
+
+    def group(self, *sprites: pygame.sprite.Sprite) -> "ArrayGroup":
+        """
+        Returns a new group whose sprites are entities of the store, of a kind of its own.
+
+        Args:
+            *sprites (pygame.sprite.Sprite): The sprites of the group.
+
+        Returns:
+            ArrayGroup: The group.
+        """
+        kind: int = self._kinds
+        self._kinds += 1
+        return ArrayGroup(self, kind, *sprites)
+
+    def _grow(self) -> None:
+        capacity: int = self.capacity * 2
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            grown = numpy.zeros(capacity, column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+        self.sprites.extend([None] * (capacity - len(self.sprites)))
+
+    def add(self, sprite: pygame.sprite.Sprite, kind: int = 0) -> int:
+        """
+        Copies a sprite into a free slot, or updates its slot if it is already in the store.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite, with a rect and optionally a speed, value and damage.
+            kind (int): The kind of the entity.
+
+        Returns:
+            int: The slot of the entity.
+        """
+        slot: int | None = self._slots.get(sprite)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                if self.count == self.capacity:
+                    self._grow()
+                slot = self.count
+                self.count += 1
+            self._slots[sprite] = slot
+            self.sprites[slot] = sprite
+            self.serial[slot] = self._serial
+            self._serial += 1
+
+        rect: pygame.Rect = sprite.rect
+        self.x[slot], self.y[slot], self.w[slot], self.h[slot] = rect
+        self.previous_y[slot] = rect.y
+        self.speed[slot] = getattr(sprite, "speed", 0)
+        self.kind[slot] = kind
+        self.value[slot] = getattr(sprite, "value", 0)
+        self.damage[slot] = getattr(sprite, "damage", 0)
+        self.alive[slot] = True
+        return slot
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Frees the slot of a sprite, if it is in the store.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite.
+        """
+        slot: int | None = self._slots.pop(sprite, None)
+        if slot is None:
+            return
+        self.alive[slot] = False
+        self.sprites[slot] = None
+        self._free.append(slot)
+
+    def step(self) -> list[pygame.sprite.Sprite]:
+        """
+        Moves every entity down by its speed, and returns the ones that left the window.
+
+        The culled entities stay in the store until their sprite is killed, which removes them.
+        The rects of the sprites are left behind until sync() is called.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites whose top is below the window height.
+        """
+        count: int = self.count
+        alive = self.alive[:count]
+        y = self.y[:count]
+        self.previous_y[:count] = y
+        y += self.speed[:count] * alive
+        self._stale = True
+        culled = numpy.flatnonzero(alive & (y > self.window_height))
+        return [self.sprites[slot] for slot in culled.tolist()]
+
+    def sync(self) -> None:
+        """
+        Writes the vertical position of every entity back to the rect of its sprite, if
+        they moved since the last call.
+        """
+        if not self._stale:
+            return
+        self._stale = False
+        slots = numpy.flatnonzero(self.alive[:self.count])
+        sprites = self.sprites
+        for slot, y in zip(slots.tolist(), self.y[slots].tolist()):
+            sprites[slot].rect.y = y
+
+    def settle(self) -> None:
+        """
+        Saves the current position of every entity as its previous one, for the ticks
+        where nothing moves, so the frames drawn do not interpolate a stale movement.
+        """
+        self.previous_y[:self.count] = self.y[:self.count]
+
+    def positions(self, alpha: float) -> list[tuple[pygame.sprite.Sprite, tuple[int, int]]]:
+        """
+        Returns every sprite with its position between its previous and current positions.
+
+        Args:
+            alpha (float): How far from the previous position, from 0 to 1.
+
+        Returns:
+            list[tuple[pygame.sprite.Sprite, tuple[int, int]]]: The sprites and their interpolated
+                top left corner, in the order they were added.
+        """
+        slots = numpy.flatnonzero(self.alive[:self.count])
+        slots = slots[numpy.argsort(self.serial[slots], kind="stable")]
+        previous = self.previous_y[slots]
+        y = numpy.round(previous + (self.y[slots] - previous) * alpha).astype(numpy.int64)
+        sprites = self.sprites
+        return list(zip([sprites[slot] for slot in slots.tolist()], zip(self.x[slots].tolist(), y.tolist())))
+
+    def _overlaps(self, rect: pygame.Rect, kind: int | None):
+        count: int = self.count
+        x = self.x[:count]
+        y = self.y[:count]
+        w = self.w[:count]
+        h = self.h[:count]
+        # the same test as pygame.Rect.colliderect, where an empty rect never collides
+        mask = (
+            self.alive[:count] & (w > 0) & (h > 0)
+            & (x < rect.right) & (x + w > rect.left) & (y < rect.bottom) & (y + h > rect.top)
+        )
+        if kind is not None:
+            mask &= self.kind[:count] == kind
+        return mask
+
+    def overlapping(self, rect: pygame.Rect, kind: int | None = None) -> list[pygame.sprite.Sprite]:
+        """
+        Returns the sprites whose rect collides with a rect.
+
+        Args:
+            rect (pygame.Rect): The rect.
+            kind (int | None): The kind of the entities tested, every kind if None.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The colliding sprites, in the order they were added.
+        """
+        if not rect.width or not rect.height:
+            return []
+        slots = numpy.flatnonzero(self._overlaps(rect, kind))
+        if len(slots) > 1:
+            slots = slots[numpy.argsort(self.serial[slots], kind="stable")]
+        return [self.sprites[slot] for slot in slots.tolist()]
+
+    def any_overlap(self, rect: pygame.Rect, kind: int | None = None) -> bool:
+        """
+        Returns whether any sprite collides with a rect.
+
+        Args:
+            rect (pygame.Rect): The rect.
+            kind (int | None): The kind of the entities tested, every kind if None.
+
+        Returns:
+            bool: True if a sprite collides with the rect.
+        """
+        if not rect.width or not rect.height:
+            return False
+        return bool(self._overlaps(rect, kind).any())
+
+    def clear(self) -> None:
+        """
+        Removes every entity from the store.
+        """
+        self.alive[:] = False
+        self.sprites = [None] * self.capacity
+        self.count = 0
+        self._slots.clear()
+        self._free.clear()
+
+
+class ArrayGroup(pygame.sprite.Group):
+    """
+    A sprite group whose sprites are entities of one kind of an EntityStore.
+
+    The sprites are copied into the store when they join the group and removed from it when
+    they leave it or are killed. The store moves the sprites, so update() does not: only a
+    sprite changed outside of the store must be copied again with ``store.add(sprite, kind)``.
+
+    Attributes:
+        store (EntityStore): The store of the sprites of the group.
+        kind (int): The kind of the sprites of the group in the store.
+    """
+
+    store: EntityStore
+    kind: int
+
+    def __init__(self, store: EntityStore, kind: int, *sprites: pygame.sprite.Sprite) -> None:
+        """
+        Initialize an ArrayGroup.
+
+        Args:
+            store (EntityStore): The store of the sprites of the group.
+            kind (int): The kind of the sprites of the group in the store.
+            *sprites (pygame.sprite.Sprite): The sprites of the group.
+        """
+        self.store = store
+        self.kind = kind
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int | None = None) -> None:
+        super().add_internal(sprite, layer)
+        self.store.add(sprite, self.kind)
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+        self.store.remove(sprite)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Does nothing: the sprites of the group are moved by the store.
+        """
+
+    def collide(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """
+        Returns the sprites of the group whose rect collides with a rect.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The colliding sprites, in the order they joined the group.
+        """
+        return self.store.overlapping(rect, self.kind)
+
+    def collideany(self, rect: pygame.Rect) -> bool:
+        """
+        Returns whether any sprite of the group collides with a rect.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            bool: True if a sprite collides with the rect.
+        """
+        return self.store.any_overlap(rect, self.kind)
@@ -1,18 +1,22 @@
 #!/usr/bin/env python3
 
-from typing import cast
+from typing import Sequence
 import pygame
-import random
-import math
+import time
 
 from pygame.font import Font
 from constants import *
-from entities.base import BaseSprite
-from utils import apply_flame_ripple
-from assets_loader import load_fonts, load_images, load_sounds
-
-
-from src.entities import Hero, Monster, Coin, Jewel, BaseSprite
+from effects import HaloAnimation
+from hud import Hud
+from background import ScrollingBackground
+from profiler import FrameProfiler
+from compositor import FrameCompositor, Layer
+from assets_loader import AssetLoader, read_font_data, load_fonts, submit_images, install_images, submit_sounds, play_music
+from splash import SplashScreen
+from voices import VoiceManager, VolumeCurve
+from inputs import encode_keys
+from replay import Replay, state_checksum
+from world import World
 
 
 class Game:
@@ -24,197 +28,206 @@ class Game:
     bg_image: pygame.Surface
     hero_image: pygame.Surface
     coin_image: pygame.Surface
-    COIN_SOUND: pygame.mixer.Sound
-    JEWEL_SOUND: pygame.mixer.Sound
-    HIT: pygame.mixer.Sound
-    bg_width: int
-    bg_height: int
-    bg_x: int
-    bg_y: int
-    collected_jewels: int
-    collected_coins: int
-    hero: Hero
-    score: int
-    game_over: bool
+    COIN_SOUND: pygame.mixer.Sound | None
+    JEWEL_SOUND: pygame.mixer.Sound | None
+    HIT: pygame.mixer.Sound | None
+    background: ScrollingBackground
+    world: World
     clock: pygame.time.Clock
     running: bool
-    paused: bool
-    blink_duration: int
-    blink_start_time: int
-    hero_is_blinking: bool
-    level: int
-    all_sprites: pygame.sprite.Group = pygame.sprite.Group()
-    coins: pygame.sprite.Group = pygame.sprite.Group()
-    monsters: pygame.sprite.Group = pygame.sprite.Group()
-    jewels: pygame.sprite.Group = pygame.sprite.Group()
-    potions: pygame.sprite.Group = pygame.sprite.Group()
-    def __init__(self) -> None:
+    halo_animation: HaloAnimation
+    hud: Hud
+    profiler: FrameProfiler
+    compositor: FrameCompositor
+    pending_commands: int
+    recorder: Replay | None
+    loader: AssetLoader
+    voices: VoiceManager
+    volume_curves: dict[str, VolumeCurve]
+    start_time: float
+    def __init__(self, dirty_rects: bool = DIRTY_RECTS, splash: bool = True, seed: int | None = None,
+                 entity_store: bool = ENTITY_STORE) -> None:
         """
         Initialize a Game object.
 
         This method initializes the game by setting up the game window, loading
-        fonts, images, and sounds, setting up the background, hero, and score, and
+        fonts, images, and sounds, setting up the background and the world, and
         starting the game loop.
 
+        The simulation state of the game, its sprites, counters, timers and random
+        streams, is held by a World, which never draws nor plays a sound. The game
+        plays the events of every tick of its world, and draws the world between ticks.
+
+        The assets are decoded on a thread pool while a splash screen shows the progress.
+        Only the fonts and images are waited for: the sound effects keep loading in the
+        background and are picked up by the game loop once they are ready.
+
         Args:
-            None
+            dirty_rects (bool): If True, only the changed areas of the window are presented
+                with pygame.display.update() instead of flipping the whole window.
+            splash (bool): If False, the assets are loaded without showing the splash screen.
+            seed (int | None): The seed of the random generators of the world, a random one if None.
+            entity_store (bool): If True and NumPy is installed, the falling sprites are kept in an EntityStore.
 
         Attributes:
             screen (pygame.Surface): The game window.
             emoji_font, font, font_XL (Font): The fonts used in the game.
             bg_image, hero_image, coin_image (pygame.Surface): The images used in the game.
-            COIN_SOUND, JEWEL_SOUND, HIT (pygame.mixer.Sound): The sounds used in the game.
-            bg_width, bg_height (int): The width and height of the background image.
-            bg_x, bg_y (int): The x and y coordinates of the background image.
-            collected_jewels, collected_coins (int): The number of jewels and coins collected.
-            hero (Hero): The hero object.
-            all_sprites (pygame.sprite.Group): A group of all sprites in the game.
-            score (int): The score of the game.
-            game_over (bool): A flag indicating if the game is over.
+            COIN_SOUND, JEWEL_SOUND, HIT (pygame.mixer.Sound | None): The sounds used in the game,
+                None until they are loaded or if they could not be loaded.
+            background (ScrollingBackground): The scrolling background tiled from bg_image.
+            world (World): The simulation state of the game.
             clock (pygame.time.Clock): The clock object used to control the game loop.
             running (bool): A flag indicating if the game is running.
-            paused (bool): A flag indicating if the game is paused.
-            blink_duration (int): The duration of the blinking effect in milliseconds.
-            blink_start_time (int): The start time of the blinking effect in milliseconds.
-            hero_is_blinking (bool): A flag indicating if the hero is blinking.
-            level (int): The current level of the game.
+            halo_animation (HaloAnimation): The precomputed halo drawn while the hero blinks.
+            hud (Hud): The heads-up display with the score, life, level, coins and jewels.
+            profiler (FrameProfiler): The per-frame measurements of the game loop.
+            compositor (FrameCompositor): The layered draw calls of the frame, presented once per tick.
+            pending_commands (int): The COMMAND_PAUSE and COMMAND_RESTART bits pressed since the last tick.
+            recorder (Replay | None): The replay recording the input and state of every tick, if any.
+            loader (AssetLoader): The thread pool loading the assets.
+            start_time (float): The time the game started, to report the time to the first frame.
+            voices (VoiceManager): The channel pools playing the sound effects.
+            volume_curves (dict[str, VolumeCurve]): The volume of the collected items by sound category.
         """
+        self.start_time = time.perf_counter()
         pygame.init()
         self.screen: pygame.Surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Hero vs Monsters")
 
-        self.emoji_font, self.font, self.font_XL = load_fonts()
-        self.bg_image, self.hero_image, self.coin_image = load_images()
-        self.COIN_SOUND, self.JEWEL_SOUND, self.HIT = load_sounds()
+        self.loader = AssetLoader()
+        image_tasks: list[str] = submit_images(self.loader)
+        self.loader.submit("font_data", read_font_data)
+        self._sound_tasks: dict[str, str] = submit_sounds(self.loader)
+        self.COIN_SOUND = self.JEWEL_SOUND = self.HIT = None
 
-        self.bg_width: int = self.bg_image.get_width()
-        self.bg_height: int = self.bg_image.get_height()
-        self.bg_x = 0
-        self.bg_y: int = -self.bg_height
+        self.loader.wait(image_tasks + ["font_data"], SplashScreen(self.screen).draw if splash else None)
+        self.emoji_font, self.font, self.font_XL = load_fonts(self.loader.result("font_data"))
+        self.bg_image, self.hero_image, self.coin_image = install_images(self.loader, image_tasks)
+        play_music()
+        self.voices = VoiceManager(VOICE_POOLS, MAX_VOICES)
+        self.volume_curves = {"coin": VolumeCurve(COIN_VOLUME_BASE), "jewel": VolumeCurve(JEWEL_VOLUME_BASE)}
 
-        self.collected_jewels = 0
-        self.collected_coins = 0
+        self.background = ScrollingBackground(self.bg_image, (WINDOW_WIDTH, WINDOW_HEIGHT), BACKGROUND_SPEED)
 
         pygame.display.set_icon(self.hero_image)
 
-        self.hero = self.create_hero()
-
-        self.all_sprites.add(self.hero)
-
-
-        self.score = 0
-        self.game_over = False
+        # the world is created once the images are installed, so its sprites never read a file
+        self.world = World(seed, entity_store)
 
         self.clock = pygame.time.Clock()
         self.running = True
-        self.paused = False
-        self.blink_duration = 2000
-        self.blink_start_time = 0
-        self.hero_is_blinking = False
-        self.level = 1
 
-    def create_hero(self) -> Hero:
+        self.halo_animation = HaloAnimation(rng=self.world.cosmetic_rng)
+        self.halo_animation.prepare(self.hero_image, self.world.hero.rect.size)
+
+        self.hud = Hud(self.emoji_font)
+        self.hud.add_line("score", "🏆 {}", TRANSPARENT_WHITE)
+        self.hud.add_line("life", "❤️ {}", TRANSPARENT_WHITE)
+        self.hud.add_line("level", "📈 {}", TRANSPARENT_WHITE)
+        self.hud.add_line("coins", "🪙 {}", TRANSPARENT_WHITE)
+        self.hud.add_line("jewels", "💎 {}", WHITE)
+
+        self.profiler = FrameProfiler()
+        self.compositor = FrameCompositor(self.screen, dirty_rects, self.profiler)
+        self._game_over_texts: list[tuple[pygame.Surface, pygame.Rect]] = []
+        self._sprite_rects: list[pygame.Rect] = []
+        self._halo_rect: pygame.Rect | None = None
+        self.pending_commands = 0
+        self.recorder = None
+
+    def collect_sounds(self) -> None:
         """
-        Create a hero object.
+        Pick up the sound effects that finished loading in the background.
 
-        This method creates a hero object with the specified position and speed.
+        A sound that could not be loaded is left as None, so the game runs without it, like
+        any other missing asset.
 
         Returns:
-            hero (Hero): The hero object.
-        """
-        hero: Hero = Hero(
-            os.path.join(SPRITES_PATH, "hero.png"),
-            WINDOW_WIDTH // 2 - self.hero_image.get_width() // 2,
-            WINDOW_HEIGHT - self.hero_image.get_height() - 10,
-            HERO_SPEED,
-            WINDOW_WIDTH,
-        )
-        return hero
-
-    def create_coin(self) -> Coin:
+            None
+        """
+        for attribute, task in list(self._sound_tasks.items()):
+            if not self.loader.done(task):
+                continue
+            del self._sound_tasks[attribute]
+            try:
+                setattr(self, attribute, self.loader.result(task))
+            except pygame.error:
+                pass
+        if not self._sound_tasks:
+            self.loader.shutdown()
+
+    def display_hud(self, surface: pygame.Surface) -> list[pygame.Rect]:
         """
-        Create a coin object.
+        Display the score, life points, level, coins and jewels.
 
-        This method creates a coin object with a random x-coordinate within the window width
-        and an initial y-coordinate of 0. The coin moves downwards with the specified speed.
+        The HUD only renders again the lines whose value changed since the previous frame,
+        and is drawn on the surface with a single blit.
 
-        Returns:
-            coin (Coin): The coin object.
-        """
-        x: int = random.randint(0, WINDOW_WIDTH - self.coin_image.get_width())
-        y: int = self.coin_image.get_height()
-        return Coin(
-            os.path.join(SPRITES_PATH, "coin.png"),
-            x,
-            y,
-            COIN_SPEED,
-            WINDOW_HEIGHT,
-        )
+        Args:
+            surface (pygame.Surface): The surface to draw on.
 
-    @staticmethod
-    def create_jewel() -> Jewel:
+        Returns:
+            list[pygame.Rect]: The area of the surface covered by the HUD if any line changed,
+                or an empty list otherwise.
+        """
+        previous_rect: pygame.Rect = self.hud.get_rect()
+        changed: list[bool] = [
+            self.hud.set("score", self.world.score),
+            self.hud.set("life", self.world.hero.life_points),
+            self.hud.set("level", self.world.level),
+            self.hud.set("coins", self.world.collected_coins),
+            self.hud.set("jewels", self.world.collected_jewels),
+        ]
+        rect: pygame.Rect = self.hud.draw(surface)
+        return [rect.union(previous_rect)] if any(changed) else []
+
+    def draw_background(self, surface: pygame.Surface) -> list[pygame.Rect]:
         """
-        Create a jewel object.
+        Draw the scrolling background, timing it in the profiler as "background".
 
-        This method creates a jewel object with a random x-coordinate within the window width
-        and an initial y-coordinate of 0. The jewel moves downwards with the specified speed.
+        Args:
+            surface (pygame.Surface): The surface to draw on.
 
         Returns:
-            jewel (Jewel): The jewel object.
+            list[pygame.Rect]: The bands of the surface whose background changed since the last frame.
         """
-        x: int = random.randint(0, WINDOW_WIDTH - 64)
-        y: int = 0
-        return Jewel(JEWELS_PATH, x, y, JEWEL_SPEED, WINDOW_HEIGHT)
+        with self.profiler.section("background"):
+            return self.background.draw(surface, self.world.timestep.alpha)
 
-    @staticmethod
-    def create_monster() -> Monster:
+    def draw_sprites(self, surface: pygame.Surface) -> list[pygame.Rect]:
         """
-        Create a monster object.
+        Draw the sprites between their positions before and after the last simulation tick.
 
-        This method creates a monster object with a random x-coordinate within the window width
-        and an initial y-coordinate of 0. The monster moves downwards with the specified speed.
+        Args:
+            surface (pygame.Surface): The surface to draw on.
 
         Returns:
-            monster (Monster): The monster object.
+            list[pygame.Rect]: The areas of the surface covered by the sprites in this frame
+                and in the previous one.
         """
-        x: int = random.randint(0, WINDOW_WIDTH - 64)
-        return Monster(MONSTERS_PATH, x, 0, MONSTER_SPEED, WINDOW_HEIGHT)
-
-    def display_score(self) -> None:
-        score_text: pygame.Surface = self.emoji_font.render(f"🏆 {self.score}", True, TRANSPARENT_WHITE)
-        self.screen.blit(score_text, (10, 10))
-
-    def display_life(self) -> None:
-        life_text: pygame.Surface = self.emoji_font.render(f"❤️ {self.hero.life_points}", True, TRANSPARENT_WHITE)
-        self.screen.blit(life_text, (10, 50))
-
-    def display_level(self) -> None:
-        level_text: pygame.Surface = self.emoji_font.render(f"📈 {self.level}", True, TRANSPARENT_WHITE)
-        self.screen.blit(level_text, (10, 90))
-
-    def display_coins(self) -> None:
-        coins_text: pygame.Surface = self.emoji_font.render(
-            f"🪙 {self.collected_coins}", True, TRANSPARENT_WHITE
-        )
-        self.screen.blit(coins_text, (10, 130))
-
-    def display_jewels(self) -> None:
-        jewels_text: pygame.Surface = self.emoji_font.render(f"💎 {self.collected_jewels}", True, WHITE)
-        self.screen.blit(jewels_text, (10, 170))
+        world: World = self.world
+        alpha: float = world.timestep.alpha
+        if world.store is None:
+            placed = [(sprite, sprite.interpolated_position(alpha)) for sprite in world.all_sprites]
+        else:
+            # the hero is always the first sprite, the others are placed in the order they spawned
+            placed = [(world.hero, world.hero.interpolated_position(alpha)), *world.store.positions(alpha)]
+        rects: list[pygame.Rect] = [surface.blit(sprite.image, position) for sprite, position in placed]
+        dirty: list[pygame.Rect] = rects + self._sprite_rects
+        self._sprite_rects = rects
+        return dirty
 
     def display_game_over(self) -> None:
         """
-        Display the game over screen with a blinking hero and a restart message.
+        Show the game over screen with a blinking hero and a restart message.
 
-        This method renders the game over text in red and golden colors, with a blinking
-        hero in the background. The text is centered on the screen and the method updates
-        the display after rendering the text.
+        The game over screen is an overlay of the compositor, drawn on every frame until the
+        game is reset. The red and golden texts are rendered once, when the overlay is added.
 
         Returns:
             None
         """
-
-        self.blink_hero()
         text: str = f"💀 Game Over! Press Space to Restart"
 
         game_over_text_red: pygame.Surface = self.font_XL.render(text, True, REDFIRETRANS)
@@ -225,261 +238,242 @@ class Game:
         text_rect_golden: pygame.Rect = game_over_text_golden.get_rect(
             center=(WINDOW_WIDTH // 2 + 3, WINDOW_HEIGHT // 2 + 3)
         )
+        self._game_over_texts = [(game_over_text_red, text_rect), (game_over_text_golden, text_rect_golden)]
+
+        self.compositor.add_overlay("game_over", self.draw_game_over)
+
+    def draw_game_over(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Draw the game over overlay: the blinking hero and the restart message.
 
-        self.screen.blit(game_over_text_red, text_rect)
-        self.screen.blit(game_over_text_golden, text_rect_golden)
+        Args:
+            surface (pygame.Surface): The surface to draw on.
 
-        pygame.display.flip()
+        Returns:
+            list[pygame.Rect]: The areas of the surface covered by the hero halo and the texts.
+        """
+        rects: list[pygame.Rect] = [self.draw_hero_halo(surface)]
+        for text_surface, text_rect in self._game_over_texts:
+            rects.append(surface.blit(text_surface, text_rect))
+        return rects
 
     def blink_hero(self) -> None:
         """
         Blink the hero with a golden and red glow effect.
 
-        This method blinks the hero by alternating between a golden and red glow effect
-        on the hero's image. The glow effect is achieved by creating a surface with a
-        circular mask and then applying a flame ripple effect to the surface. The
-        resulting surface is then blitted onto the screen at the hero's position.
-
-        The method also updates the display after blitting the surface.
+        This method blinks the hero by alternating between a golden silhouette of the hero
+        and the same silhouette surrounded by a rippled golden and red flame halo. The
+        silhouette and the halo frames are baked once by the HaloAnimation, and are drawn
+        on the halo layer of the current frame, above the sprites.
 
         Returns:
             None
         """
-        mask: pygame.Mask = pygame.mask.from_surface(self.hero_image)
-        mask_surface: pygame.Surface = mask.to_surface(setcolor=GOLDENTRANS, unsetcolor=(0, 0, 0, 0))
-        ripple_amplitude = 20
-        ripple_frequency = 30
-        ripple_speed = 0.6
-        ripple_offset: float = pygame.time.get_ticks() * ripple_speed
+        self.compositor.submit(Layer.HALOS, self.draw_hero_halo)
 
-        halo_size: tuple[int, int] = (self.hero.rect.width + 15, self.hero.rect.height + 25)
-        halo_surface_golden = pygame.Surface(halo_size, pygame.SRCALPHA)
-        pygame.draw.ellipse(halo_surface_golden, GOLDENTRANS, halo_surface_golden.get_rect())
+    def draw_hero_halo(self, surface: pygame.Surface) -> pygame.Rect:
+        """
+        Draw the hero silhouette and its flame halo for the current time.
 
-        red_halo_size: tuple[int, int] = (self.hero.rect.width + 25, self.hero.rect.height + 35)
-        halo_surface_red = pygame.Surface(red_halo_size, pygame.SRCALPHA)
-        pygame.draw.ellipse(halo_surface_red, REDFIRETRANS, halo_surface_red.get_rect())
+        Args:
+            surface (pygame.Surface): The surface to draw on.
 
-        halo_surface_golden_rippled: pygame.Surface = apply_flame_ripple(
-            halo_surface_golden, ripple_amplitude, ripple_frequency, ripple_speed, ripple_offset
-        )
-        halo_surface_red_rippled: pygame.Surface = apply_flame_ripple(
-            halo_surface_red, ripple_amplitude, ripple_frequency, ripple_speed, ripple_offset
+        Returns:
+            pygame.Rect: The area of the surface covered by the halo.
+        """
+        self._halo_rect = self.halo_animation.draw(
+            surface, self.hero_image, self.world.hero.rect, pygame.time.get_ticks()
         )
+        return self._halo_rect
 
-        golden_halo_rect: pygame.Rect = halo_surface_golden_rippled.get_rect(center=self.hero.rect.center)
-        red_halo_rect: pygame.Rect = halo_surface_red_rippled.get_rect(center=self.hero.rect.center)
+    def clear_hero_halo(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Report the area of the last halo drawn, covered again by the frame without a halo.
 
-        if pygame.time.get_ticks() % 1000 < 500:
-            self.screen.blit(mask_surface, self.hero.rect.topleft)
-        else:
-            self.screen.blit(halo_surface_red_rippled, red_halo_rect)
-            self.screen.blit(halo_surface_golden_rippled, golden_halo_rect)
-            self.screen.blit(mask_surface, self.hero.rect.topleft)
+        Args:
+            surface (pygame.Surface): The surface to draw on, left untouched.
 
-        pygame.display.flip()
+        Returns:
+            list[pygame.Rect]: The area of the last halo drawn, if any.
+        """
+        rects: list[pygame.Rect] = [self._halo_rect] if self._halo_rect is not None else []
+        self._halo_rect = None
+        return rects
 
     def reset_game(self) -> None:
-        """Reset the game state to its initial state.
+        """Reset the game to its initial state.
 
-        This method resets the game score, flags, all sprite groups, level, and collected items to their initial state.
-        It also creates a new Hero object.
+        This method resets the world, which gives the sprites back to their pools and creates a
+        new Hero object, and removes the game over screen.
 
         Returns:
             None
         """
-        self.score = 0
-        self.game_over = False
-        self.all_sprites.empty()
-        self.monsters.empty()
-        self.coins.empty()
-        self.jewels.empty()
-        self.potions.empty()
-        self.level = 1
-        self.collected_coins = 0
-        self.collected_jewels = 0
-        self.hero = self.create_hero()
+        self.world.reset()
+        self.play_events()
 
-    def handle_monster_collision(self, colliding_monsters, current_time):
+    def handle_events(self) -> None:
         """
-        Handle collision between the hero and monsters.
+        Handle the window and keyboard events queued since the previous frame.
 
-        This method handles collisions between the hero and monsters. If the hero's
-        collision cooldown has expired, the method will deduct the monster's damage
-        from the hero's life points, play a hit sound, and set the hero's blinking
-        flag to True. If the hero's life points reach zero, the method will set the
-        game_over flag to True.
-
-        Args:
-            colliding_monsters (list[Monster]): A list of monsters that have collided with the hero.
-            current_time (int): The current time in milliseconds.
+        The pause and restart keys are not applied right away but queued as commands for
+        the next simulation tick, so a replay can apply them on the same tick.
 
         Returns:
             None
         """
-        if current_time - self.hero.last_collision_time > self.hero.collision_cooldown:
-            if self.hero.life_points > 0:
-                self.HIT.play(HIT_SOUND_TIMES)
-                self.hero.last_collision_time = current_time
-                self.blink_start_time = current_time
-                self.hero_is_blinking = True
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            if event.type == pygame.VIDEORESIZE:
+                self.background.resize(event.size)
+                self.compositor.invalidate()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE and self.world.game_over:
+                    self.pending_commands |= COMMAND_RESTART
+                if event.key in [pygame.K_q, pygame.K_ESCAPE]:
+                    self.running = False
+                if event.key == pygame.K_p:
+                    self.pending_commands ^= COMMAND_PAUSE
 
-            for monster in colliding_monsters:
-                self.hero.life_points -= monster.damage
-                monster.fade = True
+    def toggle_pause(self) -> None:
+        """
+        Pause or resume the game and its music.
 
-            if self.hero.life_points <= 0:
-                self.game_over = True
+        Returns:
+            None
+        """
+        self.world.toggle_pause()
+        self.play_events()
 
-    def run(self) -> None:
+    def pause_music(self, paused: bool) -> None:
         """
-        Run the game loop.
+        Pause or resume the music, if the mixer is initialized.
 
-        This method runs the game loop until the game is quit or the game over flag is set to True.
-        The method handles the game loop, including event handling, updating, drawing, and collision detection.
-        It also handles the game over state and displays the game over screen.
+        Args:
+            paused (bool): True to pause the music, False to resume it.
 
         Returns:
             None
         """
-        while self.running:
-            current_time: int = pygame.time.get_ticks()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE and self.game_over:
-                        self.reset_game()
-                    if event.key in [pygame.K_q, pygame.K_ESCAPE]:
-                        self.running = False
-                    if event.key == pygame.K_p:
-                        self.paused = not self.paused
-                        if self.paused:
-                            pygame.mixer.music.pause()
-                        else:
-                            pygame.mixer.music.unpause()
-
-            if self.hero_is_blinking:
-                self.blink_hero()
-                if current_time - self.blink_start_time >= self.blink_duration:
-                    self.hero_is_blinking = False
-
-            if not self.game_over and not self.paused and not self.hero_is_blinking:
-                self.all_sprites.update()
-
-                for monster in self.monsters:
-                    if monster.fade:
-                        if not monster.fade_out(current_time):
-                            self.monsters.remove(monster)
-                            self.all_sprites.remove(monster)
-
-                if len(self.monsters) < MAX_MONSTERS and random.random() < MONSTER_SPAWN_PROBABILITY:
-                    monster: Monster = self.create_monster()
-                    if self.is_positionable(monster):
-                        self.monsters.add(monster)
-                        self.all_sprites.add(monster)
-
-                if len(self.coins) < MAX_COINS and random.random() < COIN_SPAWN_PROBABILITY:
-                    coin: Coin = self.create_coin()
-                    if self.is_positionable(coin):
-                        self.coins.add(coin)
-                        self.all_sprites.add(coin)
-
-                if len(self.jewels) < MAX_JEWELS and random.random() < JEWEL_SPAWN_PROBABILITY:
-                    jewel: Jewel = self.create_jewel()
-                    if self.is_positionable(jewel):
-                        self.jewels.add(jewel)
-                        self.all_sprites.add(jewel)
-                hero_sprite: BaseSprite = cast(BaseSprite, self.hero)
-                colliding_monsters: list[pygame.sprite.Sprite] = pygame.sprite.spritecollide(hero_sprite, self.monsters, True)
-                if colliding_monsters:
-                    self.handle_monster_collision(colliding_monsters, current_time)
-
-                self.handle_collection(self.coins, "collected_coins", self.COIN_SOUND, 26)
-                self.handle_collection(self.jewels, "collected_jewels", self.JEWEL_SOUND, 100)
-
-                self.bg_y += 2
-                if self.bg_y >= 0:
-                    self.bg_y = -self.bg_image.get_height()
-
-            for x in range(0, WINDOW_WIDTH, self.bg_image.get_width()):
-                for y in range(self.bg_y, WINDOW_HEIGHT, self.bg_image.get_height()):
-                    self.screen.blit(self.bg_image, (x, y))
-
-            self.all_sprites.draw(self.screen)
-
-            for coin in self.coins:
-                value_text: pygame.Surface = pygame.font.Font(None, FONT_SIZE_SMALL).render(
-                    str(coin.value), True, BLACK
-                )
-                self.screen.blit(value_text, value_text.get_rect(center=coin.rect.center))
-
-            for jewel in self.jewels:
-                value_text = pygame.font.Font(None, FONT_SIZE_SMALL).render(
-                    str(jewel.value), True, BLACK
-                )
-                self.screen.blit(value_text, value_text.get_rect(center=jewel.rect.center))
-
-            self.display_score()
-            self.display_life()
-            self.display_level()
-            self.display_coins()
-            self.display_jewels()
-
-            if self.game_over:
-                self.display_game_over()
+        if not pygame.mixer.get_init():
+            return
+        if paused:
+            pygame.mixer.music.pause()
+        else:
+            pygame.mixer.music.unpause()
 
-            self.clock.tick(FPS)
-            pygame.display.flip()
+    def play_events(self) -> None:
+        """
+        Play the events left by the world since its last tick, and clear them.
 
-        pygame.quit()
+        A collected coin or jewel is played on a channel of its category, with a volume based on
+        its value, a hit plays the hit sound, the game over shows its screen, and a pause or a
+        restart pauses the music or removes the game over screen.
 
-    def handle_collection(
-    self,
-    items: pygame.sprite.Group,
-    collection_attr: str,
-    sound: pygame.mixer.Sound,
-    volume_base: float
-    ) -> None:
+        Returns:
+            None
         """
-        Handles the collection of items and updates the score and the
-        collection attribute. It also plays a sound and sets its volume
-        based on the value of the item collected.
+        sounds: dict[str, pygame.mixer.Sound | None] = {"coin": self.COIN_SOUND, "jewel": self.JEWEL_SOUND}
+        for name, value in self.world.events:
+            if name in sounds:
+                self.voices.play(name, sounds[name], self.volume_curves[name].volume(value))
+            elif name == "hit":
+                self.voices.play("hit", self.HIT, loops=HIT_SOUND_TIMES)
+            elif name == "game_over":
+                self.display_game_over()
+            elif name == "pause":
+                self.pause_music(bool(value))
+            elif name == "restart":
+                self.compositor.remove_overlay("game_over")
+        self.world.events.clear()
 
-        Args:
-            items (pygame.sprite.Group): The group of items to check for collection.
-            collection_attr (str): The name of the attribute to increase
-                when an item is collected.
-            sound (pygame.mixer.Sound): The sound to play when an item is collected.
-            volume_base (float): The base volume to use for the sound.
+    def step(self, current_time: int, keys: Sequence[bool] | None = None, commands: int = 0) -> bool:
         """
+        Advance the game by one simulation tick, without drawing anything.
+
+        This method steps the world, plays the events of the tick, and scrolls the
+        background while the world moves. The background position before the tick is
+        saved, so the frames drawn until the next tick can be interpolated.
 
-        hero_sprite: BaseSprite = cast(BaseSprite, self.hero)
-        for item in pygame.sprite.spritecollide(hero_sprite, items, True):
-            self.score += item.value
-            setattr(self, collection_attr, getattr(self, collection_attr) + 1)
+        Args:
+            current_time (int): The simulated time of the tick in milliseconds.
+            keys (Sequence[bool] | None): The keys held down, indexed by key code,
+                pygame.key.get_pressed() if None.
+            commands (int): The COMMAND_PAUSE and COMMAND_RESTART bits pressed before the tick.
 
-            volume: float = math.log10(item.value + 1) / math.log10(volume_base)
-            sound.set_volume(volume)
-            sound.play()
+        Returns:
+            bool: True if the background scrolled, so the whole window changed.
+        """
+        self.background.save_position()
+        moved: bool = self.world.step(current_time, keys, commands)
+        self.play_events()
+        if moved:
+            self.background.scroll()
+        return moved
+
+    def draw(self) -> None:
+        """
+        Submit the draw calls of the frame to the compositor.
 
+        Every call returns the areas it changed, so in dirty-rect mode only the background bands
+        that scrolled, the sprites, the halo and the HUD are presented. The first frame without
+        the halo presents the area it covered. Once the game is over, the halo is only drawn by
+        the game over overlay.
 
-    def is_positionable(self, asset: BaseSprite) -> bool:
+        Returns:
+            None
         """
-        Checks if the given asset can be positioned without overlapping with any other asset.
+        if self.world.hero_is_blinking and not self.world.game_over:
+            self.blink_hero()
+        elif self._halo_rect is not None:
+            self.compositor.submit(Layer.HALOS, self.clear_hero_halo)
+        self.compositor.submit(Layer.BACKGROUND, self.draw_background)
+        self.compositor.submit(Layer.SPRITES, self.draw_sprites)
+        self.compositor.submit(Layer.HUD, self.display_hud)
 
-        Args:
-            asset (pygame.sprite.Sprite): The asset to check.
+    def run(self) -> None:
+        """
+        Run the game loop.
+
+        This method runs the game loop until the game is quit or the game over flag is set to True.
+        The method handles the game loop, including event handling, updating, drawing, and collision detection.
+        It also handles the game over state and displays the game over screen.
+
+        The game state is updated in fixed simulation ticks, SIM_RATE times per second, so the
+        gameplay speed does not depend on the frame rate. Every frame runs the ticks due since
+        the previous one, up to MAX_SIM_STEPS, and draws the sprites interpolated between the
+        two last ticks, as often as the FPS cap allows.
 
         Returns:
-            bool: True if the asset can be positioned, False otherwise.
+            None
         """
-        return all(
-            not pygame.sprite.spritecollideany(
-                asset, group
-            )
-            for group in [self.jewels, self.coins, self.monsters, self.potions]
-        )
+        while self.running:
+            current_time: int = pygame.time.get_ticks()
+            if self._sound_tasks:
+                self.collect_sounds()
+            self.handle_events()
+
+            timestep = self.world.timestep
+            steps: int = timestep.advance(current_time)
+            for _ in range(steps):
+                keys: Sequence[bool] = pygame.key.get_pressed()
+                commands, self.pending_commands = self.pending_commands, 0
+                self.step(timestep.time, keys, commands)
+                timestep.tick()
+                if self.recorder is not None:
+                    self.recorder.record(encode_keys(keys) | commands, state_checksum(self.world))
+            self.profiler.record("sim_steps", steps)
+
+            self.draw()
+
+            self.clock.tick(FPS)
+            self.compositor.present()
+            if self.profiler.frames == 0:
+                self.profiler.record("startup_ms", (time.perf_counter() - self.start_time) * 1000)
+            self.profiler.end_frame()
+
+        pygame.quit()
 
 if __name__ == "__main__":  # pragma: no cover
     game = Game() # pragma: no cover
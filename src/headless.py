@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import os
+import time
+
+from inputs import IdleInput, InputProvider, encode_keys
+from replay import Replay, state_checksum
+
+
+def use_dummy_drivers() -> None:
+    """
+    Selects SDL's dummy video and audio drivers, so the game runs without a display or sound device.
+
+    It must be called before pygame opens the window and the mixer.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+def simulate(world, frames: int, keys: InputProvider | None = None, recorder: Replay | None = None) -> dict[str, float]:
+    """
+    Steps a world as fast as possible, without any window, sound or frame.
+
+    Every frame runs exactly one simulation tick of the world timestep, whose time is counted in
+    ticks rather than read from the clock, so a run plays the same whatever the speed of the
+    machine. The run stops early if the game is over.
+
+    :param world: The world to step, such as the world of a game.
+    :param frames: The maximum number of ticks to step.
+    :param keys: The keys held down on every frame, no key if None.
+    :param recorder: The replay recording the input and state of every tick, if any.
+    :return: The frames stepped, the frames per second, and the score, coins, jewels and hits at the end.
+    :raises ValueError: If frames is not a positive value.
+    """
+    if frames <= 0:
+        raise ValueError("Frames must be a positive value.")
+    if keys is None:
+        keys = IdleInput()
+
+    start: float = time.perf_counter()
+    frame = 0
+    while frame < frames and not world.game_over:
+        held = keys(frame)
+        world.step(world.timestep.time, held)
+        world.timestep.tick()
+        if recorder is not None:
+            recorder.record(encode_keys(held), state_checksum(world))
+        frame += 1
+    elapsed: float = time.perf_counter() - start
+
+    return {
+        "frames": frame,
+        "fps": frame / elapsed if elapsed > 0 else 0.0,
+        "score": world.score,
+        "coins": world.collected_coins,
+        "jewels": world.collected_jewels,
+        "hits": world.hits,
+        "game_over": world.game_over,
+    }
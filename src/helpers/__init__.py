@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
 
 from .imagehelper import  ImageHelper
+from .pixelcache import PixelCache
+from .soundcache import SoundCache
+from .surfacecache import SurfaceCache
+from .textcache import TextCache
+from .textureatlas import TextureAtlas
 
-__all__: list[str] = ["ImageHelper"]
+__all__: list[str] = ["ImageHelper", "PixelCache", "SoundCache", "SurfaceCache", "TextCache", "TextureAtlas"]
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
+import itertools
 import os
 import random
 
+
 class ImageHelper:
     """
     A helper class for working with images and calculating weights for random selection.
@@ -10,8 +12,20 @@ class ImageHelper:
     This class provides static methods to:
     - Calculate weights for selecting a random image from a list of image files.
     - Retrieve a random image file name and its full path from a specified folder.
+
+    Folders are indexed once, when a world is created or the first time they are used: the image
+    list and the cumulative weights are kept in memory and picking an image never touches the disk.
+    A folder is only listed again by an explicit call to refresh. Folders can also be registered
+    without existing on disk, like the ones packed in a texture atlas.
     """
 
+    IMAGE_EXTENSIONS: tuple[str, ...] = ('.png', '.jpg', '.jpeg', '.bmp')
+
+    # folder -> (image file names, cumulative weights)
+    _index: dict[str, tuple[list[str], list[float]]] = {}
+    # folders registered without being listed from disk
+    _registered: set[str] = set()
+
     def __init__(self) -> None:
         """
         Initializes an instance of the ImageHelper class.
@@ -49,27 +63,80 @@ class ImageHelper:
 
 
     @staticmethod
-    def get_random_image(image_folder: str) -> tuple[str, str]:
+    def index_folder(image_folder: str) -> tuple[list[str], list[float]]:
+        """
+        Returns the indexed image files of a folder and their cumulative weights.
+
+        The folder is only listed the first time it is indexed; the next lookups are served from
+        memory without any system call until the folder is refreshed. The files are sorted by name,
+        as the texture atlas registers them, so a seeded pick is the same whatever the order the
+        file system lists them in.
+
+        :param image_folder: The path to the folder containing the images.
+        :return: A tuple containing the image file names and their cumulative weights.
+        """
+        entry = ImageHelper._index.get(image_folder)
+        if entry is None:
+            image_files: list[str] = sorted(
+                f for f in os.listdir(image_folder)
+                if f.lower().endswith(ImageHelper.IMAGE_EXTENSIONS)
+            )
+            cum_weights: list[float] = list(itertools.accumulate(ImageHelper.calculate_weights(image_files)))
+            entry = (image_files, cum_weights)
+            ImageHelper._index[image_folder] = entry
+        return entry
+
+    @staticmethod
+    def refresh(image_folder: str | None = None) -> None:
+        """
+        Lists an indexed folder again, or every indexed folder if None, to pick up the images added
+        or removed since it was indexed. Registered folders are kept as they were registered.
+
+        :param image_folder: The path of the folder to list again, every indexed folder if None.
+        """
+        folders = list(ImageHelper._index) if image_folder is None else [image_folder]
+        for folder in folders:
+            if folder not in ImageHelper._registered:
+                ImageHelper._index.pop(folder, None)
+                ImageHelper.index_folder(folder)
+
+    @staticmethod
+    def register_folder(image_folder: str, image_files: list[str]) -> None:
+        """
+        Registers the image files of a folder that is not listed from disk.
+
+        :param image_folder: The path of the folder, which does not need to exist.
+        :param image_files: The image file names of the folder.
+        """
+        cum_weights: list[float] = list(itertools.accumulate(ImageHelper.calculate_weights(image_files)))
+        ImageHelper._index[image_folder] = (list(image_files), cum_weights)
+        ImageHelper._registered.add(image_folder)
+
+    @staticmethod
+    def clear_index() -> None:
+        """
+        Forgets every indexed and registered folder so the next lookup lists it again.
+        """
+        ImageHelper._index.clear()
+        ImageHelper._registered.clear()
+
+    @staticmethod
+    def get_random_image(image_folder: str, rng: random.Random | None = None) -> tuple[str, str]:
         """
         Returns a tuple containing a random image file name and its full path from the specified folder.
 
         :param image_folder: The path to the folder containing the images.
+        :param rng: The random generator choosing the image, the random module if None.
         :return: A tuple containing the image file name and its full path.
         """
-        # Get a list of all image files in the specified folder
-        image_files: list[str] = [
-            f for f in os.listdir(image_folder)
-            if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp'))
-        ]
+        image_files, cum_weights = ImageHelper.index_folder(image_folder)
 
         if not image_files:
             raise ValueError("No valid image files found in the specified folder")
 
-        # Calculate weights for image selection
-        weights: list[float] = ImageHelper.calculate_weights(image_files)
-
-        # Choose a random image from the list, with calculated weights
-        random_image: str = random.choices(image_files, weights=weights, k=1)[0]
+        # Choose a random image from the list, bisecting the precomputed cumulative weights
+        choices = random.choices if rng is None else rng.choices
+        random_image: str = choices(image_files, cum_weights=cum_weights, k=1)[0]
         image_path: str = os.path.join(image_folder, random_image)
 
         return random_image, image_path
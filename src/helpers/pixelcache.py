@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Callable
+
+import pygame
+
+
+class PixelCache:
+    """
+    An on-disk cache of decoded images in the display pixel format.
+
+    The first time an image is loaded it is decoded and converted as usual, and its pixels are
+    written to a cache file. The next launches map that file in memory and build the surface
+    straight from it with ``pygame.image.frombuffer``, so the image is not decoded again.
+
+    Cache files are named after a hash of the source file contents and of the display pixel
+    format, so they are never used after the image changes or on a display with another format.
+
+    This class provides static methods to:
+    - Enable the cache in a folder, usually a per-user cache folder.
+    - Load an image through the cache.
+    - Remove every cache file.
+    """
+
+    # Magic, width, height, pixel format, whether the pixels still have to be converted
+    HEADER: struct.Struct = struct.Struct("<4sII4sB15x")
+    MAGIC: bytes = b"HMPX"
+
+    directory: str | None = None
+
+    # pixel format names understood by frombuffer -> their channel masks on this platform
+    _format_masks: dict[str, tuple[int, int, int, int]] = {}
+
+    @staticmethod
+    def enable(directory: str | None) -> None:
+        """
+        Enables the cache in the given folder, or disables it if None.
+
+        :param directory: The folder holding the cache files, created when the first file is written.
+        """
+        PixelCache.directory = directory
+
+    @staticmethod
+    def format_masks() -> dict[str, tuple[int, int, int, int]]:
+        """
+        Returns the channel masks of the surfaces built by frombuffer for every supported format.
+
+        :return: The masks of every 32-bit pixel format name.
+        """
+        if not PixelCache._format_masks:
+            for pixel_format in ("BGRA", "RGBA", "ARGB", "RGBX"):
+                surface: pygame.Surface = pygame.image.frombuffer(bytearray(4), (1, 1), pixel_format)
+                PixelCache._format_masks[pixel_format] = surface.get_masks()
+        return PixelCache._format_masks
+
+    @staticmethod
+    def cache_path(data: bytes) -> str | None:
+        """
+        Returns the cache file of an image for the current display pixel format.
+
+        :param data: The contents of the image file.
+        :return: The path of the cache file, or None if the cache is disabled or no display is set.
+        """
+        screen: pygame.Surface | None = pygame.display.get_surface() if pygame.display.get_init() else None
+        if PixelCache.directory is None or screen is None:
+            return None
+
+        digest = hashlib.blake2b(data, digest_size=20)
+        digest.update(repr((screen.get_bitsize(), screen.get_masks())).encode())
+        return os.path.join(PixelCache.directory, digest.hexdigest() + ".pix")
+
+    @staticmethod
+    def read(cache_path: str) -> pygame.Surface | None:
+        """
+        Builds a surface from a cache file mapped in memory.
+
+        The file is mapped copy-on-write, so the surface can be drawn on without changing the file.
+
+        :param cache_path: The path of the cache file.
+        :return: The surface, or None if the file is missing or invalid.
+        """
+        try:
+            with open(cache_path, "rb") as cache_file:
+                mapped: mmap.mmap = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+
+        if len(mapped) < PixelCache.HEADER.size:
+            return None
+        magic, width, height, pixel_format, needs_convert = PixelCache.HEADER.unpack_from(mapped)
+        pixel_format = pixel_format.decode("ascii", "replace").strip()
+        if magic != PixelCache.MAGIC or pixel_format not in PixelCache.format_masks():
+            return None
+        if len(mapped) != PixelCache.HEADER.size + width * height * 4:
+            return None
+
+        # the surface keeps a reference to the mapped buffer for as long as it is alive
+        surface: pygame.Surface = pygame.image.frombuffer(
+            memoryview(mapped)[PixelCache.HEADER.size:], (width, height), pixel_format
+        )
+        if needs_convert:
+            surface = surface.convert_alpha() if pixel_format != "RGBX" else surface.convert()
+        return surface
+
+    @staticmethod
+    def write(cache_path: str, surface: pygame.Surface) -> None:
+        """
+        Writes the pixels of a converted surface to a cache file.
+
+        Surfaces whose pixel format frombuffer can build directly are stored as they are, so they
+        are used without any conversion; the others are stored as RGBA or RGBX and converted when read.
+        Errors writing the file are ignored, since the image is loaded from its source next time.
+
+        :param cache_path: The path of the cache file.
+        :param surface: The converted surface.
+        """
+        alpha: bool = bool(surface.get_flags() & pygame.SRCALPHA)
+        masks: tuple[int, int, int, int] = surface.get_masks()
+        pixel_format: str = "RGBA" if alpha else "RGBX"
+        needs_convert: bool = True
+        if surface.get_bitsize() == 32:
+            for name, format_masks in PixelCache.format_masks().items():
+                if format_masks == masks and (name == "RGBX") != alpha:
+                    pixel_format, needs_convert = name, False
+                    break
+
+        header: bytes = PixelCache.HEADER.pack(
+            PixelCache.MAGIC, surface.get_width(), surface.get_height(), pixel_format.encode("ascii"), needs_convert
+        )
+        temporary_path: str = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temporary_path, "wb") as cache_file:
+                cache_file.write(header)
+                cache_file.write(pygame.image.tobytes(surface, pixel_format))
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    @staticmethod
+    def load(image_path: str, decode: Callable[[str], pygame.Surface]) -> pygame.Surface:
+        """
+        Loads an image from its cache file, decoding it and writing the cache file on a miss.
+
+        :param image_path: The path to the image file.
+        :param decode: A callable loading and converting the image from its path.
+        :return: The converted surface.
+        :raises pygame.error: If the image has to be decoded and cannot be loaded.
+        """
+        if PixelCache.directory is None:
+            return decode(image_path)
+
+        try:
+            with open(image_path, "rb") as image_file:
+                data: bytes = image_file.read()
+        except OSError:
+            return decode(image_path)
+
+        cache_path: str | None = PixelCache.cache_path(data)
+        if cache_path is None:
+            return decode(image_path)
+
+        surface: pygame.Surface | None = PixelCache.read(cache_path)
+        if surface is None:
+            surface = decode(image_path)
+            PixelCache.write(cache_path, surface)
+        return surface
+
+    @staticmethod
+    def clear() -> int:
+        """
+        Removes every cache file from the cache folder.
+
+        :return: The number of files removed.
+        """
+        if PixelCache.directory is None or not os.path.isdir(PixelCache.directory):
+            return 0
+        removed = 0
+        for file_name in os.listdir(PixelCache.directory):
+            if file_name.endswith(".pix"):
+                os.remove(os.path.join(PixelCache.directory, file_name))
+                removed += 1
+        return removed
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Callable
+
+import pygame
+
+
+class SoundCache:
+    """
+    An on-disk cache of decoded sound effects in the mixer sample format.
+
+    The first time a sound is loaded it is decoded as usual, and its PCM samples are written to a
+    cache file. The next launches map that file in memory and build the sound from it with
+    ``pygame.mixer.Sound(buffer=...)``, so the compressed file is not decoded again.
+
+    Cache files are named after a hash of the source file contents and of the mixer frequency,
+    sample format and channels, so a changed sound or another mixer configuration never reuses
+    a stale file: the sound is simply decoded again.
+
+    This class provides static methods to:
+    - Enable the cache in a folder, usually a per-user cache folder.
+    - Load a sound through the cache.
+    - Remove every cache file.
+    """
+
+    # Magic, frequency, sample format, channels
+    HEADER: struct.Struct = struct.Struct("<4sIiI")
+    MAGIC: bytes = b"HMPC"
+
+    directory: str | None = None
+
+    @staticmethod
+    def enable(directory: str | None) -> None:
+        """
+        Enables the cache in the given folder, or disables it if None.
+
+        :param directory: The folder holding the cache files, created when the first file is written.
+        """
+        SoundCache.directory = directory
+
+    @staticmethod
+    def cache_path(data: bytes, mixer_format: tuple[int, int, int]) -> str | None:
+        """
+        Returns the cache file of a sound for the given mixer configuration.
+
+        :param data: The contents of the sound file.
+        :param mixer_format: The mixer frequency, sample format and channels.
+        :return: The path of the cache file, or None if the cache is disabled.
+        """
+        if SoundCache.directory is None:
+            return None
+
+        digest = hashlib.blake2b(data, digest_size=20)
+        digest.update(repr(mixer_format).encode())
+        return os.path.join(SoundCache.directory, digest.hexdigest() + ".pcm")
+
+    @staticmethod
+    def read(cache_path: str, mixer_format: tuple[int, int, int]) -> pygame.mixer.Sound | None:
+        """
+        Builds a sound from the samples of a cache file mapped in memory.
+
+        :param cache_path: The path of the cache file.
+        :param mixer_format: The mixer frequency, sample format and channels.
+        :return: The sound, or None if the file is missing, invalid or for another mixer configuration.
+        """
+        try:
+            with open(cache_path, "rb") as cache_file:
+                mapped: mmap.mmap = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        with mapped:
+            if len(mapped) < SoundCache.HEADER.size:
+                return None
+            magic, *header_format = SoundCache.HEADER.unpack_from(mapped)
+            if magic != SoundCache.MAGIC or tuple(header_format) != mixer_format:
+                return None
+
+            # the samples are copied by the mixer, so the file does not stay mapped
+            samples: memoryview = memoryview(mapped)[SoundCache.HEADER.size:]
+            try:
+                return pygame.mixer.Sound(buffer=samples)
+            finally:
+                samples.release()
+
+    @staticmethod
+    def write(cache_path: str, sound: pygame.mixer.Sound, mixer_format: tuple[int, int, int]) -> None:
+        """
+        Writes the samples of a decoded sound to a cache file.
+
+        Errors writing the file are ignored, since the sound is decoded from its source next time.
+
+        :param cache_path: The path of the cache file.
+        :param sound: The decoded sound.
+        :param mixer_format: The mixer frequency, sample format and channels.
+        """
+        temporary_path: str = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temporary_path, "wb") as cache_file:
+                cache_file.write(SoundCache.HEADER.pack(SoundCache.MAGIC, *mixer_format))
+                cache_file.write(sound.get_raw())
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    @staticmethod
+    def load(sound_path: str, decode: Callable[[str], pygame.mixer.Sound]) -> pygame.mixer.Sound:
+        """
+        Loads a sound from its cache file, decoding it and writing the cache file on a miss.
+
+        :param sound_path: The path to the sound file.
+        :param decode: A callable loading the sound from its path, usually ``pygame.mixer.Sound``.
+        :return: The sound.
+        :raises pygame.error: If the sound has to be decoded and cannot be loaded.
+        """
+        mixer_format: tuple[int, int, int] | None = pygame.mixer.get_init() if SoundCache.directory else None
+        if mixer_format is None:
+            return decode(sound_path)
+
+        try:
+            with open(sound_path, "rb") as sound_file:
+                data: bytes = sound_file.read()
+        except OSError:
+            return decode(sound_path)
+
+        cache_path: str | None = SoundCache.cache_path(data, mixer_format)
+        if cache_path is None:
+            return decode(sound_path)
+
+        sound: pygame.mixer.Sound | None = SoundCache.read(cache_path, mixer_format)
+        if sound is None:
+            sound = decode(sound_path)
+            SoundCache.write(cache_path, sound, mixer_format)
+        return sound
+
+    @staticmethod
+    def clear() -> int:
+        """
+        Removes every cache file from the cache folder.
+
+        :return: The number of files removed.
+        """
+        if SoundCache.directory is None or not os.path.isdir(SoundCache.directory):
+            return 0
+        removed = 0
+        for file_name in os.listdir(SoundCache.directory):
+            if file_name.endswith(".pcm"):
+                os.remove(os.path.join(SoundCache.directory, file_name))
+                removed += 1
+        return removed
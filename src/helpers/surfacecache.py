@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+import os
+from typing import Callable, Hashable
+
+import pygame
+
+from .imagehelper import ImageHelper
+from .pixelcache import PixelCache
+
+
+class SurfaceCache:
+    """
+    A process-wide cache of display-format surfaces shared by every entity.
+
+    This class provides static methods to:
+    - Preload every image found in a set of folders once at startup.
+    - Hand out the shared surface for an image path without touching the filesystem again.
+    - Store surfaces for image paths that are not loose files, like the images of a texture atlas.
+    - Store surfaces derived from cached images (scaled, labelled, faded...) under arbitrary keys.
+
+    Surfaces returned by the cache are shared between all the sprites that use them and must
+    never be modified in place; copy them first when a sprite needs its own version.
+    """
+
+    _surfaces: dict[Hashable, pygame.Surface] = {}
+
+    @staticmethod
+    def key(image_path: str) -> str:
+        """
+        Returns the cache key used for the given image path.
+
+        :param image_path: The path to the image file.
+        :return: The normalized absolute path of the image.
+        """
+        return os.path.normcase(os.path.abspath(image_path))
+
+    @staticmethod
+    def convert(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Converts a surface to the display pixel format if a display mode has been set.
+
+        Surfaces with per-pixel alpha are converted with ``convert_alpha()`` and opaque ones
+        with ``convert()``, so blits run on the fast path. Without a display the surface is
+        returned unchanged.
+
+        :param surface: The surface to convert.
+        :return: The converted surface.
+        """
+        if not pygame.display.get_init() or pygame.display.get_surface() is None:
+            return surface
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    @staticmethod
+    def load(image_path: str) -> pygame.Surface:
+        """
+        Loads an image and converts it to the display pixel format, without caching it in memory.
+
+        The decoded pixels are read from and written to the PixelCache when it is enabled.
+
+        :param image_path: The path to the image file.
+        :return: The converted surface.
+        :raises pygame.error: If the image cannot be loaded.
+        """
+        return PixelCache.load(image_path, lambda path: SurfaceCache.convert(pygame.image.load(path)))
+
+    @staticmethod
+    def preload(*image_folders: str) -> int:
+        """
+        Loads and converts every image found in the given folders.
+
+        Images that are already cached are not loaded again, so calling this method several
+        times is cheap.
+
+        :param image_folders: The folders to scan for images.
+        :return: The number of images loaded by this call.
+        """
+        loaded = 0
+        for image_folder in image_folders:
+            for file_name in sorted(os.listdir(image_folder)):
+                if not file_name.lower().endswith(ImageHelper.IMAGE_EXTENSIONS):
+                    continue
+                image_path: str = os.path.join(image_folder, file_name)
+                if SurfaceCache.key(image_path) not in SurfaceCache._surfaces:
+                    SurfaceCache.get(image_path)
+                    loaded += 1
+        return loaded
+
+    @staticmethod
+    def get(image_path: str) -> pygame.Surface:
+        """
+        Returns the shared surface for the given image path.
+
+        The image is loaded from disk and converted only the first time it is requested.
+
+        :param image_path: The path to the image file.
+        :return: The shared, display-format surface.
+        :raises pygame.error: If the image cannot be loaded.
+        """
+        key: str = SurfaceCache.key(image_path)
+        surface: pygame.Surface | None = SurfaceCache._surfaces.get(key)
+        if surface is None:
+            surface = SurfaceCache.load(image_path)
+            SurfaceCache._surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def add(image_path: str, surface: pygame.Surface) -> None:
+        """
+        Stores a surface for an image path, like an image packed in a texture atlas.
+
+        :param image_path: The path the image would be loaded from.
+        :param surface: The display-format surface of the image.
+        """
+        SurfaceCache._surfaces[SurfaceCache.key(image_path)] = surface
+
+    @staticmethod
+    def derive(key: Hashable, factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Returns a surface derived from cached images, building it once with the factory.
+
+        :param key: Any hashable key identifying the derived surface.
+        :param factory: A callable building the surface the first time it is requested.
+        :return: The shared derived surface.
+        """
+        surface: pygame.Surface | None = SurfaceCache._surfaces.get(key)
+        if surface is None:
+            surface = factory()
+            SurfaceCache._surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Removes every surface from the cache.
+        """
+        SurfaceCache._surfaces.clear()
+
+    @staticmethod
+    def size() -> int:
+        """
+        Returns the number of surfaces held by the cache.
+
+        :return: The number of cached surfaces.
+        """
+        return len(SurfaceCache._surfaces)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+
+import pygame
+from pygame.font import Font
+
+
+class TextCache:
+    """
+    A least-recently-used cache of rendered text surfaces.
+
+    Surfaces are keyed by (font, text, color, antialias), so rendering the same text twice with
+    the same font and color returns the same surface. The least recently used surface is dropped
+    once the cache holds ``max_size`` entries.
+
+    Attributes:
+        max_size (int): The maximum number of surfaces kept in the cache.
+        hits (int): The number of renders served from the cache.
+        misses (int): The number of renders that had to call ``Font.render``.
+    """
+
+    max_size: int
+    hits: int
+    misses: int
+
+    def __init__(self, max_size: int = 128) -> None:
+        """
+        Initialize an empty TextCache.
+
+        Args:
+            max_size (int): The maximum number of surfaces kept in the cache.
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError("Cache size must be a positive value.")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: OrderedDict[tuple[Font, str, tuple, bool], pygame.Surface] = OrderedDict()
+
+    def render(self, font: Font, text: str, color: tuple, antialias: bool = True) -> pygame.Surface:
+        """
+        Returns the rendered text, calling ``Font.render`` only if it is not cached yet.
+
+        Args:
+            font (Font): The font used to render the text.
+            text (str): The text to render.
+            color (tuple): The color of the text.
+            antialias (bool): Whether the text is antialiased.
+
+        Returns:
+            pygame.Surface: The shared rendered text surface.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface: pygame.Surface | None = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """
+        Removes every surface from the cache and resets the counters.
+        """
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of surfaces held by the cache.
+        """
+        return len(self._surfaces)
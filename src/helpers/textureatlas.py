@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+import json
+import math
+import os
+
+import pygame
+
+from .imagehelper import ImageHelper
+from .surfacecache import SurfaceCache
+
+
+class TextureAtlas:
+    """
+    A set of images packed into a single atlas image with a JSON manifest of named rects.
+
+    The atlas is built once, before packaging the game, from every image of a folder. At startup
+    the atlas image is loaded and converted once, and every packed image is handed out as a
+    subsurface of it, so no other image file has to be opened or decoded.
+
+    Images are named by their path relative to the packed folder, with forward slashes, like
+    ``"monsters/monster01.png"``.
+
+    Attributes:
+        surface (pygame.Surface): The atlas image.
+        rects (dict[str, pygame.Rect]): The area of every packed image in the atlas, by name.
+    """
+
+    # Transparent pixels left around every packed image
+    PADDING: int = 1
+
+    surface: pygame.Surface
+    rects: dict[str, pygame.Rect]
+
+    def __init__(self, surface: pygame.Surface, rects: dict[str, pygame.Rect]) -> None:
+        """
+        Initialize a TextureAtlas from its image and the rects of its packed images.
+
+        Args:
+            surface (pygame.Surface): The atlas image.
+            rects (dict[str, pygame.Rect]): The area of every packed image in the atlas, by name.
+
+        Raises:
+            ValueError: If a rect lies outside the atlas image.
+        """
+        bounds: pygame.Rect = surface.get_rect()
+        for name, rect in rects.items():
+            if not bounds.contains(rect):
+                raise ValueError(f"Atlas rect of {name} lies outside the atlas image.")
+
+        self.surface = surface
+        self.rects = rects
+        self._images: dict[str, pygame.Surface] = {}
+
+    @staticmethod
+    def pack(sizes: dict[str, tuple[int, int]], padding: int = PADDING) -> tuple[tuple[int, int], dict[str, pygame.Rect]]:
+        """
+        Packs images into shelves, from the tallest to the shortest.
+
+        The atlas width is the smallest power of two that fits the widest image and the square
+        root of the total area, so the atlas stays roughly square.
+
+        Args:
+            sizes (dict[str, tuple[int, int]]): The size of every image, by name.
+            padding (int): The transparent pixels left around every image.
+
+        Returns:
+            tuple[tuple[int, int], dict[str, pygame.Rect]]: The atlas size and the rect of every image.
+        """
+        if not sizes:
+            return (0, 0), {}
+
+        area: int = sum((w + padding) * (h + padding) for w, h in sizes.values())
+        widest: int = max(w for w, _ in sizes.values()) + 2 * padding
+        width: int = 1 << (max(widest, math.isqrt(area)) - 1).bit_length()
+
+        rects: dict[str, pygame.Rect] = {}
+        x, y, shelf_height = padding, padding, 0
+        for name in sorted(sizes, key=lambda n: (-sizes[n][1], -sizes[n][0], n)):
+            w, h = sizes[name]
+            if x + w + padding > width:
+                x, y, shelf_height = padding, y + shelf_height + padding, 0
+            rects[name] = pygame.Rect(x, y, w, h)
+            x += w + padding
+            shelf_height = max(shelf_height, h)
+        return (width, y + shelf_height + padding), rects
+
+    @staticmethod
+    def build(image_folder: str, atlas_path: str, manifest_path: str, exclude: tuple[str, ...] = ()) -> "TextureAtlas":
+        """
+        Packs every image of a folder and its subfolders into an atlas image and its manifest.
+
+        Args:
+            image_folder (str): The folder containing the images to pack.
+            atlas_path (str): The path of the atlas PNG image to write.
+            manifest_path (str): The path of the JSON manifest to write.
+            exclude (tuple[str, ...]): The names of the images to leave out of the atlas.
+
+        Returns:
+            TextureAtlas: The built atlas.
+        """
+        images: dict[str, pygame.Surface] = {}
+        for root, _, files in os.walk(image_folder):
+            for file_name in files:
+                if not file_name.lower().endswith(ImageHelper.IMAGE_EXTENSIONS):
+                    continue
+                path: str = os.path.join(root, file_name)
+                name: str = os.path.relpath(path, image_folder).replace(os.sep, "/")
+                if name not in exclude:
+                    images[name] = pygame.image.load(path)
+
+        size, rects = TextureAtlas.pack({name: image.get_size() for name, image in images.items()})
+        surface: pygame.Surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+        for name, image in images.items():
+            surface.blit(image, rects[name])
+
+        for path in (atlas_path, manifest_path):
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        pygame.image.save(surface, atlas_path)
+        manifest: dict = {
+            "image": os.path.relpath(atlas_path, os.path.dirname(os.path.abspath(manifest_path))).replace(os.sep, "/"),
+            "sprites": {name: list(rects[name]) for name in sorted(rects)},
+        }
+        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+
+        return TextureAtlas(surface, rects)
+
+    @staticmethod
+    def load(manifest_path: str) -> "TextureAtlas":
+        """
+        Loads an atlas from its manifest, converting the atlas image to the display format once.
+
+        Args:
+            manifest_path (str): The path of the JSON manifest.
+
+        Returns:
+            TextureAtlas: The loaded atlas.
+
+        Raises:
+            FileNotFoundError: If the manifest does not exist.
+            pygame.error: If the atlas image cannot be loaded.
+        """
+        with open(manifest_path, encoding="utf-8") as manifest_file:
+            manifest: dict = json.load(manifest_file)
+
+        atlas_path: str = os.path.join(os.path.dirname(manifest_path), manifest["image"])
+        surface: pygame.Surface = SurfaceCache.load(atlas_path)
+        rects: dict[str, pygame.Rect] = {name: pygame.Rect(rect) for name, rect in manifest["sprites"].items()}
+        return TextureAtlas(surface, rects)
+
+    def get(self, name: str) -> pygame.Surface:
+        """
+        Returns a packed image as a subsurface of the atlas.
+
+        Args:
+            name (str): The name of the image.
+
+        Returns:
+            pygame.Surface: The shared subsurface of the image.
+
+        Raises:
+            KeyError: If no image with that name is packed in the atlas.
+        """
+        image: pygame.Surface | None = self._images.get(name)
+        if image is None:
+            image = self.surface.subsurface(self.rects[name])
+            self._images[name] = image
+        return image
+
+    def install(self, image_folder: str) -> int:
+        """
+        Makes the packed images available as if they were loose files of a folder.
+
+        Every image is stored in the SurfaceCache under its path in the folder, and every
+        subfolder is registered in the ImageHelper, so entities load and pick random images
+        exactly as they do from loose files, even if the folder does not exist.
+
+        Args:
+            image_folder (str): The folder the images were packed from.
+
+        Returns:
+            int: The number of images installed.
+        """
+        folders: dict[str, list[str]] = {}
+        for name in sorted(self.rects):
+            parts: list[str] = name.split("/")
+            SurfaceCache.add(os.path.join(image_folder, *parts), self.get(name))
+            folders.setdefault(os.path.join(image_folder, *parts[:-1]), []).append(parts[-1])
+
+        for folder, image_files in folders.items():
+            ImageHelper.register_folder(folder, image_files)
+        return len(self.rects)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+import pygame
+from pygame.font import Font
+
+from src.helpers import TextCache
+
+
+class HudLine:
+    """
+    A single line of the HUD.
+
+    Attributes:
+        index (int): The position of the line in the HUD, starting at 0 for the top line.
+        template (str): The text of the line, ``{}`` is replaced by the value.
+        color (tuple): The color of the text.
+        value (object): The value currently shown.
+        text (pygame.Surface | None): The rendered text, None until a value is set.
+    """
+
+    index: int
+    template: str
+    color: tuple
+    value: object
+    text: pygame.Surface | None
+
+    def __init__(self, index: int, template: str, color: tuple) -> None:
+        """
+        Initialize a HudLine without value.
+
+        Args:
+            index (int): The position of the line in the HUD.
+            template (str): The text of the line, ``{}`` is replaced by the value.
+            color (tuple): The color of the text.
+        """
+        self.index = index
+        self.template = template
+        self.color = color
+        self.value = None
+        self.text = None
+
+
+class Hud:
+    """
+    The heads-up display showing the game counters in the top-left corner of the window.
+
+    Every line is rendered through a shared TextCache and composed into a single overlay surface.
+    Setting a value only re-renders the line it belongs to, and only when the value changed, so
+    drawing the HUD every frame costs a single blit.
+
+    Attributes:
+        font (Font): The font used to render the lines.
+        text_cache (TextCache): The cache of rendered text surfaces.
+        position (tuple[int, int]): The top-left corner of the HUD on the screen.
+        line_spacing (int): The vertical distance between two lines, in pixels.
+        overlay (pygame.Surface): The composed HUD lines.
+        renders (int): The number of times a line was composed into the overlay.
+    """
+
+    font: Font
+    text_cache: TextCache
+    position: tuple[int, int]
+    line_spacing: int
+    overlay: pygame.Surface
+    renders: int
+
+    def __init__(self, font: Font, position: tuple[int, int] = (10, 10), line_spacing: int = 40,
+                 text_cache: TextCache | None = None) -> None:
+        """
+        Initialize an empty Hud.
+
+        Args:
+            font (Font): The font used to render the lines.
+            position (tuple[int, int]): The top-left corner of the HUD on the screen.
+            line_spacing (int): The vertical distance between two lines, in pixels.
+            text_cache (TextCache | None): The text cache to use, a new one is created if None.
+        """
+        self.font = font
+        self.position = position
+        self.line_spacing = line_spacing
+        self.text_cache = text_cache if text_cache is not None else TextCache()
+        self.overlay = pygame.Surface((0, 0), pygame.SRCALPHA)
+        self.renders = 0
+        self._lines: dict[str, HudLine] = {}
+
+    def add_line(self, name: str, template: str, color: tuple) -> None:
+        """
+        Adds a line below the existing ones.
+
+        Args:
+            name (str): The name used to set the value of the line.
+            template (str): The text of the line, ``{}`` is replaced by the value.
+            color (tuple): The color of the text.
+        """
+        self._lines[name] = HudLine(len(self._lines), template, color)
+
+    def set(self, name: str, value: object) -> bool:
+        """
+        Sets the value shown by a line, re-rendering it only if the value changed.
+
+        Args:
+            name (str): The name of the line.
+            value (object): The value to show.
+
+        Returns:
+            bool: True if the line was re-rendered, False if the value did not change.
+
+        Raises:
+            KeyError: If there is no line with the given name.
+        """
+        line: HudLine = self._lines[name]
+        if line.text is not None and line.value == value:
+            return False
+
+        old_text: pygame.Surface | None = line.text
+        line.value = value
+        line.text = self.text_cache.render(self.font, line.template.format(value), line.color)
+
+        y: int = line.index * self.line_spacing
+        if line.text.get_width() > self.overlay.get_width() or y + line.text.get_height() > self.overlay.get_height():
+            self._compose()
+            return True
+
+        if old_text is not None:
+            self.overlay.fill((0, 0, 0, 0), pygame.Rect((0, y), old_text.get_size()))
+        self.overlay.blit(line.text, (0, y))
+        self.renders += 1
+        return True
+
+    def _compose(self) -> None:
+        """
+        Builds the overlay again from the rendered text of every line.
+        """
+        lines: list[HudLine] = [line for line in self._lines.values() if line.text is not None]
+        width: int = max((line.text.get_width() for line in lines), default=0)
+        height: int = max((line.index * self.line_spacing + line.text.get_height() for line in lines), default=0)
+        self.overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        for line in lines:
+            self.overlay.blit(line.text, (0, line.index * self.line_spacing))
+            self.renders += 1
+
+    def get_rect(self) -> pygame.Rect:
+        """
+        Returns the area of the screen covered by the HUD.
+
+        Returns:
+            pygame.Rect: The screen area covered by the overlay.
+        """
+        return self.overlay.get_rect(topleft=self.position)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """
+        Draws the HUD with a single blit.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+
+        Returns:
+            pygame.Rect: The area of the surface that was drawn.
+        """
+        return surface.blit(self.overlay, self.position)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+
+import random
+from typing import Protocol, Sequence
+
+import pygame
+
+# the input of a simulation tick packed in a byte: the keys held and the commands pressed
+INPUT_LEFT: int = 1
+INPUT_RIGHT: int = 2
+COMMAND_PAUSE: int = 4
+COMMAND_RESTART: int = 8
+KEY_BITS: int = INPUT_LEFT | INPUT_RIGHT
+COMMAND_BITS: int = COMMAND_PAUSE | COMMAND_RESTART
+
+
+def encode_keys(keys: Sequence[bool]) -> int:
+    """
+    Packs the keys read by the hero into input bits.
+
+    Args:
+        keys (Sequence[bool]): The keys held down, indexed by key code.
+
+    Returns:
+        int: The INPUT_LEFT and INPUT_RIGHT bits of the keys held.
+    """
+    return (INPUT_LEFT if keys[pygame.K_LEFT] else 0) | (INPUT_RIGHT if keys[pygame.K_RIGHT] else 0)
+
+
+class KeyState:
+    """
+    The keys held during a frame, readable like the result of ``pygame.key.get_pressed()``.
+
+    Attributes:
+        held (frozenset[int]): The key codes held down.
+    """
+
+    held: frozenset[int]
+
+    def __init__(self, *keys: int) -> None:
+        """
+        Initialize a KeyState with the given keys held down.
+
+        Args:
+            *keys (int): The key codes held down.
+        """
+        self.held = frozenset(keys)
+
+    @staticmethod
+    def from_bits(bits: int) -> "KeyState":
+        """
+        Unpacks the keys held from input bits.
+
+        Args:
+            bits (int): The input bits, whose command bits are ignored.
+
+        Returns:
+            KeyState: The keys held.
+        """
+        return KEY_STATES_BY_BITS[bits & KEY_BITS]
+
+    def __getitem__(self, key: int) -> bool:
+        """
+        Returns whether a key is held down.
+
+        Args:
+            key (int): The key code.
+
+        Returns:
+            bool: True if the key is held down.
+        """
+        return key in self.held
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, KeyState) and self.held == other.held
+
+    def __hash__(self) -> int:
+        return hash(self.held)
+
+    def __repr__(self) -> str:
+        return f"KeyState({', '.join(pygame.key.name(key) for key in sorted(self.held))})"
+
+
+IDLE: KeyState = KeyState()
+LEFT: KeyState = KeyState(pygame.K_LEFT)
+RIGHT: KeyState = KeyState(pygame.K_RIGHT)
+
+# names used in input scripts
+KEY_STATES: dict[str, KeyState] = {"none": IDLE, "left": LEFT, "right": RIGHT}
+KEY_STATES_BY_BITS: dict[int, KeyState] = {
+    0: IDLE, INPUT_LEFT: LEFT, INPUT_RIGHT: RIGHT, KEY_BITS: KeyState(pygame.K_LEFT, pygame.K_RIGHT),
+}
+
+
+class InputProvider(Protocol):
+    """
+    Returns the keys held during every frame of a game run without a keyboard.
+    """
+
+    def __call__(self, frame: int) -> KeyState:
+        ...
+
+
+class IdleInput:
+    """
+    An input provider that never presses any key.
+    """
+
+    def __call__(self, frame: int) -> KeyState:
+        """
+        Returns the keys held during a frame.
+
+        Args:
+            frame (int): The frame number.
+
+        Returns:
+            KeyState: No key held.
+        """
+        return IDLE
+
+
+class RandomInput:
+    """
+    An input provider that holds left, right or nothing for random stretches of frames.
+
+    Attributes:
+        rng (random.Random): The random generator choosing the keys.
+        min_frames (int): The shortest number of frames a choice is held.
+        max_frames (int): The longest number of frames a choice is held.
+    """
+
+    rng: random.Random
+    min_frames: int
+    max_frames: int
+
+    def __init__(self, seed: int | None = None, min_frames: int = 10, max_frames: int = 60) -> None:
+        """
+        Initialize a RandomInput.
+
+        Args:
+            seed (int | None): The seed of the random generator.
+            min_frames (int): The shortest number of frames a choice is held.
+            max_frames (int): The longest number of frames a choice is held.
+
+        Raises:
+            ValueError: If min_frames is not positive or greater than max_frames.
+        """
+        if min_frames <= 0 or min_frames > max_frames:
+            raise ValueError("Hold frames must be positive and min_frames must not exceed max_frames.")
+
+        self.rng = random.Random(seed)
+        self.min_frames = min_frames
+        self.max_frames = max_frames
+        self._keys: KeyState = IDLE
+        self._until = 0
+
+    def __call__(self, frame: int) -> KeyState:
+        """
+        Returns the keys held during a frame, choosing new ones when the current stretch ends.
+
+        Args:
+            frame (int): The frame number, expected to increase by one on every call.
+
+        Returns:
+            KeyState: The keys held.
+        """
+        if frame >= self._until:
+            self._keys = self.rng.choice((IDLE, LEFT, RIGHT))
+            self._until = frame + self.rng.randint(self.min_frames, self.max_frames)
+        return self._keys
+
+
+class RecordedInput:
+    """
+    An input provider playing the keys recorded for every tick of a replay, then no key.
+
+    Only the left and right keys are played back: the pause and restart commands of the
+    recording are left out, so the recorded moves can be replayed in another game.
+
+    Attributes:
+        inputs (bytes): The input bits of every tick, as packed by encode_keys().
+    """
+
+    inputs: bytes
+
+    def __init__(self, inputs: bytes) -> None:
+        """
+        Initialize a RecordedInput.
+
+        Args:
+            inputs (bytes): The input bits of every tick, as packed by encode_keys().
+        """
+        self.inputs = bytes(inputs)
+
+    def __call__(self, frame: int) -> KeyState:
+        """
+        Returns the keys recorded for a frame.
+
+        Args:
+            frame (int): The frame number.
+
+        Returns:
+            KeyState: The keys held, no key after the end of the recording.
+        """
+        if frame < len(self.inputs):
+            return KEY_STATES_BY_BITS[self.inputs[frame] & KEY_BITS]
+        return IDLE
+
+
+class ScriptedInput:
+    """
+    An input provider replaying a script of key stretches in a loop.
+
+    A script has one stretch per line, made of a number of frames and the keys held, like
+    ``"30 left"``, ``"15 none"`` or ``"40 right"``. Empty lines and lines starting with ``#``
+    are ignored.
+
+    Attributes:
+        steps (list[tuple[int, KeyState]]): The number of frames and the keys of every stretch.
+    """
+
+    steps: list[tuple[int, KeyState]]
+
+    def __init__(self, steps: list[tuple[int, KeyState]]) -> None:
+        """
+        Initialize a ScriptedInput.
+
+        Args:
+            steps (list[tuple[int, KeyState]]): The number of frames and the keys of every stretch.
+
+        Raises:
+            ValueError: If the script is empty or a stretch is not positive.
+        """
+        if not steps or any(frames <= 0 for frames, _ in steps):
+            raise ValueError("Input script must have stretches of a positive number of frames.")
+
+        self.steps = steps
+        self._length: int = sum(frames for frames, _ in steps)
+
+    @staticmethod
+    def parse(script: str) -> "ScriptedInput":
+        """
+        Builds a ScriptedInput from the text of a script.
+
+        Args:
+            script (str): The text of the script.
+
+        Returns:
+            ScriptedInput: The input provider.
+
+        Raises:
+            ValueError: If a line cannot be parsed.
+        """
+        steps: list[tuple[int, KeyState]] = []
+        for number, line in enumerate(script.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts: list[str] = line.split()
+            if len(parts) != 2 or not parts[0].isdigit() or parts[1].lower() not in KEY_STATES:
+                raise ValueError(f"Invalid input script line {number}: {line!r}")
+            steps.append((int(parts[0]), KEY_STATES[parts[1].lower()]))
+        return ScriptedInput(steps)
+
+    def __call__(self, frame: int) -> KeyState:
+        """
+        Returns the keys held during a frame.
+
+        Args:
+            frame (int): The frame number.
+
+        Returns:
+            KeyState: The keys of the stretch the frame falls in.
+        """
+        position: int = frame % self._length
+        for frames, keys in self.steps:
+            if position < frames:
+                return keys
+            position -= frames
+        return IDLE  # pragma: no cover
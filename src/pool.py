@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+from typing import Generic, TypeVar
+
+from constants import POOL_HIGH_WATER
+
+T = TypeVar("T")
+
+
+class EntityPool(Generic[T]):
+    """
+    A free list of the killed entities of one class, reset and reused by the next spawns.
+
+    An entity acquired from the pool goes back to it when it is killed, and the next acquire
+    reinitializes it with its ``reset`` method, which takes the arguments of its constructor,
+    instead of creating a new object. Spawning then allocates no sprite, rect or dictionary,
+    so the game loop leaves less garbage behind for the collector.
+
+    At most high_water free entities are kept: the ones released beyond it are left to the
+    garbage collector, so a burst of kills does not hold on to memory. A high-water mark of
+    0 disables the pooling.
+
+    Attributes:
+        factory (type[T]): The class of the entities, created when the pool is empty.
+        high_water (int): The maximum number of free entities kept.
+        free (list[T]): The killed entities waiting to be reused.
+        created (int): The number of entities created because the pool was empty.
+        reused (int): The number of entities reset and reused.
+        released (int): The number of entities given back to the pool.
+        dropped (int): The number of entities released while the pool was full.
+        peak (int): The largest number of free entities held at once.
+    """
+
+    factory: type[T]
+    high_water: int
+    free: list[T]
+    created: int
+    reused: int
+    released: int
+    dropped: int
+    peak: int
+
+    def __init__(self, factory: type[T], high_water: int = POOL_HIGH_WATER) -> None:
+        """
+        Initialize an empty EntityPool.
+
+        Args:
+            factory (type[T]): The class of the entities, whose reset method takes the arguments of its constructor.
+            high_water (int): The maximum number of free entities kept, 0 to disable the pooling.
+
+        Raises:
+            ValueError: If high_water is negative.
+        """
+        if high_water < 0:
+            raise ValueError("High-water mark must be a non-negative value.")
+
+        self.factory = factory
+        self.high_water = high_water
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0
+        self.peak = 0
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+    def acquire(self, *args, **kwargs) -> T:
+        """
+        Returns a free entity reset with the given arguments, or a new one if the pool is empty.
+
+        Args:
+            *args, **kwargs: The arguments of the constructor of the entities.
+
+        Returns:
+            T: The entity, given back to the pool when it is killed.
+        """
+        if self.free:
+            entity: T = self.free.pop()
+            entity.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            entity = self.factory(*args, **kwargs)
+            self.created += 1
+        entity.pool = self
+        return entity
+
+    def release(self, entity: T) -> bool:
+        """
+        Gives an entity back to the pool, unless the pool is full.
+
+        The entity is detached from the pool, so releasing it again does nothing until it
+        is acquired again.
+
+        Args:
+            entity (T): The entity, which must not be used by the game anymore.
+
+        Returns:
+            bool: True if the entity was kept for a later acquire.
+        """
+        if entity.pool is not self:
+            return False
+        entity.pool = None
+        if len(self.free) >= self.high_water:
+            self.dropped += 1
+            return False
+        self.free.append(entity)
+        self.released += 1
+        self.peak = max(self.peak, len(self.free))
+        return True
+
+    def clear(self) -> None:
+        """
+        Drops every free entity, leaving them to the garbage collector.
+        """
+        self.free.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the size and counters of the pool.
+
+        Returns:
+            dict[str, int]: The free entities, the high-water mark, and the entities created,
+                reused, released, dropped and the peak of free entities.
+        """
+        return {
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "dropped": self.dropped,
+            "peak": self.peak,
+        }
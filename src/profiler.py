@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class FrameProfiler:
+    """
+    Collects per-frame measurements of the game loop.
+
+    Every measurement is identified by a name, and the profiler keeps its last value, its total
+    and the number of frames it was recorded in. Sections of code can be timed with the
+    ``section`` context manager, which records the elapsed time in milliseconds.
+
+    Attributes:
+        frames (int): The number of frames profiled so far.
+    """
+
+    frames: int
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty FrameProfiler.
+        """
+        self.frames = 0
+        self._last: dict[str, float] = {}
+        self._totals: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+
+    def end_frame(self) -> None:
+        """
+        Marks the end of a frame.
+        """
+        self.frames += 1
+
+    def record(self, name: str, value: float) -> None:
+        """
+        Records a measurement for the current frame.
+
+        Args:
+            name (str): The name of the measurement.
+            value (float): The measured value.
+        """
+        self._last[name] = value
+        self._totals[name] = self._totals.get(name, 0.0) + value
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """
+        Times the code run inside the context and records it in milliseconds.
+
+        Args:
+            name (str): The name of the measurement.
+        """
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def last(self, name: str) -> float:
+        """
+        Returns the last recorded value of a measurement.
+
+        Args:
+            name (str): The name of the measurement.
+
+        Returns:
+            float: The last value, or 0 if it was never recorded.
+        """
+        return self._last.get(name, 0.0)
+
+    def average(self, name: str) -> float:
+        """
+        Returns the average value of a measurement over the frames it was recorded in.
+
+        Args:
+            name (str): The name of the measurement.
+
+        Returns:
+            float: The average value, or 0 if it was never recorded.
+        """
+        count: int = self._counts.get(name, 0)
+        return self._totals[name] / count if count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """
+        Returns the average of every measurement.
+
+        Returns:
+            dict[str, float]: The average value of every measurement by name.
+        """
+        return {name: self.average(name) for name in sorted(self._totals)}
+
+    def report(self) -> str:
+        """
+        Returns a human-readable report of every measurement.
+
+        Returns:
+            str: One line per measurement with its average and last value.
+        """
+        lines: list[str] = [f"frames: {self.frames}"]
+        for name, average in self.summary().items():
+            lines.append(f"{name}: avg {average:.3f}, last {self.last(name):.3f}")
+        return "\n".join(lines)
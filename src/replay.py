@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+import time
+import zlib
+from array import array
+from struct import Struct
+
+from constants import *
+from inputs import COMMAND_BITS, KeyState
+
+# the seeds a replay can hold, packed as a signed 64-bit integer in its header
+SEED_MIN: int = -2 ** 63
+SEED_MAX: int = 2 ** 63 - 1
+
+
+def gameplay_constants() -> tuple:
+    """
+    Returns the constants the simulation of a game depends on.
+
+    :return: The simulation rate, window size, speeds, sprite limits and spawn probabilities.
+    """
+    return (
+        SIM_RATE, WINDOW_WIDTH, WINDOW_HEIGHT, HERO_SPEED, MONSTER_SPEED, COIN_SPEED, JEWEL_SPEED,
+        MAX_MONSTERS, MAX_COINS, MAX_JEWELS,
+        MONSTER_SPAWN_PROBABILITY, COIN_SPAWN_PROBABILITY, JEWEL_SPAWN_PROBABILITY,
+    )
+
+
+def state_checksum(world) -> int:
+    """
+    Returns a CRC32 of the simulation state of a world.
+
+    The tick, counters and flags of the world are hashed along with the position of every
+    sprite, and the value or alpha of the coins, jewels and monsters. The rects of the
+    sprites of an entity store are synced with its arrays first.
+
+    :param world: The world.
+    :return: The checksum of the state.
+    """
+    if world.store is not None:
+        world.store.sync()
+    state = array("i", (
+        world.timestep.ticks, world.score, world.hero.life_points, world.level, world.collected_coins,
+        world.collected_jewels, world.hits, world.game_over, world.paused, world.hero_is_blinking,
+        *world.hero.rect,
+    ))
+    for group in (world.monsters, world.coins, world.jewels, world.potions):
+        state.append(len(group))
+        for sprite in group:
+            state.extend(sprite.rect)
+            state.append(getattr(sprite, "value", getattr(sprite, "alpha", 0)))
+    return zlib.crc32(state.tobytes())
+
+
+class Replay:
+    """
+    The input and state checksum of every simulation tick of a game, saved in a compact binary file.
+
+    The file starts with a header holding the seed of the game and the constants its simulation
+    depends on, followed by a zlib stream of one input byte per tick, as packed by the inputs
+    module, and one CRC32 of the game state per tick. Replaying the inputs in a game with the
+    same seed and constants plays the same ticks, and the checksums catch the exact tick where
+    a replay diverges.
+
+    Attributes:
+        seed (int): The seed of the recorded game.
+        constants (tuple): The gameplay constants of the recorded game.
+        inputs (bytearray): The input bits of every tick.
+        checksums (array): The state checksum after every tick.
+    """
+
+    MAGIC: bytes = b"HMRP"
+    VERSION: int = 1
+    # magic, version, seed, tick count, then the gameplay constants
+    HEADER: Struct = Struct("<4sHqI10H3d")
+
+    seed: int
+    constants: tuple
+    inputs: bytearray
+    checksums: array
+
+    def __init__(self, seed: int, constants: tuple | None = None) -> None:
+        """
+        Initialize an empty Replay.
+
+        :param seed: The seed of the recorded game.
+        :param constants: The gameplay constants of the recorded game, the current ones if None.
+        :raises ValueError: If the seed does not fit in a signed 64-bit integer.
+        """
+        if not SEED_MIN <= seed <= SEED_MAX:
+            raise ValueError("Seed must be a signed 64-bit value.")
+        self.seed = seed
+        self.constants = gameplay_constants() if constants is None else tuple(constants)
+        self.inputs = bytearray()
+        self.checksums = array("I")
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def record(self, bits: int, checksum: int) -> None:
+        """
+        Appends a tick to the replay.
+
+        :param bits: The input bits of the tick.
+        :param checksum: The state checksum after the tick.
+        """
+        self.inputs.append(bits)
+        self.checksums.append(checksum)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the replay to a file.
+
+        :param path: The path of the file.
+        """
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.seed, len(self), *self.constants))
+            replay_file.write(zlib.compress(bytes(self.inputs) + self.checksums.tobytes(), 9))
+
+    @staticmethod
+    def load(path: str) -> "Replay":
+        """
+        Reads a replay from a file.
+
+        :param path: The path of the file.
+        :return: The replay.
+        :raises ValueError: If the file is not a replay, or is truncated.
+        """
+        with open(path, "rb") as replay_file:
+            data: bytes = replay_file.read()
+        if len(data) < Replay.HEADER.size:
+            raise ValueError(f"{path} is not a replay file.")
+        magic, version, seed, ticks, *constants = Replay.HEADER.unpack_from(data)
+        if magic != Replay.MAGIC or version != Replay.VERSION:
+            raise ValueError(f"{path} is not a replay file.")
+
+        try:
+            body: bytes = zlib.decompress(data[Replay.HEADER.size:])
+        except zlib.error as error:
+            raise ValueError(f"{path} is corrupted: {error}") from error
+        checksums = array("I")
+        if len(body) != ticks * (1 + checksums.itemsize):
+            raise ValueError(f"{path} is truncated.")
+
+        replay = Replay(seed, tuple(constants))
+        replay.inputs = bytearray(body[:ticks])
+        checksums.frombytes(body[ticks:])
+        replay.checksums = checksums
+        return replay
+
+
+def play(world, replay: Replay, verify: bool = True) -> dict[str, float]:
+    """
+    Replays the recorded inputs in a world as fast as possible, without any window, sound or frame.
+
+    The world must have been created with the seed of the replay. Every tick gets the keys
+    and commands recorded for it, and with verify the state checksum after the tick is
+    compared with the recorded one, stopping at the first tick that differs.
+
+    :param world: The world, created with the seed of the replay.
+    :param replay: The replay.
+    :param verify: If True, stop at the first tick whose state differs from the recording.
+    :return: The ticks replayed, the ticks per second, the score, coins, jewels and hits at the
+        end, and the first divergent tick, or -1 if none.
+    :raises ValueError: If the world seed or the gameplay constants differ from the recording.
+    """
+    if world.seed != replay.seed:
+        raise ValueError("World seed must match the replay seed.")
+    if replay.constants != gameplay_constants():
+        raise ValueError("Replay was recorded with different gameplay constants.")
+
+    diverged_at: int = -1
+    start: float = time.perf_counter()
+    tick = 0
+    for tick, bits in enumerate(replay.inputs, 1):
+        world.step(world.timestep.time, KeyState.from_bits(bits), bits & COMMAND_BITS)
+        world.timestep.tick()
+        if verify and state_checksum(world) != replay.checksums[tick - 1]:
+            diverged_at = tick - 1
+            break
+    elapsed: float = time.perf_counter() - start
+
+    return {
+        "frames": tick,
+        "fps": tick / elapsed if elapsed > 0 else 0.0,
+        "score": world.score,
+        "coins": world.collected_coins,
+        "jewels": world.collected_jewels,
+        "hits": world.hits,
+        "game_over": world.game_over,
+        "diverged_at": diverged_at,
+    }
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+
+from typing import Iterable
+
+import pygame
+
+from constants import SPATIAL_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    A uniform grid of square cells indexing sprites by the cells their rect overlaps.
+
+    A rect query only looks at the sprites of the cells the rect overlaps, so its cost depends
+    on how crowded the area is, not on how many sprites the grid holds. Moving a sprite only
+    touches the grid when its rect enters or leaves a cell.
+
+    Attributes:
+        cell_size (int): The width and height of a cell in pixels.
+        cells (dict[tuple[int, int], set[pygame.sprite.Sprite]]): The sprites of every non-empty cell.
+    """
+
+    cell_size: int
+    cells: dict[tuple[int, int], set[pygame.sprite.Sprite]]
+
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE) -> None:
+        """
+        Initialize an empty SpatialHash.
+
+        Args:
+            cell_size (int): The width and height of a cell in pixels.
+
+        Raises:
+            ValueError: If cell_size is not positive.
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be a positive value.")
+
+        self.cell_size = cell_size
+        self.cells = {}
+        # the cell range and insertion order of every sprite
+        self._entries: dict[pygame.sprite.Sprite, tuple[tuple[int, int, int, int], int]] = {}
+        self._serial = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, sprite: pygame.sprite.Sprite) -> bool:
+        return sprite in self._entries
+
+    def cell_range(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        """
+        Returns the first and last cell columns and rows a rect overlaps.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            tuple[int, int, int, int]: The first column, first row, last column and last row,
+                the last ones being lower than the first ones for an empty rect.
+        """
+        size: int = self.cell_size
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    def _link(self, sprite: pygame.sprite.Sprite, cells: tuple[int, int, int, int]) -> None:
+        left, top, right, bottom = cells
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                self.cells.setdefault((column, row), set()).add(sprite)
+
+    def _unlink(self, sprite: pygame.sprite.Sprite, cells: tuple[int, int, int, int]) -> None:
+        left, top, right, bottom = cells
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell: set[pygame.sprite.Sprite] = self.cells[(column, row)]
+                cell.discard(sprite)
+                if not cell:
+                    del self.cells[(column, row)]
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Adds a sprite to the cells its rect overlaps, or moves it if it is already in the grid.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite.
+        """
+        if sprite in self._entries:
+            self.move(sprite)
+            return
+        cells: tuple[int, int, int, int] = self.cell_range(sprite.rect)
+        self._link(sprite, cells)
+        self._entries[sprite] = (cells, self._serial)
+        self._serial += 1
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Removes a sprite from the grid, if it is in it.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite.
+        """
+        entry = self._entries.pop(sprite, None)
+        if entry is not None:
+            self._unlink(sprite, entry[0])
+
+    def move(self, sprite: pygame.sprite.Sprite) -> bool:
+        """
+        Updates the cells of a sprite after its rect changed.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite, which must be in the grid.
+
+        Returns:
+            bool: True if the sprite changed cells.
+        """
+        old_cells, serial = self._entries[sprite]
+        cells: tuple[int, int, int, int] = self.cell_range(sprite.rect)
+        if cells == old_cells:
+            return False
+        self._unlink(sprite, old_cells)
+        self._link(sprite, cells)
+        self._entries[sprite] = (cells, serial)
+        return True
+
+    def refresh(self, sprites: Iterable[pygame.sprite.Sprite]) -> int:
+        """
+        Updates the cells of the sprites whose rect entered or left a cell.
+
+        Args:
+            sprites (Iterable[pygame.sprite.Sprite]): The sprites, which must be in the grid.
+
+        Returns:
+            int: The number of sprites that changed cells.
+        """
+        size: int = self.cell_size
+        entries = self._entries
+        moved = 0
+        for sprite in sprites:
+            rect: pygame.Rect = sprite.rect
+            cells = (rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size)
+            old_cells, serial = entries[sprite]
+            if cells != old_cells:
+                self._unlink(sprite, old_cells)
+                self._link(sprite, cells)
+                entries[sprite] = (cells, serial)
+                moved += 1
+        return moved
+
+    def query(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """
+        Returns the sprites whose rect collides with a rect.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The colliding sprites, in the order they were inserted.
+        """
+        left, top, right, bottom = self.cell_range(rect)
+        found: set[pygame.sprite.Sprite] = set()
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells.get((column, row))
+                if cell:
+                    found.update(sprite for sprite in cell if rect.colliderect(sprite.rect))
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=lambda sprite: self._entries[sprite][1])
+
+    def any(self, rect: pygame.Rect) -> bool:
+        """
+        Returns whether any sprite collides with a rect, stopping at the first one found.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            bool: True if a sprite collides with the rect.
+        """
+        left, top, right, bottom = self.cell_range(rect)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                cell = self.cells.get((column, row))
+                if cell and any(rect.colliderect(sprite.rect) for sprite in cell):
+                    return True
+        return False
+
+    def clear(self) -> None:
+        """
+        Removes every sprite from the grid.
+        """
+        self.cells.clear()
+        self._entries.clear()
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    A sprite group that keeps its sprites indexed in a SpatialHash.
+
+    The sprites are added to the grid when they join the group and removed when they leave
+    it or are killed. After the sprites of the group are updated, only the ones whose rect
+    entered or left a cell are moved in the grid. A sprite moved outside of update() must be
+    moved in the grid with ``grid.move(sprite)``.
+
+    Attributes:
+        grid (SpatialHash): The grid of the sprites of the group.
+    """
+
+    grid: SpatialHash
+
+    def __init__(self, *sprites: pygame.sprite.Sprite, cell_size: int = SPATIAL_CELL_SIZE) -> None:
+        """
+        Initialize a SpatialGroup.
+
+        Args:
+            *sprites (pygame.sprite.Sprite): The sprites of the group.
+            cell_size (int): The width and height of a grid cell in pixels.
+        """
+        self.grid = SpatialHash(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int | None = None) -> None:
+        super().add_internal(sprite, layer)
+        self.grid.insert(sprite)
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+        self.grid.remove(sprite)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Updates the sprites of the group, then moves the ones that changed cells in the grid.
+        """
+        super().update(*args, **kwargs)
+        self.grid.refresh(self.spritedict)
+
+    def collide(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """
+        Returns the sprites of the group whose rect collides with a rect.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The colliding sprites, in the order they joined the group.
+        """
+        return self.grid.query(rect)
+
+    def collideany(self, rect: pygame.Rect) -> bool:
+        """
+        Returns whether any sprite of the group collides with a rect.
+
+        Args:
+            rect (pygame.Rect): The rect.
+
+        Returns:
+            bool: True if a sprite collides with the rect.
+        """
+        return self.grid.any(rect)
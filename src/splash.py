@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import pygame
+
+from constants import BLACK, WHITE, GOLDENTRANS
+
+
+class SplashScreen:
+    """
+    A lightweight loading screen with a title and a progress bar.
+
+    It only uses the default pygame font, so it can be shown before any game asset is loaded.
+
+    Attributes:
+        screen (pygame.Surface): The surface the splash screen is drawn on.
+        title (pygame.Surface): The rendered title.
+        bar (pygame.Rect): The outline of the progress bar.
+        draws (int): The number of times the splash screen was drawn.
+    """
+
+    screen: pygame.Surface
+    title: pygame.Surface
+    bar: pygame.Rect
+    draws: int
+
+    def __init__(self, screen: pygame.Surface, title: str = "Hero vs Monsters") -> None:
+        """
+        Initialize a SplashScreen centered on the screen.
+
+        Args:
+            screen (pygame.Surface): The surface the splash screen is drawn on.
+            title (str): The title shown above the progress bar.
+        """
+        self.screen = screen
+        self.title = pygame.font.Font(None, 48).render(title, True, WHITE)
+        width, height = screen.get_size()
+        self.bar = pygame.Rect(0, 0, width // 2, 12)
+        self.bar.center = (width // 2, height // 2 + 30)
+        self.draws = 0
+
+    def draw(self, progress: float) -> None:
+        """
+        Draws the splash screen with the given progress and presents it.
+
+        Window events are pumped so the window stays responsive while the assets load.
+
+        Args:
+            progress (float): The loading progress, from 0 to 1.
+        """
+        self.screen.fill(BLACK)
+        self.screen.blit(self.title, self.title.get_rect(midbottom=(self.bar.centerx, self.bar.top - 20)))
+        pygame.draw.rect(self.screen, WHITE, self.bar, 1)
+        filled: pygame.Rect = self.bar.inflate(-4, -4)
+        filled.width = round(filled.width * max(0.0, min(1.0, progress)))
+        if filled.width > 0:
+            pygame.draw.rect(self.screen, GOLDENTRANS[:3], filled)
+        pygame.display.flip()
+        pygame.event.pump()
+        self.draws += 1
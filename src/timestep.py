@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+
+class FixedTimestep:
+    """
+    Runs the simulation at a fixed rate, whatever the frame rate of the rendering.
+
+    The real time elapsed between two frames is added to an accumulator, and the simulation
+    ticks once for every whole tick duration accumulated. The remainder, as a fraction of a
+    tick, is the interpolation factor used to draw the frame between the two last ticks.
+    A frame never runs more than max_steps ticks: after a stall the time that could not be
+    caught up is dropped, so the game slows down instead of freezing to catch up.
+
+    Attributes:
+        rate (int): The number of ticks per second.
+        max_steps (int): The maximum number of ticks run in a frame.
+        dt (float): The duration of a tick in milliseconds.
+        ticks (int): The number of ticks run so far.
+        accumulator (float): The time accumulated and not simulated yet, in milliseconds.
+        dropped (float): The total time dropped after stalls, in milliseconds.
+    """
+
+    rate: int
+    max_steps: int
+    dt: float
+    ticks: int
+    accumulator: float
+    dropped: float
+
+    def __init__(self, rate: int, max_steps: int) -> None:
+        """
+        Initialize a FixedTimestep at tick 0.
+
+        Args:
+            rate (int): The number of ticks per second.
+            max_steps (int): The maximum number of ticks run in a frame.
+
+        Raises:
+            ValueError: If rate or max_steps is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("Simulation rate must be a positive value.")
+        if max_steps <= 0:
+            raise ValueError("Maximum steps must be a positive value.")
+
+        self.rate = rate
+        self.max_steps = max_steps
+        self.dt = 1000 / rate
+        self.ticks = 0
+        self.accumulator = 0.0
+        self.dropped = 0.0
+        self._last_time: int | None = None
+
+    @property
+    def time(self) -> int:
+        """
+        Returns the simulated time of the current tick.
+
+        Returns:
+            int: The time in milliseconds, as if every tick lasted exactly dt.
+        """
+        return int(self.ticks * self.dt)
+
+    @property
+    def alpha(self) -> float:
+        """
+        Returns how far the frame is between the last tick and the next one.
+
+        Returns:
+            float: The interpolation factor, from 0 to 1.
+        """
+        return min(1.0, self.accumulator / self.dt)
+
+    def advance(self, current_time: int) -> int:
+        """
+        Accumulates the real time elapsed since the previous frame.
+
+        The first call only starts the clock. The ticks returned are taken out of the
+        accumulator, and must be run by calling tick() after each of them.
+
+        Args:
+            current_time (int): The real time in milliseconds, like pygame.time.get_ticks().
+
+        Returns:
+            int: The number of ticks to run in this frame, at most max_steps.
+        """
+        if self._last_time is not None:
+            self.accumulator += max(0, current_time - self._last_time)
+        self._last_time = current_time
+
+        steps: int = min(int(self.accumulator // self.dt), self.max_steps)
+        self.accumulator -= steps * self.dt
+        if self.accumulator >= self.dt:
+            # keep the fraction of the next tick, drop the rest of the backlog
+            backlog: float = self.accumulator - self.accumulator % self.dt
+            self.dropped += backlog
+            self.accumulator -= backlog
+        return steps
+
+    def tick(self) -> None:
+        """
+        Marks the end of a simulation tick.
+        """
+        self.ticks += 1
@@ -4,21 +4,114 @@ import math
 import random
 import pygame
 
-def apply_flame_ripple(surface: pygame.Surface, base_amplitude: int, frequency: int, speed: float, offset: float) -> pygame.Surface:
-    [width, height] = surface.get_size()
-    new_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def ripple_distortions(height: int, base_amplitude: int, frequency: int, speed: float, offset: float,
+                       rng: random.Random | None = None) -> list[int]:
+    """
+    Computes the horizontal distortion of every row of a flame ripple.
+
+    Each row gets a randomized amplitude around ``base_amplitude`` modulated by a sine wave
+    along the y-axis, so consecutive calls produce a flickering flame look.
+
+    Args:
+        height (int): The number of rows of the surface.
+        base_amplitude (int): The base amplitude of the ripple in pixels.
+        frequency (int): The frequency of the wave along the y-axis.
+        speed (float): The speed of the ripple animation.
+        offset (float): The phase offset of the ripple, usually derived from the current time.
+        rng (random.Random | None): The random generator of the variations, the random module if None.
 
+    Returns:
+        list[int]: The horizontal offset in pixels of every row.
+    """
+    uniform = random.uniform if rng is None else rng.uniform
+    distortions: list[int] = []
     for y in range(height):
-        amplitude_variation: float = base_amplitude + random.uniform(-5, 5)
+        amplitude_variation: float = base_amplitude + uniform(-5, 5)
         wave: float = math.sin(frequency * y + offset)
 
-        distortion = int(
-            amplitude_variation * wave * math.cos(speed * offset + random.uniform(-0.2, 0.2))
-        )
+        distortions.append(int(
+            amplitude_variation * wave * math.cos(speed * offset + uniform(-0.2, 0.2))
+        ))
+    return distortions
+
+
+def apply_flame_ripple(surface: pygame.Surface, base_amplitude: int, frequency: int, speed: float, offset: float,
+                       rng: random.Random | None = None) -> pygame.Surface:
+    """
+    Returns a copy of the surface with every row shifted horizontally by a flame ripple.
+
+    The row offsets are computed once with ``ripple_distortions`` and applied as row-wise rolls
+    over ``pygame.surfarray`` views of the pixels and the alpha channel. When NumPy is not
+    available the pure-Python implementation is used instead.
+
+    Args:
+        surface (pygame.Surface): The surface to distort.
+        base_amplitude (int): The base amplitude of the ripple in pixels.
+        frequency (int): The frequency of the wave along the y-axis.
+        speed (float): The speed of the ripple animation.
+        offset (float): The phase offset of the ripple, usually derived from the current time.
+        rng (random.Random | None): The random generator of the variations, the random module if None.
+
+    Returns:
+        pygame.Surface: A new SRCALPHA surface with the ripple applied.
+    """
+    if numpy is None:
+        return apply_flame_ripple_python(surface, base_amplitude, frequency, speed, offset, rng)
+
+    [width, height] = surface.get_size()
+    new_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    if width == 0 or height == 0:
+        return new_surface
+
+    distortions = numpy.array(ripple_distortions(height, base_amplitude, frequency, speed, offset, rng))
+
+    # Row y of the result reads column (x + distortion[y]) % width of the source row
+    columns = (numpy.arange(width)[:, numpy.newaxis] + distortions[numpy.newaxis, :]) % width
+    rows = numpy.arange(height)[numpy.newaxis, :]
+
+    source: pygame.Surface = surface
+    if not surface.get_flags() & pygame.SRCALPHA:
+        source = pygame.Surface((width, height), pygame.SRCALPHA)
+        source.blit(surface, (0, 0))
+    new_pixels = pygame.surfarray.pixels3d(new_surface)
+    new_pixels[...] = pygame.surfarray.pixels3d(source)[columns, rows]
+    del new_pixels
+    new_alpha = pygame.surfarray.pixels_alpha(new_surface)
+    new_alpha[...] = pygame.surfarray.pixels_alpha(source)[columns, rows]
+    del new_alpha
+
+    return new_surface
+
+
+def apply_flame_ripple_python(surface: pygame.Surface, base_amplitude: int, frequency: int, speed: float, offset: float,
+                              rng: random.Random | None = None) -> pygame.Surface:
+    """
+    Pure-Python version of ``apply_flame_ripple`` used when NumPy is not available.
+
+    Args:
+        surface (pygame.Surface): The surface to distort.
+        base_amplitude (int): The base amplitude of the ripple in pixels.
+        frequency (int): The frequency of the wave along the y-axis.
+        speed (float): The speed of the ripple animation.
+        offset (float): The phase offset of the ripple, usually derived from the current time.
+        rng (random.Random | None): The random generator of the variations, the random module if None.
+
+    Returns:
+        pygame.Surface: A new SRCALPHA surface with the ripple applied.
+    """
+    [width, height] = surface.get_size()
+    new_surface = pygame.Surface((width, height), pygame.SRCALPHA)
 
+    for y, distortion in enumerate(ripple_distortions(height, base_amplitude, frequency, speed, offset, rng)):
         for x in range(width):
             src_x: int = (x + distortion) % width
             pixel_color: pygame.Color = surface.get_at((src_x, y))
             new_surface.set_at((x, y), pixel_color)
 
-    return new_surface
\ No newline at end of file
+    return new_surface
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+import math
+
+import pygame
+
+
+class VolumeCurve:
+    """
+    A precomputed logarithmic volume curve for the values of collected items.
+
+    The volume of an item worth ``value`` is ``log10(value + 1) / log10(base)``, clamped to
+    [0, 1], so more valuable items sound louder. Every value from ``base - 1`` on plays at full
+    volume, so the volumes of the lower values are computed once and looked up afterwards.
+
+    Attributes:
+        base (float): The value, plus one, played at full volume.
+        volumes (list[float]): The volume of every value below the full volume one.
+    """
+
+    base: float
+    volumes: list[float]
+
+    def __init__(self, base: float) -> None:
+        """
+        Initialize a VolumeCurve and precompute its volumes.
+
+        Args:
+            base (float): The value, plus one, played at full volume.
+
+        Raises:
+            ValueError: If base is not greater than 1.
+        """
+        if base <= 1:
+            raise ValueError("Volume base must be greater than 1.")
+
+        self.base = base
+        self.volumes = [self.compute(value) for value in range(math.ceil(base - 1))]
+
+    def compute(self, value: float) -> float:
+        """
+        Computes the volume of a value.
+
+        Args:
+            value (float): The value of the item.
+
+        Returns:
+            float: The volume, from 0 to 1.
+        """
+        return max(0.0, min(1.0, math.log10(max(value, 0) + 1) / math.log10(self.base)))
+
+    def volume(self, value: int) -> float:
+        """
+        Returns the volume of a value from the precomputed table.
+
+        Args:
+            value (int): The value of the item.
+
+        Returns:
+            float: The volume, from 0 to 1.
+        """
+        if value >= len(self.volumes):
+            return 1.0
+        return self.volumes[max(value, 0)]
+
+
+class VoiceManager:
+    """
+    Plays sounds on pools of reserved mixer channels, one pool per sound category.
+
+    Every category owns a fixed set of channels, and the number of sounds playing at the same
+    time is capped, so the mixing cost stays bounded however many sounds are played in a frame.
+    When a category has no free channel, or the cap is reached, the voice that started playing
+    first is stopped and its channel reused. The volume is set on the channel, never on the
+    shared Sound, so overlapping voices keep their own volume.
+
+    Without an initialized mixer every sound is silently skipped.
+
+    Attributes:
+        max_voices (int): The maximum number of sounds playing at the same time.
+        pools (dict[str, list[pygame.mixer.Channel]]): The channels of every category.
+        steals (int): The number of voices stopped to play a newer sound.
+    """
+
+    max_voices: int
+    pools: dict[str, list[pygame.mixer.Channel]]
+    steals: int
+
+    def __init__(self, pools: dict[str, int], max_voices: int | None = None) -> None:
+        """
+        Initialize a VoiceManager and reserve the channels of its pools.
+
+        Args:
+            pools (dict[str, int]): The number of channels of every category.
+            max_voices (int | None): The maximum number of sounds playing at the same time,
+                every channel of every pool if None.
+
+        Raises:
+            ValueError: If a pool or max_voices is not positive.
+        """
+        if any(channels <= 0 for channels in pools.values()):
+            raise ValueError("Voice pools must have a positive number of channels.")
+        total: int = sum(pools.values())
+        if max_voices is not None and max_voices <= 0:
+            raise ValueError("Maximum voices must be a positive value.")
+
+        self.max_voices = min(max_voices or total, total)
+        self.pools = {}
+        self.steals = 0
+        self._started: dict[pygame.mixer.Channel, int] = {}
+        self._serial = 0
+
+        if not pygame.mixer.get_init():
+            return
+
+        # the pools use the first channels, which Sound.play() never picks once reserved
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for category, channels in pools.items():
+            self.pools[category] = [pygame.mixer.Channel(index + offset) for offset in range(channels)]
+            index += channels
+
+    def busy(self) -> list[pygame.mixer.Channel]:
+        """
+        Returns the channels of every pool currently playing a sound.
+
+        Returns:
+            list[pygame.mixer.Channel]: The busy channels.
+        """
+        return [channel for channels in self.pools.values() for channel in channels if channel.get_busy()]
+
+    def oldest(self, channels: list[pygame.mixer.Channel]) -> pygame.mixer.Channel:
+        """
+        Returns the channel whose sound started playing first.
+
+        Args:
+            channels (list[pygame.mixer.Channel]): The channels to choose from.
+
+        Returns:
+            pygame.mixer.Channel: The oldest channel.
+        """
+        return min(channels, key=lambda channel: self._started.get(channel, -1))
+
+    def play(self, category: str, sound: pygame.mixer.Sound | None, volume: float = 1.0, loops: int = 0) -> pygame.mixer.Channel | None:
+        """
+        Plays a sound on a channel of its category at the given volume.
+
+        Args:
+            category (str): The category of the sound.
+            sound (pygame.mixer.Sound | None): The sound to play, skipped if None.
+            volume (float): The volume of this voice, from 0 to 1.
+            loops (int): The number of times the sound is repeated after the first play.
+
+        Returns:
+            pygame.mixer.Channel | None: The channel playing the sound, or None if it was skipped.
+
+        Raises:
+            KeyError: If the category has no pool.
+        """
+        if sound is None or not self.pools:
+            return None
+
+        pool: list[pygame.mixer.Channel] = self.pools[category]
+        free: list[pygame.mixer.Channel] = [channel for channel in pool if not channel.get_busy()]
+        busy: list[pygame.mixer.Channel] = self.busy()
+        if free and len(busy) < self.max_voices:
+            channel: pygame.mixer.Channel = free[0]
+        else:
+            # steal the oldest voice of the category, or of any category once the cap is reached
+            channel = self.oldest(pool if not free else busy)
+            self.steals += 1
+            if channel not in pool:
+                channel.stop()
+                channel = free[0]
+
+        channel.play(sound, loops)
+        channel.set_volume(volume)
+        self._serial += 1
+        self._started[channel] = self._serial
+        return channel
+
+    def stop(self) -> None:
+        """
+        Stops every sound played by the voice manager.
+        """
+        for channels in self.pools.values():
+            for channel in channels:
+                channel.stop()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+
+from typing import Sequence
+import pygame
+import random
+
+from constants import *
+from timestep import FixedTimestep
+from spatial import SpatialGroup
+from entitystore import ArrayGroup, EntityStore
+from pool import EntityPool
+from inputs import COMMAND_PAUSE, COMMAND_RESTART
+
+
+from src.entities import Hero, Monster, Coin, Jewel, BaseSprite
+from src.helpers import ImageHelper, SurfaceCache
+
+
+class World:
+
+    seed: int
+    rng: random.Random
+    gameplay_rng: random.Random
+    cosmetic_rng: random.Random
+    timestep: FixedTimestep
+    all_sprites: pygame.sprite.RenderUpdates
+    store: EntityStore | None
+    monster_pool: EntityPool[Monster]
+    coin_pool: EntityPool[Coin]
+    jewel_pool: EntityPool[Jewel]
+    coins: SpatialGroup | ArrayGroup
+    monsters: SpatialGroup | ArrayGroup
+    jewels: SpatialGroup | ArrayGroup
+    potions: SpatialGroup | ArrayGroup
+    hero: Hero
+    score: int
+    level: int
+    collected_coins: int
+    collected_jewels: int
+    hits: int
+    game_over: bool
+    paused: bool
+    blink_duration: int
+    blink_start_time: int
+    hero_is_blinking: bool
+    events: list[tuple[str, int]]
+    def __init__(self, seed: int | None = None, entity_store: bool = ENTITY_STORE) -> None:
+        """
+        Initialize a World object.
+
+        A world holds the whole simulation state of a game: its random streams, timestep,
+        sprites, groups, pools, counters and timers. It never opens a window nor plays a
+        sound: what the player should hear or see is left in its events, so a game can play
+        them, and many worlds can be stepped side by side in one process without a display.
+
+        Every random choice of the world is drawn from generators owned by the world and
+        seeded from a single seed: the same seed and the same input play the same game.
+        Gameplay and cosmetic effects draw from separate streams, so an effect never
+        changes what spawns next.
+
+        The sprite images are taken from the SurfaceCache, and loaded from disk the first
+        time they are needed if the game did not install them.
+
+        Args:
+            seed (int | None): The seed of the random generators, a random one if None.
+            entity_store (bool): If True and NumPy is installed, the falling sprites are kept in an EntityStore.
+
+        Attributes:
+            seed (int): The seed of the random generators.
+            rng (random.Random): The generator seeding the gameplay and cosmetic streams.
+            gameplay_rng (random.Random): The random stream of the spawns, positions, values and images.
+            cosmetic_rng (random.Random): The random stream of the visual effects.
+            timestep (FixedTimestep): The fixed rate simulation ticks of the world.
+            all_sprites (pygame.sprite.RenderUpdates): A group of all sprites in the world.
+            store (EntityStore | None): The arrays of the falling sprites, None without the entity store.
+            monster_pool, coin_pool, jewel_pool (EntityPool): The killed sprites of every kind, reused by the spawns.
+            coins, monsters, jewels, potions (SpatialGroup | ArrayGroup): The groups of every kind of sprite,
+                indexed in a grid, or in the entity store, for the collision queries.
+            hero (Hero): The hero object.
+            score (int): The score of the game.
+            level (int): The current level of the game.
+            collected_coins, collected_jewels (int): The number of coins and jewels collected.
+            hits (int): The number of monsters that hit the hero.
+            game_over (bool): A flag indicating if the game is over.
+            paused (bool): A flag indicating if the game is paused.
+            blink_duration (int): The duration of the blinking effect in milliseconds.
+            blink_start_time (int): The start time of the blinking effect in milliseconds.
+            hero_is_blinking (bool): A flag indicating if the hero is blinking.
+            events (list[tuple[str, int]]): The events of the last tick, as (name, value) pairs:
+                ("coin", value) and ("jewel", value) for a collected item, ("hit", 0) when a monster
+                hits the hero, ("game_over", 0), ("pause", paused) and ("restart", 0).
+        """
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng = random.Random(self.seed)
+        self.gameplay_rng = random.Random(self.rng.getrandbits(64))
+        self.cosmetic_rng = random.Random(self.rng.getrandbits(64))
+        self.timestep = FixedTimestep(SIM_RATE, MAX_SIM_STEPS)
+
+        # the spawn folders are listed here, so spawning a monster or a jewel never touches the disk
+        ImageHelper.index_folder(MONSTERS_PATH)
+        ImageHelper.index_folder(JEWELS_PATH)
+
+        # every world owns its groups and pools, so a world never shares a sprite with another
+        self.all_sprites = pygame.sprite.RenderUpdates()
+        self.monster_pool = EntityPool(Monster)
+        self.coin_pool = EntityPool(Coin)
+        self.jewel_pool = EntityPool(Jewel)
+        self.store = EntityStore() if entity_store and EntityStore.available() else None
+        if self.store is not None:
+            self.coins = self.store.group()
+            self.monsters = self.store.group()
+            self.jewels = self.store.group()
+            self.potions = self.store.group()
+        else:
+            self.coins = SpatialGroup()
+            self.monsters = SpatialGroup()
+            self.jewels = SpatialGroup()
+            self.potions = SpatialGroup()
+
+        self.hero = self.create_hero()
+        self.all_sprites.add(self.hero)
+
+        self.score = 0
+        self.level = 1
+        self.collected_coins = 0
+        self.collected_jewels = 0
+        self.hits = 0
+        self.game_over = False
+        self.paused = False
+        self.blink_duration = 2000
+        self.blink_start_time = 0
+        self.hero_is_blinking = False
+        self.events = []
+
+    def create_hero(self) -> Hero:
+        """
+        Create a hero object.
+
+        This method creates a hero object centered at the bottom of the window.
+
+        Returns:
+            hero (Hero): The hero object.
+        """
+        hero_image: pygame.Surface = SurfaceCache.get(os.path.join(SPRITES_PATH, "hero.png"))
+        return Hero(
+            os.path.join(SPRITES_PATH, "hero.png"),
+            WINDOW_WIDTH // 2 - hero_image.get_width() // 2,
+            WINDOW_HEIGHT - hero_image.get_height() - 10,
+            HERO_SPEED,
+            WINDOW_WIDTH,
+        )
+
+    def create_coin(self) -> Coin:
+        """
+        Create a coin object.
+
+        This method creates a coin object with a random x-coordinate within the window width
+        and an initial y-coordinate of 0. The coin moves downwards with the specified speed.
+        A coin killed earlier is reset and reused from the coin pool, if there is one.
+
+        Returns:
+            coin (Coin): The coin object.
+        """
+        coin_image: pygame.Surface = SurfaceCache.get(os.path.join(SPRITES_PATH, "coin.png"))
+        x: int = self.gameplay_rng.randint(0, WINDOW_WIDTH - coin_image.get_width())
+        y: int = coin_image.get_height()
+        return self.coin_pool.acquire(
+            os.path.join(SPRITES_PATH, "coin.png"),
+            x,
+            y,
+            COIN_SPEED,
+            WINDOW_HEIGHT,
+            self.gameplay_rng,
+        )
+
+    def create_jewel(self) -> Jewel:
+        """
+        Create a jewel object.
+
+        This method creates a jewel object with a random x-coordinate within the window width
+        and an initial y-coordinate of 0. The jewel moves downwards with the specified speed.
+        A jewel killed earlier is reset and reused from the jewel pool, if there is one.
+
+        Returns:
+            jewel (Jewel): The jewel object.
+        """
+        x: int = self.gameplay_rng.randint(0, WINDOW_WIDTH - 64)
+        y: int = 0
+        return self.jewel_pool.acquire(JEWELS_PATH, x, y, JEWEL_SPEED, WINDOW_HEIGHT, self.gameplay_rng)
+
+    def create_monster(self) -> Monster:
+        """
+        Create a monster object.
+
+        This method creates a monster object with a random x-coordinate within the window width
+        and an initial y-coordinate of 0. The monster moves downwards with the specified speed.
+        A monster killed earlier is reset and reused from the monster pool, if there is one.
+
+        Returns:
+            monster (Monster): The monster object.
+        """
+        x: int = self.gameplay_rng.randint(0, WINDOW_WIDTH - 64)
+        return self.monster_pool.acquire(MONSTERS_PATH, x, 0, MONSTER_SPEED, WINDOW_HEIGHT, self.gameplay_rng)
+
+    def reset(self) -> None:
+        """
+        Reset the world to the start of a new game.
+
+        This method resets the score, flags, all sprite groups, level, and collected items to their
+        initial state, and creates a new Hero object. The random streams and the timestep go on.
+
+        Returns:
+            None
+        """
+        self.score = 0
+        self.game_over = False
+        # killing the sprites gives them back to their pools
+        for sprite in self.all_sprites.sprites():
+            sprite.kill()
+        self.all_sprites.empty()
+        self.monsters.empty()
+        self.coins.empty()
+        self.jewels.empty()
+        self.potions.empty()
+        self.level = 1
+        self.collected_coins = 0
+        self.collected_jewels = 0
+        self.hits = 0
+        self.hero = self.create_hero()
+        self.all_sprites.add(self.hero)
+        self.events.append(("restart", 0))
+
+    def toggle_pause(self) -> None:
+        """
+        Pause or resume the world.
+
+        Returns:
+            None
+        """
+        self.paused = not self.paused
+        self.events.append(("pause", int(self.paused)))
+
+    def step(self, current_time: int, keys: Sequence[bool] | None = None, commands: int = 0) -> bool:
+        """
+        Advance the world by one simulation tick.
+
+        This method moves the sprites, spawns new monsters, coins and jewels, and
+        handles the collisions of the hero, unless the game is over, paused or the
+        hero is blinking. The positions before the tick are saved, so the frames
+        drawn until the next tick can be interpolated. The events of the previous
+        tick are cleared first.
+
+        Args:
+            current_time (int): The simulated time of the tick in milliseconds.
+            keys (Sequence[bool] | None): The keys held down, indexed by key code,
+                pygame.key.get_pressed() if None.
+            commands (int): The COMMAND_PAUSE and COMMAND_RESTART bits pressed before the tick.
+
+        Returns:
+            bool: True if the world moved, False if it was frozen for this tick.
+        """
+        self.events.clear()
+        if commands & COMMAND_PAUSE:
+            self.toggle_pause()
+        if commands & COMMAND_RESTART and self.game_over:
+            self.reset()
+
+        if self.store is None:
+            for sprite in self.all_sprites:
+                sprite.save_position()
+        else:
+            self.hero.save_position()
+
+        if self.hero_is_blinking and current_time - self.blink_start_time >= self.blink_duration:
+            self.hero_is_blinking = False
+
+        if self.game_over or self.paused or self.hero_is_blinking:
+            # The hit monsters go on fading while the world is frozen, so the fade that starts
+            # with the blink is shown over its whole duration instead of jumping when it ends.
+            self.update_fades(current_time)
+            if self.store is not None:
+                self.store.settle()
+            return False
+
+        self.hero.update(keys)
+        if self.store is None:
+            self.monsters.update(current_time)
+            self.coins.update()
+            self.jewels.update()
+            self.potions.update()
+        else:
+            self.update_store(current_time)
+
+        if len(self.monsters) < MAX_MONSTERS and self.gameplay_rng.random() < MONSTER_SPAWN_PROBABILITY:
+            monster: Monster = self.create_monster()
+            if self.is_positionable(monster):
+                self.monsters.add(monster)
+                self.all_sprites.add(monster)
+            else:
+                self.monster_pool.release(monster)
+
+        if len(self.coins) < MAX_COINS and self.gameplay_rng.random() < COIN_SPAWN_PROBABILITY:
+            coin: Coin = self.create_coin()
+            if self.is_positionable(coin):
+                self.coins.add(coin)
+                self.all_sprites.add(coin)
+            else:
+                self.coin_pool.release(coin)
+
+        if len(self.jewels) < MAX_JEWELS and self.gameplay_rng.random() < JEWEL_SPAWN_PROBABILITY:
+            jewel: Jewel = self.create_jewel()
+            if self.is_positionable(jewel):
+                self.jewels.add(jewel)
+                self.all_sprites.add(jewel)
+            else:
+                self.jewel_pool.release(jewel)
+        colliding_monsters: list[Monster] = [
+            monster for monster in self.monsters.collide(self.hero.rect) if not monster.fade
+        ]
+        if colliding_monsters:
+            self.handle_monster_collision(colliding_monsters, current_time)
+
+        self.handle_collection(self.coins, "collected_coins", "coin")
+        self.handle_collection(self.jewels, "collected_jewels", "jewel")
+        return True
+
+    def update_store(self, current_time: int) -> None:
+        """
+        Move the sprites of the entity store by one tick.
+
+        Every entity falls and the ones below the window are culled in a single pass over the
+        arrays; only the fading monsters are updated one by one. The rects of the sprites are
+        not written back: the collisions are tested on the arrays and the frames drawn from them.
+
+        Args:
+            current_time (int): The simulated time of the tick in milliseconds.
+
+        Returns:
+            None
+        """
+        for sprite in self.store.step():
+            sprite.kill()
+        self.update_fades(current_time)
+
+    def update_fades(self, current_time: int) -> None:
+        """
+        Lower the alpha of the fading monsters, and remove the ones that became invisible.
+
+        Args:
+            current_time (int): The simulated time of the tick in milliseconds.
+
+        Returns:
+            None
+        """
+        for monster in [monster for monster in self.monsters if monster.fade]:
+            monster.update_fade(current_time)
+
+    def handle_monster_collision(self, colliding_monsters, current_time):
+        """
+        Handle collision between the hero and monsters.
+
+        This method handles collisions between the hero and monsters. If the hero's
+        collision cooldown has expired, the method will deduct the monster's damage
+        from the hero's life points, add a "hit" event, and set the hero's blinking
+        flag to True. If the hero's life points reach zero, the method will set the
+        game_over flag to True and add a "game_over" event.
+
+        Args:
+            colliding_monsters (list[Monster]): A list of monsters that have collided with the hero.
+            current_time (int): The current time in milliseconds.
+
+        Returns:
+            None
+        """
+        if current_time - self.hero.last_collision_time > self.hero.collision_cooldown:
+            if self.hero.life_points > 0:
+                self.events.append(("hit", 0))
+                self.hero.last_collision_time = current_time
+                self.blink_start_time = current_time
+                self.hero_is_blinking = True
+
+            for monster in colliding_monsters:
+                self.hero.life_points -= monster.damage
+                self.hits += 1
+                monster.fade_out(current_time)
+
+            if self.hero.life_points <= 0:
+                self.game_over = True
+                self.events.append(("game_over", 0))
+
+    def handle_collection(self, items: SpatialGroup | ArrayGroup, collection_attr: str, category: str) -> None:
+        """
+        Handles the collection of items and updates the score and the
+        collection attribute. Every item collected adds an event of the
+        category with the value of the item.
+
+        Args:
+            items (SpatialGroup | ArrayGroup): The group of items to check for collection.
+            collection_attr (str): The name of the attribute to increase
+                when an item is collected.
+            category (str): The name of the events added, which is also their sound category.
+        """
+        for item in items.collide(self.hero.rect):
+            item.kill()
+            self.score += item.value
+            setattr(self, collection_attr, getattr(self, collection_attr) + 1)
+            self.events.append((category, item.value))
+
+    def is_positionable(self, asset: BaseSprite) -> bool:
+        """
+        Checks if the given asset can be positioned without overlapping with any other asset.
+
+        Only the sprites in the grid cells overlapped by the asset are tested, or with the
+        entity store, every entity at once.
+
+        Args:
+            asset (pygame.sprite.Sprite): The asset to check.
+
+        Returns:
+            bool: True if the asset can be positioned, False otherwise.
+        """
+        if self.store is not None:
+            return not self.store.any_overlap(asset.rect)
+        return all(
+            not group.collideany(asset.rect)
+            for group in [self.jewels, self.coins, self.monsters, self.potions]
+        )
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Returns the size and counters of the pool of every kind of sprite.
+
+        Returns:
+            dict[str, dict[str, int]]: The stats of the monster, coin and jewel pools.
+        """
+        return {
+            "monsters": self.monster_pool.stats(),
+            "coins": self.coin_pool.stats(),
+            "jewels": self.jewel_pool.stats(),
+        }
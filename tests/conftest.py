@@ -1,5 +1,28 @@
 import sys
 import os
 
+import pytest
+
 # Add src directory to PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from src.entities import Coin, MonsterTypeRegistry
+from src.helpers import ImageHelper, PixelCache, SoundCache, SurfaceCache
+
+
+@pytest.fixture(autouse=True)
+def clear_image_caches():
+    """Start every test with empty image caches so mocked images, folders and fonts never leak between tests."""
+    SurfaceCache.clear()
+    ImageHelper.clear_index()
+    Coin.label_font = None
+    MonsterTypeRegistry.clear()
+    PixelCache.enable(None)
+    SoundCache.enable(None)
+    yield
+    SurfaceCache.clear()
+    ImageHelper.clear_index()
+    Coin.label_font = None
+    MonsterTypeRegistry.clear()
+    PixelCache.enable(None)
+    SoundCache.enable(None)
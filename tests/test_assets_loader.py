@@ -0,0 +1,104 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.assets_loader import AssetLoader, load_fonts, read_font_data, submit_images, install_images
+from src.helpers import SurfaceCache
+
+
+class TestAssetLoader(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a loader with two threads.
+        """
+        self.loader = AssetLoader(max_workers=2)
+
+    def tearDown(self) -> None:
+        self.loader.shutdown()
+
+    def test_wait_reports_progress(self) -> None:
+        """
+        Verifies that waiting reports the progress of every task until the awaited ones are done.
+        """
+        release = threading.Event()
+        self.loader.submit("fast", lambda: 1)
+        self.loader.submit("slow", release.wait)
+
+        reports: list[float] = []
+        self.loader.wait(["fast"], reports.append, interval=0.001)
+        self.assertTrue(self.loader.done("fast"))
+        self.assertFalse(self.loader.done("slow"))
+        self.assertEqual(reports[-1], 0.5)
+
+        release.set()
+        self.loader.wait(["slow"])
+        self.assertEqual(self.loader.progress, 1.0)
+        self.assertEqual(self.loader.result("fast"), 1)
+
+    def test_task_runs_in_background(self) -> None:
+        """
+        Verifies that tasks do not run on the main thread.
+        """
+        self.loader.submit("thread", threading.current_thread)
+        self.assertIsNot(self.loader.result("thread"), threading.current_thread())
+
+    def test_result_raises_task_error(self) -> None:
+        """
+        Verifies that the error raised by a task is raised by result.
+        """
+        def fail() -> None:
+            raise pygame.error("cannot decode")
+
+        self.loader.submit("broken", fail)
+        self.loader.wait(["broken"])
+        with self.assertRaises(pygame.error):
+            self.loader.result("broken")
+
+    def test_no_tasks(self) -> None:
+        """
+        Verifies that a loader without tasks reports a complete progress.
+        """
+        self.assertEqual(self.loader.progress, 1.0)
+
+
+class TestAssetsLoader(unittest.TestCase):
+
+    def setUp(self) -> None:
+        pygame.init()
+        pygame.display.set_mode((32, 32))
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_fonts_read_once(self) -> None:
+        """
+        Verifies that both Symbola fonts are built from a single read of the font file.
+        """
+        with patch("src.assets_loader.read_font_data", wraps=read_font_data) as mock_read:
+            emoji_font, _, font_xl = load_fonts()
+            self.assertEqual(mock_read.call_count, 1)
+        self.assertLess(emoji_font.get_height(), font_xl.get_height())
+        self.assertTrue(font_xl.get_bold())
+
+    def test_images_are_installed(self) -> None:
+        """
+        Verifies that the images decoded on the loader are stored in the SurfaceCache.
+        """
+        loader = AssetLoader()
+        try:
+            names = submit_images(loader)
+            bg_image, hero_image, coin_image = install_images(loader, names)
+        finally:
+            loader.shutdown()
+
+        self.assertGreater(SurfaceCache.size(), 3)
+        self.assertEqual(bg_image.get_size(), (256, 256))
+        self.assertIsInstance(hero_image, pygame.Surface)
+        self.assertIsInstance(coin_image, pygame.Surface)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+from unittest.mock import MagicMock
+
+import pygame
+
+from src.background import ScrollingBackground
+
+
+def make_tile(size: tuple[int, int]) -> pygame.Surface:
+    """Builds a tile with a different color on every row so scrolling is visible."""
+    tile = pygame.Surface(size)
+    for y in range(size[1]):
+        pygame.draw.line(tile, (y * 7 % 256, y * 13 % 256, 100), (0, y), (size[0] - 1, y))
+    return tile
+
+
+def draw_tiles(surface: pygame.Surface, tile: pygame.Surface, bg_y: int) -> None:
+    """Draws the background the way the game loop did before the strip was introduced."""
+    for x in range(0, surface.get_width(), tile.get_width()):
+        for y in range(bg_y, surface.get_height(), tile.get_height()):
+            surface.blit(tile, (x, y))
+
+
+class TestScrollingBackground(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tile = make_tile((30, 20))
+        self.size = (100, 70)
+
+    def test_empty_tile(self) -> None:
+        """
+        Verifies that an empty tile is rejected.
+        """
+        with self.assertRaises(ValueError):
+            ScrollingBackground(pygame.Surface((0, 0)), self.size)
+
+    def test_strip_covers_window_plus_one_tile(self) -> None:
+        """
+        Verifies that the strip is as wide as the window and one tile taller.
+        """
+        background = ScrollingBackground(self.tile, self.size)
+        self.assertEqual(background.strip.get_size(), (100, 90))
+        self.assertEqual(background.y, -20)
+
+    def test_scroll_wraps_like_the_original_loop(self) -> None:
+        """
+        Verifies that the position wraps around every tile height like the old bg_y counter.
+        """
+        background = ScrollingBackground(self.tile, self.size, speed=2)
+        bg_y = -20
+        for _ in range(50):
+            bg_y += 2
+            if bg_y >= 0:
+                bg_y = -20
+            background.scroll()
+            self.assertEqual(background.y, bg_y)
+
+    def test_variable_speed(self) -> None:
+        """
+        Verifies that the scroll distance can be changed at any time.
+        """
+        background = ScrollingBackground(self.tile, self.size, speed=2)
+        background.speed = 5
+        background.scroll()
+        self.assertEqual(background.y, -15)
+        background.scroll(17)
+        self.assertEqual(background.y, -18)
+        background.scroll(-5)
+        self.assertEqual(background.y, -3)
+
+    def test_draw_matches_tiled_drawing(self) -> None:
+        """
+        Verifies that a single blit of the strip gives the same pixels as tiling the image.
+        """
+        background = ScrollingBackground(self.tile, self.size, speed=3)
+        for _ in range(10):
+            expected = pygame.Surface(self.size)
+            draw_tiles(expected, self.tile, int(background.y))
+            result = pygame.Surface(self.size)
+            background.draw(result)
+            self.assertEqual(pygame.image.tobytes(result, "RGB"), pygame.image.tobytes(expected, "RGB"))
+            background.scroll()
+
+    def test_draw_is_a_single_blit(self) -> None:
+        """
+        Verifies that drawing a frame costs a single blit.
+        """
+        background = ScrollingBackground(self.tile, self.size)
+        surface = MagicMock()
+        background.draw(surface)
+        surface.blit.assert_called_once()
+
+    def test_draw_interpolates_across_the_wrap(self) -> None:
+        """
+        Verifies that a frame between two ticks is drawn between their positions, even when the strip wrapped.
+        """
+        background = ScrollingBackground(self.tile, self.size, speed=4)
+        background.y = -2
+        background.save_position()
+        background.scroll()
+        self.assertEqual(background.y, -18)
+
+        surface = MagicMock()
+        background.draw(surface, 0.5)
+        self.assertEqual(surface.blit.call_args[0][2].y, 20)
+        background.draw(surface, 0.0)
+        self.assertEqual(surface.blit.call_args[0][2].y, 2)
+        background.draw(surface)
+        self.assertEqual(surface.blit.call_args[0][2].y, 18)
+
+    def test_draw_reports_the_changed_bands(self) -> None:
+        """
+        Verifies that a frame reports the whole background first, then exactly the rows whose pixels changed.
+        """
+        tile = pygame.Surface((30, 20))
+        tile.fill((40, 40, 40))
+        tile.fill((200, 0, 0), pygame.Rect(0, 5, 30, 2))
+        background = ScrollingBackground(tile, self.size, speed=3)
+        before = pygame.Surface(self.size)
+        self.assertEqual(background.draw(before), [pygame.Rect((0, 0), self.size)])
+        self.assertEqual(background.draw(pygame.Surface(self.size)), [])
+
+        background.save_position()
+        background.scroll()
+        after = pygame.Surface(self.size)
+        bands = background.draw(after)
+        self.assertTrue(bands)
+        for y in range(self.size[1]):
+            changed = pygame.image.tobytes(before.subsurface((0, y, 100, 1)), "RGB") != \
+                pygame.image.tobytes(after.subsurface((0, y, 100, 1)), "RGB")
+            self.assertEqual(changed, any(band.top <= y < band.bottom for band in bands), f"row {y}")
+        self.assertLess(sum(band.height for band in bands), self.size[1])
+
+    def test_resize(self) -> None:
+        """
+        Verifies that the strip is composed again for a new window size.
+        """
+        background = ScrollingBackground(self.tile, self.size)
+        background.resize((45, 33))
+        self.assertEqual(background.strip.get_size(), (45, 53))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()  # pragma: no cover
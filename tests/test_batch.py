@@ -0,0 +1,153 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+# the batch runs play the modules imported by the world itself, not their src package copies
+import constants
+import world
+from inputs import INPUT_LEFT, IDLE, LEFT, RandomInput, RecordedInput, ScriptedInput
+from src.batch import SweepStats, make_input, overridden, parameter_sets, parse_overrides, run_one, sweep
+from src.constants import SIM_RATE
+from src.replay import Replay
+
+
+class TestOverrides(unittest.TestCase):
+
+    def test_parse_overrides(self) -> None:
+        """
+        Verifies that swept values get the type of the constant they override.
+        """
+        grid = parse_overrides(["max_monsters=3,5", "COIN_SPAWN_PROBABILITY=0.1"])
+        self.assertEqual(grid, {"MAX_MONSTERS": [3, 5], "COIN_SPAWN_PROBABILITY": [0.1]})
+        self.assertIsInstance(grid["MAX_MONSTERS"][0], int)
+
+    def test_invalid_overrides(self) -> None:
+        """
+        Verifies that unknown constants, malformed and negative values raise a ValueError.
+        """
+        for value in ("WINDOW_WIDTH=10", "MAX_MONSTERS=a", "MAX_MONSTERS=2.5", "HERO_SPEED=-1"):
+            with self.assertRaises(ValueError):
+                parse_overrides([value])
+
+    def test_parameter_sets(self) -> None:
+        """
+        Verifies that every combination of the swept values is played, and the defaults when nothing is swept.
+        """
+        sets = parameter_sets({"MAX_MONSTERS": [3, 5], "MAX_COINS": [1, 2]})
+        self.assertEqual(len(sets), 4)
+        self.assertIn({"MAX_MONSTERS": 5, "MAX_COINS": 1}, sets)
+        self.assertEqual(parameter_sets({}), [{}])
+
+    def test_overridden_restores_the_constants(self) -> None:
+        """
+        Verifies that the constants read by the game are overridden in the block only.
+        """
+        default = world.MAX_MONSTERS
+        with overridden({"MAX_MONSTERS": default + 7}):
+            self.assertEqual(world.MAX_MONSTERS, default + 7)
+            self.assertEqual(constants.MAX_MONSTERS, default + 7)
+        self.assertEqual((world.MAX_MONSTERS, constants.MAX_MONSTERS), (default, default))
+
+        with self.assertRaises(ValueError):
+            with overridden({"SIM_RATE": 10}):
+                pass  # pragma: no cover
+
+
+class TestInputs(unittest.TestCase):
+
+    def test_make_input(self) -> None:
+        """
+        Verifies that every input spec gives its provider, and that an unknown one raises a ValueError.
+        """
+        self.assertEqual(make_input("idle", 0)(0), IDLE)
+        self.assertEqual([make_input("random", 4)(frame) for frame in range(50)],
+                         [RandomInput(4)(frame) for frame in range(50)])
+
+        with tempfile.TemporaryDirectory() as folder:
+            script = os.path.join(folder, "moves.txt")
+            with open(script, "w") as script_file:
+                script_file.write("3 left\n")
+            self.assertIsInstance(make_input(f"script:{script}", 0), ScriptedInput)
+
+            recording = Replay(1)
+            recording.record(INPUT_LEFT, 0)
+            path = os.path.join(folder, "session.rep")
+            recording.save(path)
+            keys = make_input(f"replay:{path}", 0)
+            self.assertIsInstance(keys, RecordedInput)
+            self.assertEqual((keys(0), keys(1)), (LEFT, IDLE))
+
+        for spec in ("bot", "script:", "replay"):
+            with self.assertRaises(ValueError):
+                make_input(spec, 0)
+
+
+class TestSweepStats(unittest.TestCase):
+
+    def test_summary(self) -> None:
+        """
+        Verifies the survival time, hits per minute and score distribution of a parameter set.
+        """
+        stats = SweepStats({"MAX_MONSTERS": 3})
+        for seed, (ticks, score, hits) in enumerate([(SIM_RATE * 60, 10, 2), (SIM_RATE * 30, 30, 1)]):
+            stats.add((0, seed, ticks, score, 0, 0, hits, True))
+
+        summary = stats.summary()
+        self.assertEqual(summary["runs"], 2)
+        self.assertAlmostEqual(summary["survival_s"], 45)
+        self.assertAlmostEqual(summary["hits_per_minute"], 2)
+        self.assertEqual(summary["game_over_rate"], 1)
+        self.assertEqual((summary["score_mean"], summary["score_median"]), (20, 20))
+        self.assertEqual((summary["score_min"], summary["score_max"]), (10, 30))
+        self.assertEqual(SweepStats({}).summary(), {"runs": 0})
+
+
+class TestRuns(unittest.TestCase):
+
+    def setUp(self) -> None:
+        patcher = patch("pygame.mixer")
+        mock_mixer = patcher.start()
+        mock_mixer.get_init.return_value = None
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_run_one_is_reproducible_and_uses_the_overrides(self) -> None:
+        """
+        Verifies that a run is the same for the same seed, and that overriding the monsters changes it.
+        """
+        first = run_one((0, {}, 5, "random", 300))
+        self.assertEqual(first, run_one((0, {}, 5, "random", 300)))
+        self.assertEqual(first[:3], (0, 5, 300))
+
+        without_monsters = run_one((1, {"MAX_MONSTERS": 0}, 5, "random", 2000))
+        self.assertEqual(without_monsters[0], 1)
+        self.assertEqual(without_monsters[2], 2000)
+        self.assertEqual(without_monsters[6], 0)
+        self.assertFalse(without_monsters[7])
+        self.assertEqual(world.MAX_MONSTERS, constants.MAX_MONSTERS)
+
+    def test_sweep_aggregates_every_parameter_set(self) -> None:
+        """
+        Verifies that a sweep plays the same seeds for every parameter set in worker processes,
+        with the results of the runs played in this process.
+        """
+        results = []
+        stats = sweep({"MAX_MONSTERS": [0, 5]}, 2, base_seed=3, max_ticks=150, workers=2, on_result=results.append)
+        self.assertEqual([entry.overrides for entry in stats], [{"MAX_MONSTERS": 0}, {"MAX_MONSTERS": 5}])
+        self.assertEqual([entry.runs for entry in stats], [2, 2])
+        self.assertEqual(sorted(results), sorted(
+            run_one((index, {"MAX_MONSTERS": monsters}, seed, "random", 150))
+            for index, monsters in enumerate((0, 5)) for seed in (3, 4)
+        ))
+
+        with self.assertRaises(ValueError):
+            sweep({}, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
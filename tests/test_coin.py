@@ -1,3 +1,4 @@
+import random
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -150,6 +151,45 @@ class TestCoinInit(unittest.TestCase):
         coin = Coin(image_path, x, y, speed, window_height)
         self.assertEqual(coin.value, 1)
 
+    @patch("pygame.image.load", return_value=MagicMock())
+    def test_random_value_from_given_generator(self, _) -> None:
+        """
+        Verifies that the value is drawn from the given random generator, leaving the random module untouched.
+        """
+        random.seed(5)
+        state = random.getstate()
+        values = [Coin("path/to/image.png", 10, 20, 5, 800, random.Random(9)).value for _ in range(2)]
+        self.assertEqual(values[0], values[1])
+        self.assertEqual(values[0], Coin.random_value(random.Random(9)))
+        self.assertEqual(random.getstate(), state)
+
+
+class TestCoinReset(unittest.TestCase):
+    @patch("pygame.image.load", return_value=pygame.Surface((64, 64)))
+    def test_reset_draws_like_a_new_coin(self, _) -> None:
+        """
+        Verifies that a reset coin gets the position and value a new coin would get from the same generator.
+        """
+        new = Coin("path/to/coin.png", 30, 40, 6, 700, random.Random(4))
+        coin = Coin("path/to/coin.png", 10, 20, 5, 800, random.Random(5))
+        coin.update()
+        coin.save_position()
+        coin.reset("path/to/coin.png", 30, 40, 6, 700, random.Random(4))
+
+        self.assertEqual((coin.rect, coin.speed, coin.window_height), (new.rect, new.speed, new.window_height))
+        self.assertEqual(coin.value, new.value)
+        self.assertIs(coin.image, new.image)
+        self.assertIsNone(coin.previous_position)
+
+    @patch("pygame.image.load", return_value=pygame.Surface((64, 64)))
+    def test_reset_validates_like_init(self, _) -> None:
+        """
+        Verifies that resetting a coin with a negative coordinate raises a ValueError.
+        """
+        coin = Coin("path/to/coin.png", 10, 20, 5, 800)
+        with self.assertRaises(ValueError):
+            coin.reset("path/to/coin.png", -1, 20, 5, 800)
+
 
 class TestCoinUpdate(unittest.TestCase):
     @patch("pygame.image.load", return_value=MagicMock())
@@ -198,5 +238,56 @@ class TestCoinUpdate(unittest.TestCase):
         coin.kill.assert_not_called()
 
 
+class TestCoinLabel(unittest.TestCase):
+    def setUp(self) -> None:
+        """Initialize pygame so the label font can be created."""
+        pygame.init()
+
+    def tearDown(self) -> None:
+        """Quit pygame after each test."""
+        pygame.quit()
+
+    @patch("random.choices", return_value=[3])
+    @patch("pygame.image.load")
+    def test_label_is_baked_into_image(self, mock_image_load, _) -> None:
+        """
+        Verifies that the value of the coin is rendered into a copy of its image.
+
+        The shared base image is left untouched and the coin image has dark label pixels in its center.
+        """
+        base = pygame.Surface((64, 64))
+        base.fill((255, 255, 255))
+        mock_image_load.return_value = base
+        coin = Coin("path/to/coin.png", 10, 20, 5, 800)
+
+        self.assertIsNot(coin.image, base)
+        self.assertEqual(coin.image.get_size(), base.get_size())
+        self.assertEqual(base.get_at((32, 32)), pygame.Color(255, 255, 255))
+        label_pixels = [
+            coin.image.get_at((x, y)) for x in range(24, 40) for y in range(24, 40)
+        ]
+        self.assertTrue(any(pixel.r < 128 for pixel in label_pixels))
+
+    @patch("random.choices", return_value=[2])
+    @patch("pygame.image.load", return_value=pygame.Surface((64, 64)))
+    def test_labelled_image_is_shared(self, mock_image_load, _) -> None:
+        """
+        Verifies that coins with the same image and value share one labelled image and that
+        the label is rendered only once.
+        """
+        with patch.object(Coin, "get_label_font", wraps=Coin.get_label_font) as mock_font:
+            first = Coin("path/to/coin.png", 10, 20, 5, 800)
+            second = Coin("path/to/coin.png", 30, 20, 5, 800)
+            self.assertEqual(mock_font.call_count, 1)
+        self.assertIs(first.image, second.image)
+        mock_image_load.assert_called_once()
+
+    def test_label_font_is_shared(self) -> None:
+        """
+        Verifies that every coin uses the same small font for its label.
+        """
+        self.assertIs(Coin.get_label_font(), Coin.get_label_font())
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()  # pragma: no cover
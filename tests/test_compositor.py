@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.compositor import FrameCompositor, Layer
+from src.profiler import FrameProfiler
+
+
+class TestFrameCompositor(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a compositor drawing on an offscreen surface.
+        """
+        pygame.init()
+        self.screen = pygame.Surface((100, 50))
+        self.profiler = FrameProfiler()
+        self.compositor = FrameCompositor(self.screen, profiler=self.profiler)
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_draw_calls_run_in_layer_order(self) -> None:
+        """
+        Verifies that draw calls run by layer, then in submission order, and only once.
+        """
+        calls: list[str] = []
+        self.compositor.submit(Layer.HUD, lambda surface: calls.append("hud"))
+        self.compositor.submit(Layer.BACKGROUND, lambda surface: calls.append("background"))
+        self.compositor.submit(Layer.SPRITES, lambda surface: calls.append("monsters"))
+        self.compositor.submit(Layer.SPRITES, lambda surface: calls.append("coins"))
+
+        self.compositor.compose()
+        self.assertEqual(calls, ["background", "monsters", "coins", "hud"])
+
+        self.compositor.compose()
+        self.assertEqual(len(calls), 4)
+
+    def test_overlays_stay_until_removed(self) -> None:
+        """
+        Verifies that an overlay is drawn on every frame, above the frame draw calls, until it is removed.
+        """
+        calls: list[str] = []
+        self.compositor.add_overlay("game_over", lambda surface: calls.append("game_over"))
+        self.assertTrue(self.compositor.has_overlay("game_over"))
+
+        for _ in range(2):
+            self.compositor.submit(Layer.HUD, lambda surface: calls.append("hud"))
+            self.compositor.compose()
+        self.assertEqual(calls, ["hud", "game_over", "hud", "game_over"])
+
+        self.compositor.remove_overlay("game_over")
+        self.compositor.remove_overlay("game_over")
+        self.assertFalse(self.compositor.has_overlay("game_over"))
+        self.compositor.compose()
+        self.assertEqual(len(calls), 4)
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_full_flip_mode(self, mock_flip, mock_update) -> None:
+        """
+        Verifies that the whole window is flipped once per frame when dirty-rect mode is off.
+        """
+        self.compositor.submit(Layer.SPRITES, lambda surface: pygame.Rect(0, 0, 10, 10))
+        self.compositor.submit(Layer.HUD, lambda surface: [pygame.Rect(0, 0, 5, 5)])
+        self.assertEqual(self.compositor.present(), 100 * 50)
+
+        mock_flip.assert_called_once()
+        mock_update.assert_not_called()
+        self.assertEqual(self.compositor.presents, 1)
+        self.assertEqual(self.profiler.last("dirty_area"), 100 * 50)
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_dirty_rect_mode(self, mock_flip, mock_update) -> None:
+        """
+        Verifies that only the areas returned by the draw calls are presented in dirty-rect mode.
+        """
+        self.compositor.dirty_rects = True
+        self.compositor.present()
+        mock_flip.assert_called_once()
+
+        self.compositor.submit(Layer.SPRITES, lambda surface: [pygame.Rect(0, 0, 10, 10)])
+        self.compositor.submit(Layer.HUD, lambda surface: pygame.Rect(-5, 0, 10, 4))
+        self.compositor.submit(Layer.HALOS, lambda surface: None)
+        self.compositor.present()
+        mock_update.assert_called_once()
+        self.assertEqual(self.profiler.last("dirty_area"), 120)
+
+        mock_update.reset_mock()
+        self.compositor.present()
+        mock_update.assert_not_called()
+        self.assertEqual(self.profiler.last("dirty_area"), 0)
+
+        self.compositor.invalidate()
+        self.compositor.present()
+        self.assertEqual(mock_flip.call_count, 2)
+
+    @patch("pygame.time.get_ticks")
+    @patch("pygame.display.flip")
+    def test_presents_per_second(self, mock_flip, mock_ticks) -> None:
+        """
+        Verifies that the presents of the last full second are counted.
+        """
+        mock_ticks.return_value = 0
+        compositor = FrameCompositor(self.screen)
+        for ticks in range(0, 1000, 100):
+            mock_ticks.return_value = ticks
+            compositor.present()
+        self.assertEqual(compositor.presents_per_second, 0)
+
+        mock_ticks.return_value = 1000
+        compositor.present()
+        self.assertEqual(compositor.presents_per_second, 11)
+        self.assertEqual(compositor.presents, 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.effects import HaloAnimation
+
+
+class TestHaloAnimation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Builds a small hero-like image before each test.
+        """
+        self.image = pygame.Surface((20, 30), pygame.SRCALPHA)
+        pygame.draw.rect(self.image, (255, 255, 255, 255), pygame.Rect(5, 5, 10, 20))
+        self.halo = HaloAnimation(frame_count=4, frame_duration=40)
+
+    def test_invalid_arguments(self) -> None:
+        """
+        Verifies that HaloAnimation rejects non-positive frame counts and durations.
+        """
+        with self.assertRaises(ValueError):
+            HaloAnimation(frame_count=0)
+        with self.assertRaises(ValueError):
+            HaloAnimation(frame_duration=0)
+
+    def test_prepare_bakes_frames(self) -> None:
+        """
+        Verifies that prepare bakes one red and one golden halo per frame, sized around the hero.
+        """
+        self.assertTrue(self.halo.prepare(self.image, (20, 30)))
+        self.assertEqual(len(self.halo.frames), 4)
+        halo_red, halo_golden = self.halo.frames[0]
+        self.assertEqual(halo_red.get_size(), (45, 65))
+        self.assertEqual(halo_golden.get_size(), (35, 55))
+        self.assertEqual(self.halo.silhouette.get_size(), (20, 30))
+
+    def test_prepare_reuses_frames(self) -> None:
+        """
+        Verifies that the frames are not baked again for the same image and size.
+        """
+        self.halo.prepare(self.image, (20, 30))
+        with patch("src.effects.apply_flame_ripple") as mock_ripple:
+            self.assertFalse(self.halo.prepare(self.image, (20, 30)))
+            mock_ripple.assert_not_called()
+
+    def test_prepare_invalidates_on_new_image_or_size(self) -> None:
+        """
+        Verifies that the frames are baked again when the hero image or size changes.
+        """
+        self.halo.prepare(self.image, (20, 30))
+        self.assertTrue(self.halo.prepare(self.image.copy(), (20, 30)))
+        self.assertTrue(self.halo.prepare(self.halo.image, (22, 30)))
+        self.assertEqual(self.halo.frames[0][0].get_size(), (47, 65))
+
+    def test_frame_selection_cycles_with_ticks(self) -> None:
+        """
+        Verifies that frames are selected by time and wrap around the ring.
+        """
+        self.halo.prepare(self.image, (20, 30))
+        self.assertIs(self.halo.frame(0), self.halo.frames[0])
+        self.assertIs(self.halo.frame(85), self.halo.frames[2])
+        self.assertIs(self.halo.frame(160), self.halo.frames[0])
+
+    def test_draw_blits_silhouette_and_halo(self) -> None:
+        """
+        Verifies that draw only blits the silhouette during the first half of every second
+        and the two halos plus the silhouette during the second half.
+        """
+        screen = MagicMock()
+        rect = pygame.Rect(100, 100, 20, 30)
+        self.halo.draw(screen, self.image, rect, 100)
+        self.assertEqual(screen.blit.call_count, 1)
+
+        screen.reset_mock()
+        self.halo.draw(screen, self.image, rect, 600)
+        self.assertEqual(screen.blit.call_count, 3)
+
+    def test_draw_returns_the_halo_area(self) -> None:
+        """
+        Verifies that draw returns the area of the halo even while only the silhouette is shown.
+        """
+        rect = pygame.Rect(100, 100, 20, 30)
+        area = self.halo.draw(MagicMock(), self.image, rect, 100)
+        self.assertEqual(area, self.halo.draw(MagicMock(), self.image, rect, 600))
+        self.assertEqual(area.center, rect.center)
+        self.assertTrue(area.contains(rect))
+        self.assertEqual(area.size, self.halo.frame(0)[0].get_size())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,178 @@
+import unittest
+
+import pygame
+
+from src.entitystore import ArrayGroup, EntityStore
+
+
+class Box(pygame.sprite.Sprite):
+    """A sprite with a rect, a speed and a value, and no image."""
+
+    def __init__(self, x: int, y: int, size: int = 20, speed: int = 0, value: int = 0) -> None:
+        super().__init__()
+        self.rect = pygame.Rect(x, y, size, size)
+        self.speed = speed
+        self.value = value
+        self.previous_position = None
+
+    def save_position(self) -> None:
+        self.previous_position = self.rect.topleft
+
+
+@unittest.skipUnless(EntityStore.available(), "NumPy is not installed")
+class TestEntityStore(unittest.TestCase):
+
+    def test_add_copies_the_sprite_into_the_columns(self) -> None:
+        """
+        Verifies that adding a sprite fills its slot from its rect and attributes.
+        """
+        store = EntityStore(500)
+        box = Box(10, 20, 30, speed=4, value=7)
+        slot = store.add(box, 2)
+
+        self.assertIn(box, store)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(
+            (store.x[slot], store.y[slot], store.w[slot], store.h[slot], store.speed[slot], store.kind[slot],
+             store.value[slot], store.damage[slot]),
+            (10, 20, 30, 30, 4, 2, 7, 0),
+        )
+        self.assertTrue(store.alive[slot])
+
+    def test_removed_slots_are_reused(self) -> None:
+        """
+        Verifies that a removed sprite frees its slot for the next one, and that the store grows when full.
+        """
+        store = EntityStore(500, capacity=2)
+        first, second, third = Box(0, 0), Box(30, 0), Box(60, 0)
+        store.add(first)
+        slot = store.add(second)
+        store.remove(second)
+        self.assertNotIn(second, store)
+        self.assertEqual(store.add(third), slot)
+
+        store.add(second)
+        self.assertEqual(store.capacity, 4)
+        self.assertEqual(store.count, 3)
+        self.assertEqual(store.x[store.count - 1], 30)
+
+    def test_step_moves_and_culls_without_touching_the_rects(self) -> None:
+        """
+        Verifies that a step moves every entity by its speed, returns the ones below the window,
+        and only writes the rects back on sync.
+        """
+        store = EntityStore(100)
+        slow, fast = Box(0, 50, speed=10), Box(30, 90, speed=20)
+        store.add(slow)
+        store.add(fast)
+
+        self.assertEqual(store.step(), [fast])
+        self.assertEqual((slow.rect.y, fast.rect.y), (50, 90))
+        store.sync()
+        self.assertEqual((slow.rect.y, fast.rect.y), (60, 110))
+
+    def test_removed_entities_do_not_move(self) -> None:
+        """
+        Verifies that a removed entity is neither moved nor culled.
+        """
+        store = EntityStore(100)
+        box = Box(0, 95, speed=10)
+        slot = store.add(box)
+        store.remove(box)
+        self.assertEqual(store.step(), [])
+        self.assertEqual(store.y[slot], 95)
+
+    def test_positions_interpolate_in_insertion_order(self) -> None:
+        """
+        Verifies that the drawn positions lie between the previous and current ones, in the order
+        the sprites were added, whatever their slots.
+        """
+        store = EntityStore(500)
+        first, second, third = Box(0, 0, speed=10), Box(30, 0, speed=10), Box(60, 0, speed=4)
+        store.add(first)
+        store.add(second)
+        store.remove(first)
+        store.add(third)
+        store.add(first)
+        store.step()
+
+        self.assertEqual(store.positions(0.5), [(second, (30, 5)), (third, (60, 2)), (first, (0, 5))])
+        store.settle()
+        self.assertEqual(store.positions(0.5)[0], (second, (30, 10)))
+
+    def test_overlapping_matches_colliderect(self) -> None:
+        """
+        Verifies that the vectorized overlap test agrees with pygame.Rect.colliderect, edges and empty rects included.
+        """
+        store = EntityStore(500)
+        boxes = [Box(x, y) for x in range(0, 100, 15) for y in range(0, 100, 15)] + [Box(40, 40, 0)]
+        for box in boxes:
+            store.add(box)
+
+        for rect in (pygame.Rect(20, 20, 30, 30), pygame.Rect(0, 0, 1, 1), pygame.Rect(40, 40, 20, 0),
+                     pygame.Rect(95, 95, 50, 50), pygame.Rect(-10, 30, 10, 10)):
+            expected = [box for box in boxes if rect.colliderect(box.rect)]
+            self.assertEqual(store.overlapping(rect), expected)
+            self.assertEqual(store.any_overlap(rect), bool(expected))
+
+    def test_queries_are_limited_to_a_kind(self) -> None:
+        """
+        Verifies that a kind only finds its own entities.
+        """
+        store = EntityStore(500)
+        coin, monster = Box(0, 0), Box(0, 0)
+        store.add(coin, 0)
+        store.add(monster, 1)
+        rect = pygame.Rect(5, 5, 5, 5)
+        self.assertEqual(store.overlapping(rect, 1), [monster])
+        self.assertEqual(store.overlapping(rect), [coin, monster])
+        self.assertFalse(store.any_overlap(rect, 2))
+
+    def test_capacity_must_be_positive(self) -> None:
+        """
+        Verifies that a store cannot be created without slots.
+        """
+        with self.assertRaises(ValueError):
+            EntityStore(500, capacity=0)
+
+
+@unittest.skipUnless(EntityStore.available(), "NumPy is not installed")
+class TestArrayGroup(unittest.TestCase):
+
+    def test_groups_keep_the_store_in_sync(self) -> None:
+        """
+        Verifies that joining, leaving or being killed in a group adds or removes the entity.
+        """
+        store = EntityStore(500)
+        coins, monsters = store.group(), store.group()
+        self.assertIsInstance(coins, ArrayGroup)
+        self.assertNotEqual(coins.kind, monsters.kind)
+
+        coin, monster = Box(0, 0), Box(0, 0)
+        coins.add(coin)
+        monsters.add(monster)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(coins.collide(pygame.Rect(0, 0, 5, 5)), [coin])
+        self.assertTrue(monsters.collideany(pygame.Rect(0, 0, 5, 5)))
+
+        monster.kill()
+        self.assertNotIn(monster, store)
+        self.assertFalse(monsters.collideany(pygame.Rect(0, 0, 5, 5)))
+        coins.empty()
+        self.assertEqual(len(store), 0)
+
+    def test_update_leaves_the_moves_to_the_store(self) -> None:
+        """
+        Verifies that updating the group does not move its sprites twice.
+        """
+        store = EntityStore(500)
+        box = Box(0, 0, speed=5)
+        group = store.group(box)
+        group.update()
+        store.step()
+        store.sync()
+        self.assertEqual(box.rect.y, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
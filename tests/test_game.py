@@ -1,9 +1,13 @@
+import io
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import patch, MagicMock
 
 import pygame
 
+from src.entitystore import EntityStore
 from src.game import Game
+from src.inputs import COMMAND_PAUSE
 
 
 class TestGame(unittest.TestCase):
@@ -19,6 +23,8 @@ class TestGame(unittest.TestCase):
         # Configure mixer mock
         mock_mixer.init.return_value = None
         mock_mixer.Sound.return_value = MagicMock()
+        mock_mixer.get_init.return_value = (44100, -16, 2)
+        mock_mixer.get_num_channels.return_value = 8
 
         # Configure music mock
         mock_music.load.return_value = None
@@ -42,29 +48,193 @@ class TestGame(unittest.TestCase):
 
     def test_hero_exists(self):
         """Test if hero is created and initialized correctly"""
-        self.assertIsNotNone(self.game.hero)
-        self.assertTrue(hasattr(self.game.hero, "rect"))
-        self.assertTrue(hasattr(self.game.hero, "speed"))
+        self.assertIsNotNone(self.game.world.hero)
+        self.assertTrue(hasattr(self.game.world.hero, "rect"))
+        self.assertTrue(hasattr(self.game.world.hero, "speed"))
 
     def test_game_reset(self):
         """Test if game reset works correctly"""
         # Set some initial values
-        self.game.score = 100
-        self.game.game_over = True
-        self.game.level = 5
-        self.game.collected_coins = 10
-        self.game.collected_jewels = 3
+        self.game.world.score = 100
+        self.game.world.game_over = True
+        self.game.world.level = 5
+        self.game.world.collected_coins = 10
+        self.game.world.collected_jewels = 3
 
         # Reset the game
         self.game.reset_game()
 
         # Check if values are reset
-        self.assertEqual(self.game.score, 0)
-        self.assertFalse(self.game.game_over)
-        self.assertEqual(self.game.level, 1)
-        self.assertEqual(self.game.collected_coins, 0)
-        self.assertEqual(self.game.collected_jewels, 0)
-        self.assertIsNotNone(self.game.hero)
+        self.assertEqual(self.game.world.score, 0)
+        self.assertFalse(self.game.world.game_over)
+        self.assertEqual(self.game.world.level, 1)
+        self.assertEqual(self.game.world.collected_coins, 0)
+        self.assertEqual(self.game.world.collected_jewels, 0)
+        self.assertIsNotNone(self.game.world.hero)
+
+    def test_display_hud_renders_changed_lines_only(self):
+        """Test if the HUD only renders again the lines whose value changed"""
+        self.game.display_hud(self.game.screen)
+        misses = self.game.hud.text_cache.misses
+        self.assertEqual(misses, 5)
+
+        self.game.display_hud(self.game.screen)
+        self.assertEqual(self.game.hud.text_cache.misses, misses)
+
+        self.game.world.score = 42
+        self.game.display_hud(self.game.screen)
+        self.assertEqual(self.game.hud.text_cache.misses, misses + 1)
+
+    @patch("pygame.display.flip")
+    def test_game_over_overlay(self, mock_flip):
+        """Test if the game over screen is an overlay shown until the game is reset"""
+        self.game.world.hero.life_points = 1
+        monster = MagicMock(damage=5)
+        self.game.world.handle_monster_collision([monster], self.game.world.hero.collision_cooldown + 1)
+        self.game.play_events()
+
+        self.assertTrue(self.game.world.game_over)
+        self.assertTrue(self.game.compositor.has_overlay("game_over"))
+        self.game.compositor.present()
+        mock_flip.assert_called_once()
+
+        self.game.reset_game()
+        self.assertFalse(self.game.compositor.has_overlay("game_over"))
+
+    @patch("pygame.display.flip")
+    def test_halo_is_drawn_once_when_the_game_ends(self, mock_flip):
+        """Test if the halo of the hero hit on the last tick is only drawn by the game over overlay"""
+        self.game.world.hero.life_points = 1
+        self.game.world.handle_monster_collision([MagicMock(damage=5)], self.game.world.hero.collision_cooldown + 1)
+        self.game.play_events()
+        self.assertTrue(self.game.world.hero_is_blinking and self.game.world.game_over)
+
+        with patch.object(self.game.halo_animation, "draw", return_value=pygame.Rect(0, 0, 1, 1)) as mock_draw:
+            self.game.draw()
+            self.game.compositor.present()
+        mock_draw.assert_called_once()
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_blink_hero_does_not_present(self, mock_flip, mock_update):
+        """Test if blinking the hero only submits a draw call to the frame"""
+        self.game.blink_hero()
+        mock_flip.assert_not_called()
+        mock_update.assert_not_called()
+
+        self.game.compositor.present(True)
+        mock_flip.assert_called_once()
+
+    def test_sound_load_failure(self):
+        """Test if a sound that cannot be loaded leaves the game running without it"""
+        def fail():
+            raise pygame.error("cannot decode")
+
+        self.game.loader.submit("sound:broken.mp3", fail)
+        self.game._sound_tasks = {"HIT": "sound:broken.mp3"}
+        self.game.HIT = None
+        self.game.loader.wait(["sound:broken.mp3"])
+
+        with redirect_stdout(io.StringIO()) as output:
+            self.game.collect_sounds()
+        self.assertEqual(output.getvalue(), "")
+        self.assertIsNone(self.game.HIT)
+        self.assertEqual(self.game._sound_tasks, {})
+
+        self.game.world.hero.life_points = 10
+        self.game.world.handle_monster_collision([MagicMock(damage=1)], self.game.world.hero.collision_cooldown + 1)
+        self.game.play_events()
+        self.assertEqual(self.game.world.hero.life_points, 9)
+
+    def test_collection_volume_is_set_per_voice(self):
+        """Test if collected items play on a pooled channel without changing the shared sound volume"""
+        coin = MagicMock(value=5)
+        sound = MagicMock()
+        self.game.COIN_SOUND = sound
+        with patch.object(self.game.world.coins, "collide", return_value=[coin]), \
+                patch.object(self.game.voices, "play") as mock_play:
+            self.game.world.handle_collection(self.game.world.coins, "collected_coins", "coin")
+            self.game.play_events()
+
+        mock_play.assert_called_once_with("coin", sound, self.game.volume_curves["coin"].volume(5))
+        sound.set_volume.assert_not_called()
+        self.assertEqual(self.game.world.score, 5)
+        self.assertEqual(self.game.world.collected_coins, 1)
+
+    def test_sprites_are_drawn_between_ticks(self):
+        """Test if the sprites are drawn between their positions before and after the last tick"""
+        hero = self.game.world.hero
+        hero.rect.x = 100
+        self.game.step(0, {pygame.K_LEFT: 0, pygame.K_RIGHT: 1})
+        self.assertEqual(hero.previous_position[0], 100)
+        self.assertEqual(hero.rect.x, 100 + hero.speed)
+
+        self.game.world.timestep.accumulator = self.game.world.timestep.dt / 2
+        surface = MagicMock()
+        self.game.draw_sprites(surface)
+        surface.blit.assert_any_call(hero.image, (round(100 + hero.speed / 2), hero.rect.y))
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_dirty_rects_are_presented_while_playing(self, mock_flip, mock_update):
+        """Test if frames of a running game present their changed areas instead of the whole window"""
+        self.game.compositor.dirty_rects = True
+        self.game.draw()
+        self.game.compositor.present()
+        mock_flip.assert_called_once()
+
+        for tick in range(3):
+            self.game.step(tick * 20, {pygame.K_LEFT: 0, pygame.K_RIGHT: 1})
+            self.game.draw()
+            self.game.compositor.present()
+        mock_flip.assert_called_once()
+        self.assertEqual(mock_update.call_count, 3)
+
+    @unittest.skipUnless(EntityStore.available(), "NumPy is not installed")
+    def test_entity_store_draws_interpolated_positions(self):
+        """Test if the sprites of the entity store are drawn between their positions, after the hero"""
+        self.game.reset_game()
+        game = Game(splash=False, entity_store=True)
+        world = game.world
+        coin = world.create_coin()
+        coin.rect.topleft = (200, 100)
+        world.coins.add(coin)
+        world.all_sprites.add(coin)
+        world.store.step()
+        world.timestep.accumulator = world.timestep.dt / 2
+        surface = MagicMock()
+        game.draw_sprites(surface)
+        self.assertEqual(surface.blit.call_args_list[0].args[0], world.hero.image)
+        surface.blit.assert_any_call(coin.image, (200, round(100 + coin.speed / 2)))
+        game.loader.shutdown()
+        game.reset_game()
+
+    @patch("pygame.mixer")
+    def test_pause_command_pauses_the_music(self, mock_mixer):
+        """Test if the game pauses and resumes the music when its world is paused by a command"""
+        mock_mixer.get_init.return_value = (44100, -16, 2)
+        self.assertFalse(self.game.step(0, {pygame.K_LEFT: 0, pygame.K_RIGHT: 0}, COMMAND_PAUSE))
+        self.assertTrue(self.game.world.paused)
+        mock_mixer.music.pause.assert_called_once()
+
+        self.game.step(20, {pygame.K_LEFT: 0, pygame.K_RIGHT: 0}, COMMAND_PAUSE)
+        self.assertFalse(self.game.world.paused)
+        mock_mixer.music.unpause.assert_called_once()
+
+    def test_cosmetic_stream_does_not_change_gameplay(self):
+        """Test if drawing from the cosmetic stream leaves the gameplay stream untouched"""
+        state = self.game.world.gameplay_rng.getstate()
+        self.game.halo_animation.frames = []
+        self.game.halo_animation.image = None
+        self.game.halo_animation.prepare(self.game.hero_image, self.game.world.hero.rect.size)
+        self.assertEqual(self.game.world.gameplay_rng.getstate(), state)
+
+    def test_display_hud_reports_changed_area(self):
+        """Test if the HUD area is reported as dirty only when a value changes"""
+        self.assertEqual(len(self.game.display_hud(self.game.screen)), 1)
+        self.assertEqual(self.game.display_hud(self.game.screen), [])
+        self.game.world.collected_coins = 1
+        self.assertTrue(self.game.display_hud(self.game.screen)[0].contains(self.game.hud.get_rect()))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pygame
+
+from src.headless import simulate
+from src.constants import SIM_RATE
+from src.inputs import RandomInput
+from src.world import World
+
+
+class TestSimulate(unittest.TestCase):
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_ticks_are_simulated(self) -> None:
+        """
+        Verifies that every frame runs one tick of the world timestep.
+        """
+        world = World()
+        stats = simulate(world, SIM_RATE)
+        self.assertEqual(stats["frames"], SIM_RATE)
+        self.assertEqual(world.timestep.time, 1000)
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_run_is_reproducible_and_never_presents(self, mock_flip, mock_update) -> None:
+        """
+        Verifies that two runs with the same seed and input end with the same stats, without presenting.
+        """
+        results = []
+        for _ in range(2):
+            stats = simulate(World(seed=3), 300, RandomInput(3))
+            results.append({name: value for name, value in stats.items() if name != "fps"})
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0]["frames"], 300)
+        self.assertGreater(stats["fps"], 0)
+        mock_flip.assert_not_called()
+        mock_update.assert_not_called()
+
+    def test_run_stops_when_the_game_is_over(self) -> None:
+        """
+        Verifies that the run stops on the frame the game is over.
+        """
+        world = World()
+        world.hero.life_points = 1
+        world.hero.last_collision_time = -world.hero.collision_cooldown - 1
+        monster = MagicMock(damage=1, fade=False)
+        with patch.object(world.monsters, "collide", return_value=[monster]):
+            stats = simulate(world, 100)
+
+        self.assertEqual(stats["frames"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertTrue(stats["game_over"])
+
+    def test_invalid_frames(self) -> None:
+        """
+        Verifies that a run without frames raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            simulate(MagicMock(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -173,6 +173,19 @@ class TestHeroUpdate(unittest.TestCase):
         hero.update()
         self.assertEqual(hero.rect.x, initial_x, "Hero should not have moved")
 
+    @patch("pygame.key.get_pressed")
+    @patch("pygame.image.load", return_value=MagicMock())
+    def test_update_with_given_keys(self, _, mock_get_pressed) -> None:
+        """
+        Tests that Hero's update method moves the hero with the given keys instead of
+        reading the keyboard.
+        """
+        hero = Hero("path/to/image.png", 50, 50, 5, 800)
+        hero.rect = pygame.Rect(50, 50, 50, 50)
+        hero.update({pygame.K_LEFT: 0, pygame.K_RIGHT: 1})
+        self.assertEqual(hero.rect.x, 55)
+        mock_get_pressed.assert_not_called()
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()  # pragma: no cover
@@ -0,0 +1,91 @@
+import unittest
+
+import pygame
+
+from src.hud import Hud
+
+
+class TestHud(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a HUD with two lines using the default pygame font.
+        """
+        pygame.init()
+        self.hud = Hud(pygame.font.Font(None, 24))
+        self.hud.add_line("score", "Score {}", (200, 200, 200))
+        self.hud.add_line("life", "Life {}", (200, 200, 200, 150))
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def test_unknown_line(self) -> None:
+        """
+        Verifies that setting a line that does not exist raises a KeyError.
+        """
+        with self.assertRaises(KeyError):
+            self.hud.set("missing", 1)
+
+    def test_only_changed_lines_are_rendered(self) -> None:
+        """
+        Verifies that a line is only rendered again when its value changes.
+        """
+        self.assertTrue(self.hud.set("score", 0))
+        self.assertTrue(self.hud.set("life", 10))
+        renders = self.hud.renders
+
+        self.assertFalse(self.hud.set("score", 0))
+        self.assertFalse(self.hud.set("life", 10))
+        self.assertEqual(self.hud.renders, renders)
+
+        self.assertTrue(self.hud.set("life", 9))
+        self.assertEqual(self.hud.renders, renders + 1)
+        self.assertEqual(self.hud.text_cache.misses, 3)
+
+    def test_repeated_values_hit_the_text_cache(self) -> None:
+        """
+        Verifies that showing a value seen before reuses the rendered text.
+        """
+        self.hud.set("life", 10)
+        self.hud.set("life", 9)
+        self.hud.set("life", 10)
+        self.assertEqual(self.hud.text_cache.hits, 1)
+        self.assertEqual(self.hud.text_cache.misses, 2)
+
+    def test_overlay_grows_with_longer_text(self) -> None:
+        """
+        Verifies that the overlay is enlarged when a line no longer fits.
+        """
+        self.hud.set("score", 0)
+        self.hud.set("life", 10)
+        width = self.hud.overlay.get_width()
+        self.hud.set("score", 123456789)
+        self.assertGreater(self.hud.overlay.get_width(), width)
+        self.assertGreaterEqual(self.hud.overlay.get_height(), self.hud.line_spacing)
+
+    def test_draw_matches_direct_rendering(self) -> None:
+        """
+        Verifies that drawing the composed overlay gives the same pixels as blitting every
+        rendered line directly on the screen.
+        """
+        font = self.hud.font
+        self.hud.set("score", 5)
+        self.hud.set("life", 7)
+        self.hud.set("score", 6)
+
+        expected = pygame.Surface((200, 100))
+        expected.fill((30, 60, 90))
+        expected.blit(font.render("Score 6", True, (200, 200, 200)), (10, 10))
+        expected.blit(font.render("Life 7", True, (200, 200, 200, 150)), (10, 50))
+
+        screen = pygame.Surface((200, 100))
+        screen.fill((30, 60, 90))
+        rect = self.hud.draw(screen)
+
+        self.assertEqual(rect.topleft, (10, 10))
+        self.assertEqual(rect, self.hud.get_rect())
+        self.assertEqual(pygame.image.tobytes(screen, "RGB"), pygame.image.tobytes(expected, "RGB"))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()  # pragma: no cover
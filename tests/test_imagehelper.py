@@ -1,4 +1,5 @@
 import os
+import random
 import shutil
 import time
 import unittest
@@ -198,5 +199,107 @@ class TestImageHelperInit(unittest.TestCase):
         self.assertIn(random_image, image_files)
         self.assertEqual(image_path, os.path.join(test_folder, random_image))
 
+    def test_folder_is_listed_once(self) -> None:
+        """
+        Tests that get_random_image only lists a folder the first time it is used.
+
+        Verifies that consecutive spawns reuse the folder index instead of calling os.listdir again.
+        """
+        for image_file in ["image1.png", "image2.png"]:
+            with open(os.path.join(self.test_folder, image_file), "w") as _:
+                pass
+
+        with patch("src.helpers.imagehelper.os.listdir", wraps=os.listdir) as mock_listdir:
+            for _ in range(10):
+                ImageHelper.get_random_image(self.test_folder)
+            self.assertEqual(mock_listdir.call_count, 1)
+
+    def test_lookups_do_not_touch_the_disk(self) -> None:
+        """
+        Tests that picking from an indexed folder makes no system call.
+
+        Verifies that once the folder is indexed, get_random_image neither lists nor stats it.
+        """
+        with open(os.path.join(self.test_folder, "image1.png"), "w") as _:
+            pass
+        ImageHelper.index_folder(self.test_folder)
+
+        with patch("src.helpers.imagehelper.os.listdir") as mock_listdir, \
+                patch("src.helpers.imagehelper.os.stat") as mock_stat:
+            for _ in range(10):
+                ImageHelper.get_random_image(self.test_folder)
+        mock_listdir.assert_not_called()
+        mock_stat.assert_not_called()
+
+    def test_refresh_lists_the_folder_again(self) -> None:
+        """
+        Tests that the folder index is only rebuilt by an explicit refresh.
+
+        Verifies that an image added after the first lookup is taken into account once refreshed,
+        and that registered folders are kept.
+        """
+        with open(os.path.join(self.test_folder, "image1.png"), "w") as _:
+            pass
+        files, _ = ImageHelper.index_folder(self.test_folder)
+        self.assertEqual(files, ["image1.png"])
+        packed_folder = os.path.join(self.test_folder, "packed")
+        ImageHelper.register_folder(packed_folder, ["monster01.png"])
+
+        with open(os.path.join(self.test_folder, "image2.png"), "w") as _:
+            pass
+        self.assertEqual(ImageHelper.index_folder(self.test_folder)[0], ["image1.png"])
+
+        ImageHelper.refresh()
+        self.assertEqual(ImageHelper.index_folder(self.test_folder)[0], ["image1.png", "image2.png"])
+        self.assertEqual(ImageHelper.index_folder(packed_folder)[0], ["monster01.png"])
+
+    def test_indexed_choice_matches_weighted_choice(self) -> None:
+        """
+        Tests that the indexed picker keeps the weight semantics of random.choices.
+
+        Verifies that, for the same random state, the picked images are the same ones that
+        random.choices returns with the weights from calculate_weights.
+        """
+        for image_file in ["monster01.png", "monster02.png", "monster05.png", "monster08.png"]:
+            with open(os.path.join(self.test_folder, image_file), "w") as _:
+                pass
+        files, _ = ImageHelper.index_folder(self.test_folder)
+        weights = ImageHelper.calculate_weights(files)
+
+        random.seed(1234)
+        expected = [random.choices(files, weights=weights, k=1)[0] for _ in range(200)]
+        random.seed(1234)
+        picked = [ImageHelper.get_random_image(self.test_folder)[0] for _ in range(200)]
+        self.assertEqual(picked, expected)
+
+    def test_random_image_from_given_generator(self) -> None:
+        """
+        Tests that the image is picked with the given random generator instead of the random module.
+        """
+        for image_file in ["monster01.png", "monster02.png", "monster05.png", "monster08.png"]:
+            with open(os.path.join(self.test_folder, image_file), "w") as _:
+                pass
+
+        first = [ImageHelper.get_random_image(self.test_folder, random.Random(7))[0] for _ in range(20)]
+        with patch("random.choices") as mock_choices:
+            second = [ImageHelper.get_random_image(self.test_folder, random.Random(7))[0] for _ in range(20)]
+        self.assertEqual(first, second)
+        mock_choices.assert_not_called()
+
+    def test_registered_folder_is_never_listed(self) -> None:
+        """
+        Tests that a registered folder is picked from without existing on disk.
+
+        Verifies that images packed in a texture atlas can be picked like loose files.
+        """
+        missing_folder = os.path.join(self.test_folder, "packed")
+        ImageHelper.register_folder(missing_folder, ["monster01.png", "monster02.png"])
+
+        with patch("src.helpers.imagehelper.os.listdir") as mock_listdir:
+            random_image, image_path = ImageHelper.get_random_image(missing_folder)
+            mock_listdir.assert_not_called()
+        self.assertIn(random_image, ["monster01.png", "monster02.png"])
+        self.assertEqual(image_path, os.path.join(missing_folder, random_image))
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()  # pragma: no cover
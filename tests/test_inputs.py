@@ -0,0 +1,86 @@
+import unittest
+
+import pygame
+
+from src.inputs import (COMMAND_PAUSE, IDLE, INPUT_LEFT, INPUT_RIGHT, LEFT, RIGHT, IdleInput, KeyState, RandomInput,
+                        RecordedInput, ScriptedInput, encode_keys)
+
+
+class TestKeyState(unittest.TestCase):
+
+    def test_held_keys(self) -> None:
+        """
+        Verifies that a KeyState reads like pygame.key.get_pressed().
+        """
+        keys = KeyState(pygame.K_LEFT)
+        self.assertTrue(keys[pygame.K_LEFT])
+        self.assertFalse(keys[pygame.K_RIGHT])
+        self.assertEqual(keys, LEFT)
+
+    def test_input_bits(self) -> None:
+        """
+        Verifies that the keys held are packed in input bits and back, ignoring the command bits.
+        """
+        self.assertEqual(encode_keys({pygame.K_LEFT: 1, pygame.K_RIGHT: 0}), INPUT_LEFT)
+        self.assertEqual(encode_keys(RIGHT), INPUT_RIGHT)
+        self.assertEqual(KeyState.from_bits(INPUT_LEFT | COMMAND_PAUSE), LEFT)
+        both = KeyState.from_bits(INPUT_LEFT | INPUT_RIGHT)
+        self.assertEqual(encode_keys(both), INPUT_LEFT | INPUT_RIGHT)
+        self.assertEqual(KeyState.from_bits(0), IDLE)
+
+
+class TestInputProviders(unittest.TestCase):
+
+    def test_idle_input(self) -> None:
+        """
+        Verifies that the idle input never holds a key.
+        """
+        keys = IdleInput()
+        self.assertTrue(all(keys(frame) == IDLE for frame in range(100)))
+
+    def test_random_input_is_reproducible(self) -> None:
+        """
+        Verifies that random inputs with the same seed hold the same keys, in stretches.
+        """
+        first = RandomInput(7, 5, 10)
+        second = RandomInput(7, 5, 10)
+        frames = [first(frame) for frame in range(500)]
+        self.assertEqual(frames, [second(frame) for frame in range(500)])
+        self.assertEqual(set(frames), {IDLE, LEFT, RIGHT})
+        changes = [frame for frame in range(1, 500) if frames[frame] != frames[frame - 1]]
+        self.assertTrue(all(later - earlier >= 5 for earlier, later in zip(changes, changes[1:])))
+
+    def test_invalid_random_input(self) -> None:
+        """
+        Verifies that stretches that are not positive raise a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            RandomInput(min_frames=0)
+        with self.assertRaises(ValueError):
+            RandomInput(min_frames=10, max_frames=5)
+
+    def test_scripted_input(self) -> None:
+        """
+        Verifies that a script is parsed, and replayed in a loop.
+        """
+        keys = ScriptedInput.parse("# warm up\n2 left\n\n1 NONE\n3 right\n")
+        self.assertEqual([keys(frame) for frame in range(8)], [LEFT, LEFT, IDLE, RIGHT, RIGHT, RIGHT, LEFT, LEFT])
+
+    def test_recorded_input(self) -> None:
+        """
+        Verifies that recorded input bits play their keys without the commands, then no key.
+        """
+        keys = RecordedInput(bytes([INPUT_LEFT, INPUT_RIGHT | COMMAND_PAUSE, 0]))
+        self.assertEqual([keys(frame) for frame in range(5)], [LEFT, RIGHT, IDLE, IDLE, IDLE])
+
+    def test_invalid_script(self) -> None:
+        """
+        Verifies that malformed or empty scripts raise a ValueError.
+        """
+        for script in ("", "left 30", "30 up", "0 left"):
+            with self.assertRaises(ValueError):
+                ScriptedInput.parse(script)
+
+
+if __name__ == "__main__":
+    unittest.main()
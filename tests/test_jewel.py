@@ -57,6 +57,27 @@ class TestJewelInit(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             Jewel(image_folder, x, y, speed, window_height)
 
+    @patch("random.randint", return_value=77)
+    @patch(
+        "src.helpers.ImageHelper.get_random_image",
+        return_value=(None, "path/to/image.png"),
+    )
+    @patch("pygame.image.load", return_value=MagicMock())
+    def test_image_is_labelled_with_jewel_value(self, mock_image_load, _, __) -> None:
+        """
+        Tests that the jewel image is labelled with the jewel value and not with a coin value.
+
+        The labelled image is looked up in the SurfaceCache under the jewel value.
+        """
+        mock_image_load.return_value = pygame.Surface((100, 100))
+
+        with patch("src.entities.coin.Coin.labelled_image") as mock_labelled_image:
+            jewel = Jewel("path/to/images", 10, 20, 5, 800)
+
+        self.assertEqual(jewel.value, 77)
+        mock_labelled_image.assert_called_once_with("path/to/image.png", 77)
+        self.assertIs(jewel.image, mock_labelled_image.return_value)
+
 
 class TestJewelUpdate(unittest.TestCase):
 
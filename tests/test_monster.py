@@ -232,7 +232,7 @@ class TestMonsterFadeOut(unittest.TestCase):
         monster = Monster("image_folder", 10, 20, 5, 800)
         monster.fade = True
         monster.fade_start_time = 0
-        monster.update()
+        monster.update(0)
         self.assertEqual(monster.rect.y, 25)
 
     @patch("pygame.image.load")
@@ -247,15 +247,15 @@ class TestMonsterFadeOut(unittest.TestCase):
         and handles the fade out effect correctly.
 
         The test creates a Monster object, sets the fade attribute to True, sets the
-        alpha attribute to 255, calls the update method, and checks that the
-        y-coordinate of the monster is increased by its speed and that the alpha
-        attribute is still 255.
+        alpha attribute to 255, calls the update method at the time the fade started,
+        and checks that the y-coordinate of the monster is increased by its speed and
+        that the alpha attribute is still 255.
         """
         mock_image_load.return_value = pygame.Surface((100, 100))
         monster = Monster("image_folder", 10, 20, 5, 800)
         monster.fade = True
         monster.alpha = 255
-        monster.update()
+        monster.update(0)
         self.assertEqual(monster.rect.y, 25)
         self.assertEqual(monster.alpha, 255)
 
@@ -279,7 +279,7 @@ class TestMonsterFadeOut(unittest.TestCase):
         monster = Monster("image_folder", 10, 20, 5, 800)
         monster.fade = True
         monster.alpha = 0
-        monster.update()
+        monster.update(0)
         self.assertEqual(monster.rect.y, 25)
         self.assertEqual(monster.alpha, 0)
 
@@ -304,7 +304,7 @@ class TestMonsterFadeOut(unittest.TestCase):
         monster = Monster("image_folder", 10, 20, 5, 800)
         monster.fade = True
         monster.alpha = -1
-        monster.update()
+        monster.update(0)
         self.assertEqual(monster.rect.y, 25)
         self.assertEqual(monster.alpha, 0)
 
@@ -329,7 +329,7 @@ class TestMonsterFadeOut(unittest.TestCase):
         monster = Monster("image_folder", 10, 20, 5, 800)
         monster.fade = True
         monster.alpha = 256
-        monster.update()
+        monster.update(0)
         self.assertEqual(monster.rect.y, 25)
         self.assertEqual(monster.alpha, 255)
 
@@ -355,5 +355,99 @@ class TestMonsterFadeOut(unittest.TestCase):
         monster.kill.assert_called_once()
 
 
+class TestMonsterFadePipeline(unittest.TestCase):
+    def setUp(self):
+        """Initialize pygame and patch the image lookups with a real image with alpha."""
+        pygame.init()
+        image = pygame.Surface((100, 100), pygame.SRCALPHA)
+        image.fill((10, 20, 30, 255))
+        load_patcher = patch("pygame.image.load", return_value=image)
+        random_patcher = patch(
+            "src.helpers.imagehelper.ImageHelper.get_random_image",
+            return_value=("image_name_10", "image_path"),
+        )
+        load_patcher.start()
+        random_patcher.start()
+        self.addCleanup(load_patcher.stop)
+        self.addCleanup(random_patcher.stop)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_fade_is_driven_by_time(self):
+        """
+        Verifies that the alpha of a fading monster decreases with the time elapsed since
+        the fade started and reaches 0 after fade_duration milliseconds.
+        """
+        monster = Monster("image_folder", 10, 20, 0, 800)
+        monster.fade_out(1000)
+        monster.update(1000)
+        self.assertEqual(monster.alpha, 255)
+        monster.update(3000)
+        self.assertEqual(monster.alpha, 128)
+        self.assertLess(monster.image.get_at((50, 50)).a, 255)
+        monster.kill = MagicMock()
+        monster.update(5000)
+        self.assertEqual(monster.alpha, 0)
+        monster.kill.assert_called_once()
+
+    def test_fade_out_does_not_restart(self):
+        """
+        Verifies that hitting a monster that is already fading does not restart its fade.
+        """
+        monster = Monster("image_folder", 10, 20, 0, 800)
+        monster.fade_out(1000)
+        monster.fade_out(2000)
+        self.assertEqual(monster.fade_start_time, 1000)
+
+    def test_fade_frames_are_shared(self):
+        """
+        Verifies that monsters with the same image share their faded images and that
+        fading does not allocate a new surface every frame.
+        """
+        first = Monster("image_folder", 10, 20, 0, 800)
+        second = Monster("image_folder", 200, 20, 0, 800)
+        self.assertIs(first.monster_type, second.monster_type)
+
+        first.fade_out(0)
+        second.fade_out(0)
+        first.update(2000)
+        second.update(2000)
+        self.assertIs(first.image, second.image)
+        self.assertIsNot(first.image, first.monster_type.image)
+
+        built_frames = sum(frame is not None for frame in first.monster_type.fade_frames)
+        image = first.image
+        first.update(2000)
+        self.assertIs(first.image, image)
+        self.assertEqual(sum(frame is not None for frame in first.monster_type.fade_frames), built_frames)
+
+    def test_rect_matches_scaled_image(self):
+        """
+        Verifies that the monster rect has the size of the scaled image it draws.
+        """
+        monster = Monster("image_folder", 10, 20, 0, 800)
+        self.assertEqual(monster.rect, pygame.Rect(10, 20, 110, 110))
+        self.assertIs(monster.mask, monster.monster_type.mask)
+
+    def test_reset_restores_a_faded_monster(self):
+        """
+        Verifies that resetting a faded monster gives it the position, image and fade state
+        of a new monster, in the same rect.
+        """
+        monster = Monster("image_folder", 10, 20, 0, 800)
+        rect = monster.rect
+        monster.fade_out(0)
+        monster.update(2000)
+        monster.save_position()
+
+        monster.reset("image_folder", 300, 0, 4, 700)
+        self.assertIs(monster.rect, rect)
+        self.assertEqual(monster.rect, pygame.Rect(300, 0, 110, 110))
+        self.assertEqual((monster.speed, monster.window_height), (4, 700))
+        self.assertEqual((monster.fade, monster.alpha), (False, 255))
+        self.assertIs(monster.image, monster.monster_type.image)
+        self.assertIsNone(monster.previous_position)
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()  # pragma: no cover
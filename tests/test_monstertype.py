@@ -0,0 +1,102 @@
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.entities import MonsterType, MonsterTypeRegistry
+
+
+class TestMonsterType(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Initialize pygame to create surfaces."""
+        pygame.init()
+
+    def tearDown(self) -> None:
+        """Quit pygame after each test."""
+        pygame.quit()
+
+    @patch("pygame.image.load", return_value=pygame.Surface((100, 50), pygame.SRCALPHA))
+    def test_damage_and_scaled_image(self, _) -> None:
+        """
+        Verifies that the damage is taken from the file name and the image is scaled by it.
+        """
+        monster_type = MonsterType("monster20.png", "path/monster20.png")
+        self.assertEqual(monster_type.damage, 20)
+        self.assertEqual(monster_type.size, (120, 60))
+        self.assertEqual(monster_type.image.get_size(), (120, 60))
+        self.assertEqual(monster_type.mask.get_size(), (120, 60))
+
+    @patch("pygame.image.load", return_value=pygame.Surface((10, 10)))
+    def test_default_damage(self, _) -> None:
+        """
+        Verifies that images without a number in their name inflict a damage of 1.
+        """
+        self.assertEqual(MonsterType("monster.png", "path/monster.png").damage, 1)
+
+    @patch("pygame.image.load")
+    def test_fade_frames_are_built_once(self, mock_image_load) -> None:
+        """
+        Verifies that faded images are built lazily and only once per alpha level.
+        """
+        image = pygame.Surface((10, 10), pygame.SRCALPHA)
+        image.fill((255, 0, 0, 255))
+        mock_image_load.return_value = image
+        monster_type = MonsterType("monster00.png", "path/monster00.png")
+
+        self.assertIs(monster_type.fade_frame(255), monster_type.image)
+        faded = monster_type.fade_frame(128)
+        self.assertIs(monster_type.fade_frame(128), faded)
+        self.assertTrue(100 < faded.get_at((5, 5)).a < 160)
+        self.assertEqual(monster_type.fade_frame(0).get_at((5, 5)).a, 0)
+
+    @patch("pygame.image.load", return_value=pygame.Surface((10, 10)))
+    def test_opaque_image_fades(self, _) -> None:
+        """
+        Verifies that images without per-pixel alpha can be faded too.
+        """
+        monster_type = MonsterType("monster00.png", "path/monster00.png")
+        self.assertTrue(monster_type.fade_frame(0).get_flags() & pygame.SRCALPHA)
+        self.assertEqual(monster_type.fade_frame(0).get_at((5, 5)).a, 0)
+
+
+class TestMonsterTypeRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Create a folder with two monster images."""
+        pygame.init()
+        self.test_folder = "test_monster_folder"
+        os.makedirs(self.test_folder, exist_ok=True)
+        for name in ("monster01.png", "monster05.png"):
+            pygame.image.save(pygame.Surface((20, 20), pygame.SRCALPHA), os.path.join(self.test_folder, name))
+
+    def tearDown(self) -> None:
+        """Remove the folder and quit pygame."""
+        shutil.rmtree(self.test_folder, ignore_errors=True)
+        pygame.quit()
+
+    def test_get_returns_shared_type(self) -> None:
+        """
+        Verifies that the same image always gives the same monster type.
+        """
+        path = os.path.join(self.test_folder, "monster05.png")
+        first = MonsterTypeRegistry.get("monster05.png", path)
+        second = MonsterTypeRegistry.get("monster05.png", path)
+        self.assertIs(first, second)
+        self.assertEqual(first.damage, 5)
+
+    def test_preload_registers_every_image(self) -> None:
+        """
+        Verifies that preload creates one monster type per image of the folder.
+        """
+        types = MonsterTypeRegistry.preload(self.test_folder)
+        self.assertEqual(sorted(t.damage for t in types), [1, 5])
+        with patch("src.entities.monstertype.MonsterType") as mock_type:
+            MonsterTypeRegistry.get("monster01.png", os.path.join(self.test_folder, "monster01.png"))
+            mock_type.assert_not_called()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,137 @@
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.helpers import PixelCache, SurfaceCache
+
+
+class TestPixelCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a display, an opaque and a translucent image, and enables the cache in a test folder.
+        """
+        pygame.init()
+        pygame.display.set_mode((32, 32))
+        self.test_folder = 'test_pixel_folder'
+        self.cache_folder = os.path.join(self.test_folder, "cache")
+        os.makedirs(self.test_folder, exist_ok=True)
+
+        self.alpha_path = os.path.join(self.test_folder, "sprite.png")
+        sprite = pygame.Surface((5, 3), pygame.SRCALPHA, 32)
+        sprite.fill((200, 100, 50, 77))
+        sprite.set_at((4, 2), (1, 2, 3, 255))
+        pygame.image.save(sprite, self.alpha_path)
+
+        self.opaque_path = os.path.join(self.test_folder, "bg.png")
+        background = pygame.Surface((4, 6), 0, 24)
+        background.fill((10, 20, 30))
+        pygame.image.save(background, self.opaque_path)
+
+        PixelCache.enable(self.cache_folder)
+
+    def tearDown(self) -> None:
+        """
+        Removes the test folder and quits pygame after each test.
+        """
+        shutil.rmtree(self.test_folder, ignore_errors=True)
+        pygame.quit()
+
+    def load(self, image_path: str) -> pygame.Surface:
+        """
+        Loads an image through the SurfaceCache, forgetting the surfaces kept in memory first.
+        """
+        SurfaceCache.clear()
+        return SurfaceCache.get(image_path)
+
+    def test_second_load_skips_decoding(self) -> None:
+        """
+        Verifies that an image is decoded once and read back from its cache file afterwards.
+        """
+        with patch("pygame.image.load", wraps=pygame.image.load) as mock_load:
+            decoded = self.load(self.alpha_path)
+            cached = self.load(self.alpha_path)
+            self.assertEqual(mock_load.call_count, 1)
+
+        self.assertEqual(len(os.listdir(self.cache_folder)), 1)
+        self.assertEqual(cached.get_size(), decoded.get_size())
+        self.assertEqual(cached.get_masks(), decoded.get_masks())
+        self.assertTrue(cached.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(pygame.image.tobytes(cached, "RGBA"), pygame.image.tobytes(decoded, "RGBA"))
+
+    def test_opaque_image(self) -> None:
+        """
+        Verifies that an opaque image is read back opaque and in the display pixel format.
+        """
+        decoded = self.load(self.opaque_path)
+        with patch("pygame.image.load") as mock_load:
+            cached = self.load(self.opaque_path)
+            mock_load.assert_not_called()
+
+        self.assertFalse(cached.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(cached.get_masks(), pygame.display.get_surface().get_masks())
+        self.assertEqual(pygame.image.tobytes(cached, "RGB"), pygame.image.tobytes(decoded, "RGB"))
+
+    def test_cached_surface_can_be_drawn_on(self) -> None:
+        """
+        Verifies that drawing on a surface read from the cache does not change the cache file.
+        """
+        self.load(self.alpha_path)
+        cached = self.load(self.alpha_path)
+        cached.fill((0, 0, 0, 0))
+
+        self.assertEqual(tuple(self.load(self.alpha_path).get_at((0, 0))), (200, 100, 50, 77))
+
+    def test_changed_source_is_decoded_again(self) -> None:
+        """
+        Verifies that the cache file is not used once the source image changes.
+        """
+        self.load(self.alpha_path)
+        sprite = pygame.Surface((2, 2), pygame.SRCALPHA, 32)
+        sprite.fill((9, 9, 9, 255))
+        pygame.image.save(sprite, self.alpha_path)
+
+        with patch("pygame.image.load", wraps=pygame.image.load) as mock_load:
+            image = self.load(self.alpha_path)
+            self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(image.get_size(), (2, 2))
+        self.assertEqual(len(os.listdir(self.cache_folder)), 2)
+
+    def test_invalid_cache_file_is_rewritten(self) -> None:
+        """
+        Verifies that a truncated cache file is ignored and written again.
+        """
+        self.load(self.alpha_path)
+        cache_path = os.path.join(self.cache_folder, os.listdir(self.cache_folder)[0])
+        with open(cache_path, "r+b") as cache_file:
+            cache_file.truncate(40)
+
+        with patch("pygame.image.load", wraps=pygame.image.load) as mock_load:
+            image = self.load(self.alpha_path)
+            self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(image.get_size(), (5, 3))
+        self.assertEqual(os.path.getsize(cache_path), PixelCache.HEADER.size + 5 * 3 * 4)
+
+    def test_disabled_cache(self) -> None:
+        """
+        Verifies that no cache file is written when the cache is disabled.
+        """
+        PixelCache.enable(None)
+        self.load(self.alpha_path)
+        self.assertFalse(os.path.exists(self.cache_folder))
+
+    def test_clear(self) -> None:
+        """
+        Verifies that clear removes every cache file.
+        """
+        self.load(self.alpha_path)
+        self.load(self.opaque_path)
+        self.assertEqual(PixelCache.clear(), 2)
+        self.assertEqual(os.listdir(self.cache_folder), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
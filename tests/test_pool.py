@@ -0,0 +1,116 @@
+import unittest
+
+import pygame
+
+from src.entities import BaseSprite
+from src.pool import EntityPool
+
+
+class Drop(BaseSprite):
+    """A sprite counting how many times it was initialized or reset."""
+
+    def __init__(self, x: int, y: int = 0) -> None:
+        super().__init__()
+        self.resets = 0
+        self.reset(x, y)
+
+    def reset(self, x: int, y: int = 0) -> None:
+        self.rect = pygame.Rect(x, y, 10, 10)
+        self.resets += 1
+
+
+class TestEntityPool(unittest.TestCase):
+
+    def test_acquire_creates_when_empty(self) -> None:
+        """
+        Verifies that an empty pool creates a new entity attached to the pool.
+        """
+        pool = EntityPool(Drop)
+        drop = pool.acquire(5, y=7)
+        self.assertIsInstance(drop, Drop)
+        self.assertIs(drop.pool, pool)
+        self.assertEqual(drop.rect.topleft, (5, 7))
+        self.assertEqual((pool.created, pool.reused, len(pool)), (1, 0, 0))
+
+    def test_killed_entities_are_reset_and_reused(self) -> None:
+        """
+        Verifies that killing an entity gives it back to the pool, and that the next acquire resets it.
+        """
+        pool = EntityPool(Drop)
+        group = pygame.sprite.Group()
+        drop = pool.acquire(5)
+        group.add(drop)
+        drop.kill()
+        self.assertEqual(len(pool), 1)
+        self.assertNotIn(drop, group)
+
+        again = pool.acquire(40, 2)
+        self.assertIs(again, drop)
+        self.assertEqual(again.rect.topleft, (40, 2))
+        self.assertEqual(again.resets, 2)
+        self.assertEqual((pool.created, pool.reused, pool.released), (1, 1, 1))
+
+    def test_release_is_idempotent(self) -> None:
+        """
+        Verifies that killing or releasing an entity twice keeps a single copy in the pool.
+        """
+        pool = EntityPool(Drop)
+        drop = pool.acquire(0)
+        drop.kill()
+        drop.kill()
+        self.assertFalse(pool.release(drop))
+        self.assertEqual(pool.free, [drop])
+
+    def test_high_water_mark_drops_the_excess(self) -> None:
+        """
+        Verifies that the entities released beyond the high-water mark are not kept.
+        """
+        pool = EntityPool(Drop, high_water=2)
+        drops = [pool.acquire(x) for x in range(3)]
+        for drop in drops:
+            drop.kill()
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.stats(), {
+            "free": 2, "high_water": 2, "created": 3, "reused": 0, "released": 2, "dropped": 1, "peak": 2,
+        })
+
+    def test_zero_high_water_disables_pooling(self) -> None:
+        """
+        Verifies that a pool without room always creates new entities.
+        """
+        pool = EntityPool(Drop, high_water=0)
+        first = pool.acquire(0)
+        first.kill()
+        self.assertIsNot(pool.acquire(0), first)
+        self.assertEqual(pool.created, 2)
+
+    def test_entities_outside_the_pool_are_ignored(self) -> None:
+        """
+        Verifies that killing an entity that did not come from a pool does not pool it.
+        """
+        pool = EntityPool(Drop)
+        drop = Drop(0)
+        drop.kill()
+        self.assertFalse(pool.release(drop))
+        self.assertEqual(len(pool), 0)
+
+    def test_clear_drops_free_entities(self) -> None:
+        """
+        Verifies that clearing the pool forgets its free entities but keeps its counters.
+        """
+        pool = EntityPool(Drop)
+        pool.acquire(0).kill()
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.peak, 1)
+
+    def test_high_water_must_not_be_negative(self) -> None:
+        """
+        Verifies that a negative high-water mark raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            EntityPool(Drop, high_water=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import patch
+
+from src.profiler import FrameProfiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def test_record_last_and_average(self) -> None:
+        """
+        Verifies that the profiler keeps the last value and the average of a measurement.
+        """
+        profiler = FrameProfiler()
+        profiler.record("dirty_area", 100)
+        profiler.end_frame()
+        profiler.record("dirty_area", 300)
+        profiler.end_frame()
+        self.assertEqual(profiler.frames, 2)
+        self.assertEqual(profiler.last("dirty_area"), 300)
+        self.assertEqual(profiler.average("dirty_area"), 200)
+
+    def test_unknown_measurement(self) -> None:
+        """
+        Verifies that measurements never recorded are reported as 0.
+        """
+        profiler = FrameProfiler()
+        self.assertEqual(profiler.last("missing"), 0)
+        self.assertEqual(profiler.average("missing"), 0)
+
+    @patch("src.profiler.time.perf_counter", side_effect=[1.0, 1.005])
+    def test_section_records_milliseconds(self, _) -> None:
+        """
+        Verifies that a timed section is recorded in milliseconds.
+        """
+        profiler = FrameProfiler()
+        with profiler.section("background"):
+            pass
+        self.assertAlmostEqual(profiler.last("background"), 5.0)
+
+    def test_report(self) -> None:
+        """
+        Verifies that the report lists the number of frames and every measurement.
+        """
+        profiler = FrameProfiler()
+        profiler.record("dirty_area", 10)
+        profiler.end_frame()
+        report = profiler.report()
+        self.assertIn("frames: 1", report)
+        self.assertIn("dirty_area: avg 10.000, last 10.000", report)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()  # pragma: no cover
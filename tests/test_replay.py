@@ -0,0 +1,135 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.headless import simulate
+from src.inputs import COMMAND_PAUSE, INPUT_LEFT, RandomInput
+from src.replay import Replay, gameplay_constants, play, state_checksum
+from src.world import World
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a temporary folder for the replay files.
+        """
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "session.hmr")
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+        pygame.quit()
+
+    def record(self, ticks: int = 400) -> Replay:
+        """
+        Records a session of random input and saves it.
+        """
+        world = World(seed=21)
+        replay = Replay(world.seed)
+        simulate(world, ticks, RandomInput(21), replay)
+        replay.save(self.path)
+        return replay
+
+    def test_save_and_load(self) -> None:
+        """
+        Verifies that a saved replay is read back identical, in less than two bytes per tick of input.
+        """
+        replay = self.record()
+        loaded = Replay.load(self.path)
+
+        self.assertEqual(loaded.seed, 21)
+        self.assertEqual(loaded.constants, gameplay_constants())
+        self.assertEqual(loaded.inputs, replay.inputs)
+        self.assertEqual(loaded.checksums, replay.checksums)
+        self.assertLess(os.path.getsize(self.path), Replay.HEADER.size + len(replay) * 6)
+
+    def test_replay_matches_the_recording(self) -> None:
+        """
+        Verifies that replaying a recording in a new world reaches the same state on every tick.
+        """
+        replay = self.record()
+        stats = play(World(seed=replay.seed), Replay.load(self.path))
+        self.assertEqual(stats["diverged_at"], -1)
+        self.assertEqual(stats["frames"], len(replay))
+
+    def test_unseeded_game_replays(self) -> None:
+        """
+        Verifies that a world created without a seed is replayed from the seed it picked.
+        """
+        world = World()
+        replay = Replay(world.seed)
+        simulate(world, 400, RandomInput(1), replay)
+        replay.save(self.path)
+
+        stats = play(World(seed=world.seed), Replay.load(self.path))
+        self.assertEqual(stats["diverged_at"], -1)
+        self.assertEqual(stats["frames"], len(replay))
+
+    def test_seed_must_fit_the_header(self) -> None:
+        """
+        Verifies that a seed that does not fit in a signed 64-bit integer raises a ValueError.
+        """
+        Replay(-2 ** 63)
+        for seed in (2 ** 63, -2 ** 63 - 1):
+            with self.assertRaises(ValueError):
+                Replay(seed)
+
+    def test_divergence_is_caught_on_its_tick(self) -> None:
+        """
+        Verifies that the replay stops on the first tick whose state differs from the recording.
+        """
+        replay = self.record()
+        replay.inputs[150] ^= INPUT_LEFT
+        stats = play(World(seed=replay.seed), replay)
+        self.assertEqual(stats["diverged_at"], 150)
+        self.assertEqual(stats["frames"], 151)
+
+    def test_commands_are_replayed(self) -> None:
+        """
+        Verifies that a recorded pause is applied on its tick.
+        """
+        world = World(seed=4)
+        replay = Replay(world.seed)
+        for bits in (0, COMMAND_PAUSE, 0):
+            world.step(world.timestep.time, {pygame.K_LEFT: 0, pygame.K_RIGHT: 0}, bits)
+            world.timestep.tick()
+            replay.record(bits, state_checksum(world))
+        self.assertTrue(world.paused)
+
+        replayed = World(seed=4)
+        self.assertEqual(play(replayed, replay)["diverged_at"], -1)
+        self.assertTrue(replayed.paused)
+
+    def test_mismatched_seed_or_constants(self) -> None:
+        """
+        Verifies that a replay cannot be played with another seed or other gameplay constants.
+        """
+        replay = Replay(5)
+        with self.assertRaises(ValueError):
+            play(World(seed=6), replay)
+
+        replay.constants = (25,) + replay.constants[1:]
+        with self.assertRaises(ValueError):
+            play(World(seed=5), replay)
+
+    def test_invalid_files(self) -> None:
+        """
+        Verifies that files that are not replays, or are truncated, raise a ValueError.
+        """
+        with open(self.path, "wb") as replay_file:
+            replay_file.write(b"not a replay" * 10)
+        with self.assertRaises(ValueError):
+            Replay.load(self.path)
+
+        self.record(50)
+        with open(self.path, "r+b") as replay_file:
+            replay_file.truncate(os.path.getsize(self.path) - 10)
+        with self.assertRaises(ValueError):
+            Replay.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import shutil
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.helpers import SoundCache
+
+SOUND_PATH = os.path.join("assets", "music", "ping02.mp3")
+
+
+class TestSoundCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Initializes the mixer and enables the cache in a test folder.
+        """
+        self.audio_driver = os.environ.get("SDL_AUDIODRIVER")
+        try:
+            pygame.mixer.init(44100, -16, 2)
+        except pygame.error:
+            # decoding does not need a sound card, so fall back to SDL's silent driver
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            pygame.mixer.init(44100, -16, 2)
+        self.cache_folder = 'test_sound_cache'
+        SoundCache.enable(self.cache_folder)
+        self.decode = MagicMock(side_effect=pygame.mixer.Sound)
+
+    def tearDown(self) -> None:
+        """
+        Removes the test folder and quits the mixer after each test.
+        """
+        shutil.rmtree(self.cache_folder, ignore_errors=True)
+        pygame.mixer.quit()
+        if self.audio_driver is None:
+            os.environ.pop("SDL_AUDIODRIVER", None)
+        else:
+            os.environ["SDL_AUDIODRIVER"] = self.audio_driver
+
+    def test_second_load_skips_decoding(self) -> None:
+        """
+        Verifies that a sound is decoded once and read back from its cache file afterwards.
+        """
+        decoded = SoundCache.load(SOUND_PATH, self.decode)
+        cached = SoundCache.load(SOUND_PATH, self.decode)
+
+        self.assertEqual(self.decode.call_count, 1)
+        self.assertEqual(len(os.listdir(self.cache_folder)), 1)
+        self.assertEqual(cached.get_raw(), decoded.get_raw())
+        self.assertAlmostEqual(cached.get_length(), decoded.get_length())
+
+    def test_mixer_format_change(self) -> None:
+        """
+        Verifies that the sound is decoded again when the mixer configuration changes.
+        """
+        SoundCache.load(SOUND_PATH, self.decode)
+        pygame.mixer.quit()
+        pygame.mixer.init(22050, -16, 1)
+
+        sound = SoundCache.load(SOUND_PATH, self.decode)
+        self.assertEqual(self.decode.call_count, 2)
+        self.assertEqual(len(os.listdir(self.cache_folder)), 2)
+        self.assertEqual(sound.get_raw(), pygame.mixer.Sound(SOUND_PATH).get_raw())
+
+    def test_mismatched_header_is_rewritten(self) -> None:
+        """
+        Verifies that a cache file recorded for another mixer configuration is decoded again.
+        """
+        SoundCache.load(SOUND_PATH, self.decode)
+        cache_path = os.path.join(self.cache_folder, os.listdir(self.cache_folder)[0])
+        with open(cache_path, "r+b") as cache_file:
+            cache_file.write(SoundCache.HEADER.pack(SoundCache.MAGIC, 8000, 8, 1))
+
+        SoundCache.load(SOUND_PATH, self.decode)
+        self.assertEqual(self.decode.call_count, 2)
+        self.assertIsNotNone(SoundCache.read(cache_path, pygame.mixer.get_init()))
+
+    def test_disabled_cache(self) -> None:
+        """
+        Verifies that the sound is decoded and no cache file written when the cache is disabled.
+        """
+        SoundCache.enable(None)
+        SoundCache.load(SOUND_PATH, self.decode)
+        self.assertEqual(self.decode.call_count, 1)
+        self.assertFalse(os.path.exists(self.cache_folder))
+
+    def test_missing_file(self) -> None:
+        """
+        Verifies that a missing sound file raises the decoding error.
+        """
+        with self.assertRaises((pygame.error, FileNotFoundError)):
+            SoundCache.load(os.path.join("assets", "music", "missing.mp3"), pygame.mixer.Sound)
+
+    def test_clear(self) -> None:
+        """
+        Verifies that clear removes every cache file.
+        """
+        SoundCache.load(SOUND_PATH, self.decode)
+        self.assertEqual(SoundCache.clear(), 1)
+        self.assertEqual(os.listdir(self.cache_folder), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
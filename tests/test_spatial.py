@@ -0,0 +1,104 @@
+import random
+import unittest
+
+import pygame
+
+from src.spatial import SpatialGroup, SpatialHash
+
+
+class Box(pygame.sprite.Sprite):
+    """A sprite with a rect and no image, moving down by its speed on update."""
+
+    def __init__(self, x: int, y: int, size: int = 20, speed: int = 0) -> None:
+        super().__init__()
+        self.rect = pygame.Rect(x, y, size, size)
+        self.speed = speed
+
+    def update(self) -> None:
+        self.rect.y += self.speed
+        if self.rect.top > 500:
+            self.kill()
+
+
+class TestSpatialHash(unittest.TestCase):
+
+    def test_sprite_spans_every_overlapped_cell(self) -> None:
+        """
+        Verifies that a sprite is in every cell its rect overlaps, and in no other.
+        """
+        grid = SpatialHash(64)
+        box = Box(60, 10, 10)
+        grid.insert(box)
+        self.assertEqual(set(grid.cells), {(0, 0), (1, 0)})
+
+        grid.remove(box)
+        self.assertEqual(grid.cells, {})
+        self.assertEqual(len(grid), 0)
+
+    def test_move_only_touches_changed_cells(self) -> None:
+        """
+        Verifies that moving a sprite within its cells does not touch the grid.
+        """
+        grid = SpatialHash(64)
+        box = Box(0, 0, 10)
+        grid.insert(box)
+        box.rect.y = 40
+        self.assertFalse(grid.move(box))
+        box.rect.y = 60
+        self.assertTrue(grid.move(box))
+        self.assertEqual(set(grid.cells), {(0, 0), (0, 1)})
+
+    def test_query_matches_linear_scan(self) -> None:
+        """
+        Verifies that queries return the same sprites, in the same order, as a linear scan.
+        """
+        rng = random.Random(3)
+        grid = SpatialHash(32)
+        boxes = [Box(rng.randrange(0, 1000), rng.randrange(0, 1000), rng.randrange(1, 90)) for _ in range(300)]
+        for box in boxes:
+            grid.insert(box)
+        for _ in range(200):
+            rect = pygame.Rect(rng.randrange(-50, 1000), rng.randrange(-50, 1000), rng.randrange(1, 150), rng.randrange(1, 150))
+            expected = [box for box in boxes if rect.colliderect(box.rect)]
+            self.assertEqual(grid.query(rect), expected)
+            self.assertEqual(grid.any(rect), bool(expected))
+
+    def test_invalid_cell_size(self) -> None:
+        """
+        Verifies that a cell size that is not positive raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            SpatialHash(0)
+
+
+class TestSpatialGroup(unittest.TestCase):
+
+    def test_grid_follows_the_group(self) -> None:
+        """
+        Verifies that sprites are indexed when added and forgotten when removed, killed or emptied.
+        """
+        group = SpatialGroup(cell_size=64)
+        first, second, third = Box(0, 0), Box(100, 0), Box(200, 0)
+        group.add(first, second, third)
+        self.assertEqual(len(group.grid), 3)
+
+        group.remove(first)
+        second.kill()
+        self.assertEqual(group.collide(pygame.Rect(0, 0, 300, 30)), [third])
+
+        group.empty()
+        self.assertEqual(group.grid.cells, {})
+
+    def test_update_moves_sprites_in_the_grid(self) -> None:
+        """
+        Verifies that sprites moved by update are found at their new position, and killed ones are gone.
+        """
+        group = SpatialGroup(Box(0, 0, speed=30), Box(100, 450, speed=60), cell_size=64)
+        group.update()
+        self.assertTrue(group.collideany(pygame.Rect(0, 30, 20, 20)))
+        self.assertFalse(group.collideany(pygame.Rect(0, 0, 20, 10)))
+        self.assertEqual(len(group.grid), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
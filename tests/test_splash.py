@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.splash import SplashScreen
+
+
+class TestSplashScreen(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a splash screen on an offscreen surface.
+        """
+        pygame.init()
+        self.screen = pygame.Surface((200, 100))
+        self.splash = SplashScreen(self.screen)
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    @patch("pygame.display.flip")
+    def test_progress_bar(self, mock_flip) -> None:
+        """
+        Verifies that the progress bar is filled up to the progress, and that every draw is presented.
+        """
+        inner = self.splash.bar.inflate(-4, -4)
+        self.splash.draw(0.0)
+        self.assertEqual(self.screen.get_at(inner.midleft)[:3], (0, 0, 0))
+
+        self.splash.draw(1.5)
+        self.assertNotEqual(self.screen.get_at((inner.right - 1, inner.centery))[:3], (0, 0, 0))
+        self.assertEqual(mock_flip.call_count, 2)
+        self.assertEqual(self.splash.draws, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
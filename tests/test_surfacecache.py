@@ -0,0 +1,93 @@
+import os
+import shutil
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.helpers import SurfaceCache
+
+
+class TestSurfaceCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a folder with a couple of real images before each test.
+        """
+        pygame.init()
+        self.test_folder = 'test_surface_folder'
+        os.makedirs(self.test_folder, exist_ok=True)
+        for name in ("a1.png", "b2.png"):
+            pygame.image.save(pygame.Surface((8, 8), pygame.SRCALPHA), os.path.join(self.test_folder, name))
+        with open(os.path.join(self.test_folder, "notes.txt"), "w") as _:
+            pass
+
+    def tearDown(self) -> None:
+        """
+        Removes the test folder and quits pygame after each test.
+        """
+        shutil.rmtree(self.test_folder, ignore_errors=True)
+        pygame.quit()
+
+    def test_preload_loads_only_images(self) -> None:
+        """
+        Verifies that preload loads every image in the folder and ignores other files.
+        """
+        self.assertEqual(SurfaceCache.preload(self.test_folder), 2)
+        self.assertEqual(SurfaceCache.size(), 2)
+
+    def test_preload_twice_does_not_reload(self) -> None:
+        """
+        Verifies that a second preload of the same folder does not touch the disk again.
+        """
+        SurfaceCache.preload(self.test_folder)
+        with patch("pygame.image.load") as mock_load:
+            self.assertEqual(SurfaceCache.preload(self.test_folder), 0)
+            mock_load.assert_not_called()
+
+    def test_get_returns_shared_surface_without_io(self) -> None:
+        """
+        Verifies that preloaded images are handed out as the same surface without loading them again.
+        """
+        SurfaceCache.preload(self.test_folder)
+        image_path = os.path.join(self.test_folder, "a1.png")
+        with patch("pygame.image.load") as mock_load:
+            first = SurfaceCache.get(image_path)
+            second = SurfaceCache.get(os.path.join(".", image_path))
+            mock_load.assert_not_called()
+        self.assertIs(first, second)
+
+    def test_get_converts_to_display_format(self) -> None:
+        """
+        Verifies that images are converted to the display format once a display mode is set.
+        """
+        screen = pygame.display.set_mode((16, 16))
+        image = SurfaceCache.get(os.path.join(self.test_folder, "a1.png"))
+        self.assertTrue(image.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(image.get_bitsize(), screen.get_bitsize())
+
+    def test_get_invalid_path_raises(self) -> None:
+        """
+        Verifies that requesting an image that does not exist raises a pygame.error or FileNotFoundError.
+        """
+        with self.assertRaises((pygame.error, FileNotFoundError)):
+            SurfaceCache.get(os.path.join(self.test_folder, "missing.png"))
+
+    def test_derive_builds_once(self) -> None:
+        """
+        Verifies that derived surfaces are built only once per key.
+        """
+        calls: list[int] = []
+
+        def factory() -> pygame.Surface:
+            calls.append(1)
+            return pygame.Surface((1, 1))
+
+        first = SurfaceCache.derive(("label", 1), factory)
+        second = SurfaceCache.derive(("label", 1), factory)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import MagicMock
+
+import pygame
+
+from src.helpers import TextCache
+
+
+class TestTextCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a mocked font that returns a new surface on every render.
+        """
+        self.font = MagicMock()
+        self.font.render.side_effect = lambda text, antialias, color: pygame.Surface((len(text), 10))
+
+    def test_invalid_size(self) -> None:
+        """
+        Verifies that TextCache rejects a non-positive maximum size.
+        """
+        with self.assertRaises(ValueError):
+            TextCache(0)
+
+    def test_render_is_cached(self) -> None:
+        """
+        Verifies that the same text is rendered only once and counted as a hit afterwards.
+        """
+        cache = TextCache()
+        first = cache.render(self.font, "10", (255, 255, 255))
+        second = cache.render(self.font, "10", (255, 255, 255))
+        self.assertIs(first, second)
+        self.font.render.assert_called_once_with("10", True, (255, 255, 255))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_key_includes_color_and_antialias(self) -> None:
+        """
+        Verifies that a different color or antialias setting is rendered separately.
+        """
+        cache = TextCache()
+        cache.render(self.font, "10", (255, 255, 255))
+        cache.render(self.font, "10", (0, 0, 0))
+        cache.render(self.font, "10", (0, 0, 0), False)
+        self.assertEqual(self.font.render.call_count, 3)
+        self.assertEqual(len(cache), 3)
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """
+        Verifies that the least recently used text is dropped once the cache is full.
+        """
+        cache = TextCache(2)
+        cache.render(self.font, "a", (0, 0, 0))
+        cache.render(self.font, "b", (0, 0, 0))
+        cache.render(self.font, "a", (0, 0, 0))
+        cache.render(self.font, "c", (0, 0, 0))
+        self.assertEqual(len(cache), 2)
+
+        cache.render(self.font, "a", (0, 0, 0))
+        self.assertEqual(cache.misses, 3)
+        cache.render(self.font, "b", (0, 0, 0))
+        self.assertEqual(cache.misses, 4)
+
+    def test_clear(self) -> None:
+        """
+        Verifies that clear empties the cache and resets the counters.
+        """
+        cache = TextCache()
+        cache.render(self.font, "a", (0, 0, 0))
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import unittest
+
+import pygame
+
+from src.helpers import ImageHelper, SurfaceCache, TextureAtlas
+
+
+class TestTextureAtlas(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Creates a folder of images with a subfolder, like assets/images.
+        """
+        pygame.init()
+        self.test_folder = 'test_atlas_folder'
+        self.images_folder = os.path.join(self.test_folder, "images")
+        self.atlas_folder = os.path.join(self.test_folder, "atlas")
+        os.makedirs(os.path.join(self.images_folder, "monsters"), exist_ok=True)
+
+        self.colors = {
+            "bg.png": (10, 20, 30, 255),
+            "hero.png": (200, 0, 0, 255),
+            "monsters/monster01.png": (0, 200, 0, 128),
+            "monsters/monster02.png": (0, 0, 200, 255),
+        }
+        sizes = {"bg.png": (16, 16), "hero.png": (10, 14), "monsters/monster01.png": (12, 8), "monsters/monster02.png": (7, 9)}
+        for name, color in self.colors.items():
+            image = pygame.Surface(sizes[name], pygame.SRCALPHA, 32)
+            image.fill(color)
+            pygame.image.save(image, os.path.join(self.images_folder, *name.split("/")))
+
+        self.manifest_path = os.path.join(self.atlas_folder, "atlas.json")
+
+    def tearDown(self) -> None:
+        """
+        Removes the test folder and quits pygame after each test.
+        """
+        shutil.rmtree(self.test_folder, ignore_errors=True)
+        pygame.quit()
+
+    def build(self) -> TextureAtlas:
+        """
+        Builds the atlas of the test images, leaving the background out.
+        """
+        return TextureAtlas.build(
+            self.images_folder, os.path.join(self.atlas_folder, "atlas.png"), self.manifest_path, ("bg.png",)
+        )
+
+    def test_pack_without_overlaps(self) -> None:
+        """
+        Verifies that packed rects never overlap and stay within the atlas.
+        """
+        sizes = {f"image{i}": (10 + i * 7 % 30, 5 + i * 13 % 40) for i in range(30)}
+        (width, height), rects = TextureAtlas.pack(sizes)
+
+        self.assertEqual(width & (width - 1), 0)
+        bounds = pygame.Rect(0, 0, width, height)
+        names = sorted(rects)
+        for i, name in enumerate(names):
+            self.assertEqual(rects[name].size, sizes[name])
+            self.assertTrue(bounds.contains(rects[name]))
+            for other in names[i + 1:]:
+                self.assertFalse(rects[name].colliderect(rects[other]))
+
+    def test_pack_nothing(self) -> None:
+        """
+        Verifies that packing no image returns an empty atlas.
+        """
+        self.assertEqual(TextureAtlas.pack({}), ((0, 0), {}))
+
+    def test_build_writes_manifest(self) -> None:
+        """
+        Verifies that the manifest names every packed image relative to the packed folder.
+        """
+        self.build()
+        with open(self.manifest_path, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+
+        self.assertEqual(manifest["image"], "atlas.png")
+        self.assertEqual(sorted(manifest["sprites"]), ["hero.png", "monsters/monster01.png", "monsters/monster02.png"])
+
+    def test_load_hands_out_subsurfaces(self) -> None:
+        """
+        Verifies that the loaded atlas returns the packed images unchanged, as shared subsurfaces.
+        """
+        self.build()
+        atlas = TextureAtlas.load(self.manifest_path)
+
+        hero = atlas.get("hero.png")
+        self.assertIs(hero.get_parent(), atlas.surface)
+        self.assertIs(atlas.get("hero.png"), hero)
+        self.assertEqual(hero.get_size(), (10, 14))
+        for name in ("hero.png", "monsters/monster01.png", "monsters/monster02.png"):
+            self.assertEqual(tuple(atlas.get(name).get_at((0, 0))), self.colors[name])
+        with self.assertRaises(KeyError):
+            atlas.get("bg.png")
+
+    def test_rect_outside_atlas(self) -> None:
+        """
+        Verifies that a manifest rect outside the atlas image raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            TextureAtlas(pygame.Surface((8, 8)), {"hero.png": pygame.Rect(4, 4, 8, 8)})
+
+    def test_install_without_loose_files(self) -> None:
+        """
+        Verifies that installed images are loaded and picked without the loose files.
+        """
+        self.build()
+        shutil.rmtree(self.images_folder)
+
+        atlas = TextureAtlas.load(self.manifest_path)
+        self.assertEqual(atlas.install(self.images_folder), 3)
+
+        self.assertIs(SurfaceCache.get(os.path.join(self.images_folder, "hero.png")), atlas.get("hero.png"))
+        monsters_folder = os.path.join(self.images_folder, "monsters")
+        random_image, image_path = ImageHelper.get_random_image(monsters_folder)
+        self.assertIn(random_image, ["monster01.png", "monster02.png"])
+        self.assertIs(SurfaceCache.get(image_path), atlas.get(f"monsters/{random_image}"))
+
+
+if __name__ == "__main__":
+    unittest.main()
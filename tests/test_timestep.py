@@ -0,0 +1,55 @@
+import unittest
+
+from src.timestep import FixedTimestep
+
+
+class TestFixedTimestep(unittest.TestCase):
+
+    def test_ticks_follow_real_time(self) -> None:
+        """
+        Verifies that a tick is due for every whole tick duration elapsed, whatever the frame rate.
+        """
+        timestep = FixedTimestep(50, 5)
+        self.assertEqual(timestep.advance(1000), 0)
+
+        # 120 frames per second for one second run the 50 ticks of that second
+        steps = 0
+        for frame in range(1, 121):
+            for _ in range(timestep.advance(1000 + frame * 1000 // 120)):
+                timestep.tick()
+                steps += 1
+        self.assertEqual(steps, 50)
+        self.assertEqual(timestep.time, 1000)
+
+    def test_interpolation_factor(self) -> None:
+        """
+        Verifies that the remainder of the accumulator is the fraction of the next tick.
+        """
+        timestep = FixedTimestep(50, 5)
+        timestep.advance(0)
+        self.assertEqual(timestep.advance(30), 1)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+
+    def test_steps_are_capped_after_a_stall(self) -> None:
+        """
+        Verifies that a stall runs at most max_steps ticks and drops the rest of the backlog.
+        """
+        timestep = FixedTimestep(50, 5)
+        timestep.advance(0)
+        self.assertEqual(timestep.advance(1010), 5)
+        self.assertAlmostEqual(timestep.alpha, 0.5)
+        self.assertAlmostEqual(timestep.dropped, 900)
+        self.assertEqual(timestep.advance(1020), 1)
+
+    def test_invalid_arguments(self) -> None:
+        """
+        Verifies that a rate or maximum steps that are not positive raise a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            FixedTimestep(0, 5)
+        with self.assertRaises(ValueError):
+            FixedTimestep(50, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
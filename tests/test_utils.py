@@ -0,0 +1,104 @@
+import random
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src import utils
+from src.utils import apply_flame_ripple, apply_flame_ripple_python, ripple_distortions
+from src.constants import GOLDENTRANS, REDFIRETRANS
+
+
+def make_halo(size: tuple[int, int], color: tuple) -> pygame.Surface:
+    """Builds a halo surface like the ones drawn by Game.blink_hero."""
+    halo = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.ellipse(halo, color, halo.get_rect())
+    return halo
+
+
+class TestRippleDistortions(unittest.TestCase):
+
+    def test_one_offset_per_row(self) -> None:
+        """
+        Verifies that ripple_distortions returns one integer offset per row.
+        """
+        distortions = ripple_distortions(40, 20, 30, 0.6, 12.0)
+        self.assertEqual(len(distortions), 40)
+        self.assertTrue(all(isinstance(d, int) for d in distortions))
+
+    def test_offsets_are_bounded_by_amplitude(self) -> None:
+        """
+        Verifies that no row is shifted further than the maximum randomized amplitude.
+        """
+        distortions = ripple_distortions(200, 20, 30, 0.6, 7.0)
+        self.assertTrue(all(abs(d) <= 25 for d in distortions))
+
+    def test_same_generator_state_gives_same_offsets(self) -> None:
+        """
+        Verifies that generators with the same seed give the same offsets.
+        """
+        self.assertEqual(
+            ripple_distortions(50, 20, 30, 0.6, 3.0, random.Random(4)),
+            ripple_distortions(50, 20, 30, 0.6, 3.0, random.Random(4)),
+        )
+
+
+@unittest.skipIf(utils.numpy is None, "NumPy is not installed")
+class TestApplyFlameRipple(unittest.TestCase):
+
+    def test_matches_python_implementation(self) -> None:
+        """
+        Verifies that the vectorized ripple produces exactly the same pixels as the
+        pure-Python implementation for the same random state.
+        """
+        for halo in (make_halo((79, 112), GOLDENTRANS), make_halo((89, 122), REDFIRETRANS)):
+            random.seed(42)
+            expected = apply_flame_ripple_python(halo, 20, 30, 0.6, 1234.0)
+            random.seed(42)
+            result = apply_flame_ripple(halo, 20, 30, 0.6, 1234.0)
+
+            self.assertEqual(result.get_size(), expected.get_size())
+            self.assertEqual(pygame.image.tobytes(result, "RGBA"), pygame.image.tobytes(expected, "RGBA"))
+
+    def test_preserves_shape_and_alpha_coverage(self) -> None:
+        """
+        Verifies that the ripple keeps the size of the surface and only moves pixels around,
+        so the number of opaque pixels of every row stays the same.
+        """
+        halo = make_halo((89, 122), REDFIRETRANS)
+        result = apply_flame_ripple(halo, 20, 30, 0.6, 99.0)
+
+        self.assertEqual(result.get_size(), halo.get_size())
+        self.assertTrue(result.get_flags() & pygame.SRCALPHA)
+        for y in range(halo.get_height()):
+            source_row = sum(1 for x in range(halo.get_width()) if halo.get_at((x, y)).a)
+            result_row = sum(1 for x in range(result.get_width()) if result.get_at((x, y)).a)
+            self.assertEqual(result_row, source_row)
+
+    def test_opaque_surface(self) -> None:
+        """
+        Verifies that surfaces without per-pixel alpha are rippled as fully opaque surfaces.
+        """
+        surface = pygame.Surface((10, 10))
+        surface.fill((10, 20, 30))
+        result = apply_flame_ripple(surface, 20, 30, 0.6, 0.0)
+        self.assertEqual(result.get_at((5, 5)), pygame.Color(10, 20, 30, 255))
+
+    def test_empty_surface(self) -> None:
+        """
+        Verifies that an empty surface is returned unchanged in size.
+        """
+        self.assertEqual(apply_flame_ripple(pygame.Surface((0, 0)), 20, 30, 0.6, 0.0).get_size(), (0, 0))
+
+    def test_falls_back_without_numpy(self) -> None:
+        """
+        Verifies that the pure-Python implementation is used when NumPy is not available.
+        """
+        halo = make_halo((20, 20), GOLDENTRANS)
+        with patch("src.utils.numpy", None), patch("src.utils.apply_flame_ripple_python", wraps=apply_flame_ripple_python) as mock_python:
+            apply_flame_ripple(halo, 20, 30, 0.6, 0.0)
+            mock_python.assert_called_once()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,145 @@
+import math
+import os
+import unittest
+
+import pygame
+
+from src.voices import VoiceManager, VolumeCurve
+
+
+class TestVolumeCurve(unittest.TestCase):
+
+    def test_precomputed_volumes(self) -> None:
+        """
+        Verifies that the looked up volumes match the logarithmic curve, clamped to [0, 1].
+        """
+        curve = VolumeCurve(26)
+        for value in range(0, 40):
+            expected = min(1.0, math.log10(value + 1) / math.log10(26))
+            self.assertAlmostEqual(curve.volume(value), expected)
+        self.assertEqual(curve.volume(-3), 0.0)
+        self.assertEqual(len(curve.volumes), 25)
+
+    def test_invalid_base(self) -> None:
+        """
+        Verifies that a base that cannot reach full volume raises a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            VolumeCurve(1)
+
+
+class TestVoiceManager(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """
+        Initializes the mixer and creates a one second silent sound.
+        """
+        self.audio_driver = os.environ.get("SDL_AUDIODRIVER")
+        try:
+            pygame.mixer.init(44100, -16, 2)
+        except pygame.error:
+            # playing does not need a sound card, so fall back to SDL's silent driver
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            pygame.mixer.init(44100, -16, 2)
+        self.sound = pygame.mixer.Sound(buffer=bytes(44100 * 4))
+        self.voices = VoiceManager({"coin": 2, "hit": 1}, max_voices=2)
+
+    def tearDown(self) -> None:
+        """
+        Quits the mixer after each test.
+        """
+        pygame.mixer.quit()
+        if self.audio_driver is None:
+            os.environ.pop("SDL_AUDIODRIVER", None)
+        else:
+            os.environ["SDL_AUDIODRIVER"] = self.audio_driver
+
+    def test_channels_are_reserved(self) -> None:
+        """
+        Verifies that the pools own distinct channels that Sound.play() never picks.
+        """
+        channels = [channel for pool in self.voices.pools.values() for channel in pool]
+        self.assertEqual(len(channels), 3)
+        for _ in range(3):
+            self.sound.play()
+        self.assertFalse(any(channel.get_busy() for channel in channels))
+
+    def test_volume_per_voice(self) -> None:
+        """
+        Verifies that overlapping voices keep their own volume and the shared sound is untouched.
+        """
+        quiet = self.voices.play("coin", self.sound, 0.25)
+        loud = self.voices.play("coin", self.sound, 1.0)
+
+        self.assertIsNot(quiet, loud)
+        self.assertAlmostEqual(quiet.get_volume(), 0.25, places=1)
+        self.assertAlmostEqual(loud.get_volume(), 1.0, places=1)
+        self.assertEqual(self.sound.get_volume(), 1.0)
+
+    def test_oldest_voice_of_the_category_is_stolen(self) -> None:
+        """
+        Verifies that a full pool reuses the channel of its oldest voice.
+        """
+        first = self.voices.play("coin", self.sound)
+        second = self.voices.play("coin", self.sound)
+        third = self.voices.play("coin", self.sound)
+        fourth = self.voices.play("coin", self.sound)
+
+        self.assertIs(third, first)
+        self.assertIs(fourth, second)
+        self.assertEqual(self.voices.steals, 2)
+
+    def test_voice_cap(self) -> None:
+        """
+        Verifies that the oldest voice of any category is stopped once the cap is reached.
+        """
+        first = self.voices.play("coin", self.sound)
+        self.voices.play("coin", self.sound)
+        hit = self.voices.play("hit", self.sound)
+
+        self.assertEqual(len(self.voices.busy()), 2)
+        self.assertFalse(first.get_busy())
+        self.assertTrue(hit.get_busy())
+
+    def test_many_plays_stay_bounded(self) -> None:
+        """
+        Verifies that playing many sounds in a frame never uses more channels than the cap.
+        """
+        for _ in range(100):
+            self.voices.play("coin", self.sound)
+            self.voices.play("hit", self.sound)
+        self.assertLessEqual(len(self.voices.busy()), 2)
+
+        self.voices.stop()
+        self.assertEqual(self.voices.busy(), [])
+
+    def test_missing_sound_is_skipped(self) -> None:
+        """
+        Verifies that a sound that is not loaded is skipped.
+        """
+        self.assertIsNone(self.voices.play("coin", None))
+
+    def test_invalid_pools(self) -> None:
+        """
+        Verifies that empty pools or caps raise a ValueError.
+        """
+        with self.assertRaises(ValueError):
+            VoiceManager({"coin": 0})
+        with self.assertRaises(ValueError):
+            VoiceManager({"coin": 1}, max_voices=0)
+
+
+class TestVoiceManagerWithoutMixer(unittest.TestCase):
+
+    def test_sounds_are_skipped(self) -> None:
+        """
+        Verifies that every sound is skipped when the mixer is not initialized.
+        """
+        pygame.mixer.quit()
+        voices = VoiceManager({"coin": 2})
+        self.assertEqual(voices.pools, {})
+        self.assertIsNone(voices.play("coin", object()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import os
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from src.constants import SPRITES_PATH
+from src.entitystore import EntityStore
+from src.helpers import SurfaceCache
+from src.inputs import COMMAND_PAUSE, COMMAND_RESTART, RandomInput
+from src.replay import state_checksum
+from src.world import World
+
+
+class TestWorld(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        pygame.quit()
+
+    def trajectory(self, seed: int, entity_store: bool = False) -> list:
+        """
+        Plays 300 ticks of a new world and returns its sprites after every tick.
+        """
+        world = World(seed=seed, entity_store=entity_store)
+        random.seed()
+        states = []
+        for tick in range(300):
+            world.step(tick * 20, {pygame.K_LEFT: tick % 90 < 30, pygame.K_RIGHT: tick % 90 >= 60})
+            if world.store is not None:
+                world.store.sync()
+            states.append(sorted(
+                (type(sprite).__name__, tuple(sprite.rect), getattr(sprite, "value", 0))
+                for sprite in world.all_sprites
+            ))
+        return states
+
+    def test_same_seed_plays_the_same_game(self) -> None:
+        """
+        Verifies that the same seed and input give the same trajectory, whatever the module level random state.
+        """
+        first = self.trajectory(11)
+        self.assertEqual(first, self.trajectory(11))
+        self.assertNotEqual(first, self.trajectory(12))
+
+    @unittest.skipUnless(EntityStore.available(), "NumPy is not installed")
+    def test_entity_store_plays_the_same_game(self) -> None:
+        """
+        Verifies that the entity store moves, culls and collides the sprites like the sprite groups.
+        """
+        self.assertEqual(self.trajectory(11, entity_store=True), self.trajectory(11))
+
+    @patch("pygame.display.set_mode")
+    @patch("pygame.mixer.Sound")
+    def test_worlds_stepped_side_by_side_do_not_share_state(self, mock_sound, mock_set_mode) -> None:
+        """
+        Verifies that 100 worlds stepped in turn in one process play exactly like each world
+        stepped alone, even when they share a seed, without opening a window nor loading a sound.
+        """
+        seeds = [seed % 50 for seed in range(100)]
+        worlds = [World(seed=seed) for seed in seeds]
+        inputs = [RandomInput(seed) for seed in seeds]
+        interleaved = [[] for _ in worlds]
+        for tick in range(150):
+            for world, keys, checksums in zip(worlds, inputs, interleaved):
+                world.step(world.timestep.time, keys(tick), COMMAND_RESTART if world.game_over else 0)
+                world.timestep.tick()
+                checksums.append(state_checksum(world))
+
+        for seed, checksums in zip(seeds[:50], interleaved):
+            world, keys = World(seed=seed), RandomInput(seed)
+            alone = []
+            for tick in range(150):
+                world.step(world.timestep.time, keys(tick), COMMAND_RESTART if world.game_over else 0)
+                world.timestep.tick()
+                alone.append(state_checksum(world))
+            self.assertEqual(checksums, alone, f"seed {seed}")
+        self.assertEqual(interleaved[:50], interleaved[50:])
+
+        first, twin = worlds[0], worlds[50]
+        self.assertIsNot(first.all_sprites, twin.all_sprites)
+        self.assertIsNot(first.coin_pool, twin.coin_pool)
+        self.assertTrue(set(first.all_sprites).isdisjoint(twin.all_sprites))
+        mock_set_mode.assert_not_called()
+        mock_sound.assert_not_called()
+
+    def test_collections_and_hits_are_events(self) -> None:
+        """
+        Verifies that a collected coin and a hit are left as events, and cleared by the next tick.
+        """
+        world = World(seed=1)
+        coin = MagicMock(value=7)
+        with patch.object(world.coins, "collide", return_value=[coin]):
+            world.handle_collection(world.coins, "collected_coins", "coin")
+        world.hero.life_points = 1
+        world.handle_monster_collision([MagicMock(damage=1)], world.hero.collision_cooldown + 1)
+
+        self.assertEqual(world.events, [("coin", 7), ("hit", 0), ("game_over", 0)])
+        self.assertEqual((world.score, world.collected_coins, world.hits), (7, 1, 1))
+        self.assertTrue(world.game_over)
+
+        world.step(0, {pygame.K_LEFT: 0, pygame.K_RIGHT: 0}, COMMAND_RESTART | COMMAND_PAUSE)
+        self.assertEqual(world.events, [("pause", 1), ("restart", 0)])
+        self.assertFalse(world.game_over)
+        self.assertTrue(world.paused)
+
+    def test_hit_monster_fades_during_the_blink(self) -> None:
+        """
+        Verifies that a hit monster fades a little on every tick of the blink, without a jump when it ends.
+        """
+        world = World(seed=5)
+        world.hero.life_points = 1000
+        monster = world.create_monster()
+        world.monsters.add(monster)
+        world.all_sprites.add(monster)
+        start = world.hero.collision_cooldown + 1
+        world.handle_monster_collision([monster], start)
+        self.assertTrue(world.hero_is_blinking)
+
+        alphas = [monster.alpha]
+        for tick in range(1, 151):
+            world.step(start + tick * 20, {pygame.K_LEFT: 0, pygame.K_RIGHT: 0})
+            alphas.append(monster.alpha)
+        self.assertFalse(world.hero_is_blinking)
+        self.assertTrue(all(0 < earlier - later <= 2 for earlier, later in zip(alphas, alphas[1:])), alphas)
+        self.assertEqual(alphas[100], 128)
+
+    def test_killed_sprites_are_reused_by_the_spawns(self) -> None:
+        """
+        Verifies that a collected coin goes back to the coin pool and is reset by the next spawn.
+        """
+        world = World(seed=2)
+        coin = world.create_coin()
+        coin.rect.center = world.hero.rect.center
+        world.coins.add(coin)
+        world.all_sprites.add(coin)
+        world.handle_collection(world.coins, "collected_coins", "coin")
+        self.assertEqual(len(world.coin_pool), 1)
+
+        again = world.create_coin()
+        self.assertIs(again, coin)
+        self.assertEqual(again.rect.y, SurfaceCache.get(os.path.join(SPRITES_PATH, "coin.png")).get_height())
+        self.assertEqual(world.pool_stats()["coins"]["reused"], 1)
+
+    def test_reset_gives_the_sprites_back_to_their_pools(self) -> None:
+        """
+        Verifies that resetting the world returns every spawned sprite to its pool.
+        """
+        world = World(seed=3)
+        monster = world.create_monster()
+        world.monsters.add(monster)
+        world.all_sprites.add(monster)
+        world.reset()
+        self.assertEqual(world.monster_pool.free, [monster])
+        self.assertEqual(list(world.all_sprites), [world.hero])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Packs the game sprites into the texture atlas loaded at startup.
+
+Run it from the project root before packaging the game:
+
+    python tools/build_atlas.py
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Obtain the root directory of the project
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+SRC_PATH = os.path.join(PROJECT_ROOT, 'src')
+
+# Add the project root and src directory to the sys.path
+sys.path.extend([str(PROJECT_ROOT), SRC_PATH])
+
+import pygame
+
+from src.constants import SPRITES_PATH, ATLAS_PATH, ATLAS_MANIFEST, ATLAS_EXCLUDE
+from src.helpers import TextureAtlas
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Hero vs Monsters texture atlas")
+    parser.add_argument("--images", default=SPRITES_PATH, help="folder containing the images to pack")
+    parser.add_argument("--output", default=ATLAS_PATH, help="folder where the atlas and its manifest are written")
+    args = parser.parse_args()
+
+    manifest_path: str = os.path.join(args.output, os.path.basename(ATLAS_MANIFEST))
+    atlas: TextureAtlas = TextureAtlas.build(
+        args.images, os.path.join(args.output, "atlas.png"), manifest_path, ATLAS_EXCLUDE
+    )
+    width, height = atlas.surface.get_size()
+    print(f"Packed {len(atlas.rects)} images into a {width}x{height} atlas: {manifest_path}")
+    pygame.quit()